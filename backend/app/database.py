@@ -1,31 +1,156 @@
-from motor.motor_asyncio import AsyncIOMotorClient
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import ASCENDING, DESCENDING, IndexModel, ReadPreference
 from bson import ObjectId
 from typing import Optional
 from app.models.liquor import Liquor
+from app.utils.pool_metrics import pool_metrics
+from app.utils.metrics import command_metrics
+import os
+
+MONGODB_URL = os.getenv("MONGODB_URL", "mongodb://3.36.132.159:27017")
+
+# 커넥션 풀 설정 (워커 프로세스마다 풀이 따로 생기므로 서버 연결 수는 최대 워커 수 x MONGODB_MAX_POOL_SIZE)
+MONGODB_MAX_POOL_SIZE = int(os.getenv("MONGODB_MAX_POOL_SIZE", "100"))
+MONGODB_MIN_POOL_SIZE = int(os.getenv("MONGODB_MIN_POOL_SIZE", "0"))
+# 비워두면 드라이버 기본값 사용
+MONGODB_MAX_IDLE_TIME_MS = os.getenv("MONGODB_MAX_IDLE_TIME_MS")
+MONGODB_WAIT_QUEUE_TIMEOUT_MS = os.getenv("MONGODB_WAIT_QUEUE_TIMEOUT_MS")
+MONGODB_SERVER_SELECTION_TIMEOUT_MS = int(os.getenv("MONGODB_SERVER_SELECTION_TIMEOUT_MS", "5000"))
+MONGODB_CONNECT_TIMEOUT_MS = int(os.getenv("MONGODB_CONNECT_TIMEOUT_MS", "5000"))
+MONGODB_SOCKET_TIMEOUT_MS = os.getenv("MONGODB_SOCKET_TIMEOUT_MS")
+# 쓰기 확인 수준 (예: 1, majority). 비워두면 서버 기본값
+MONGODB_WRITE_CONCERN = os.getenv("MONGODB_WRITE_CONCERN")
+MONGODB_WRITE_TIMEOUT_MS = os.getenv("MONGODB_WRITE_TIMEOUT_MS")
+# 목록/검색 조회에 사용하는 읽기 설정 (secondaryPreferred로 두면 복제 지연만큼 오래된 데이터가 보일 수 있음)
+MONGODB_LIST_READ_PREFERENCE = os.getenv("MONGODB_LIST_READ_PREFERENCE", "primary")
+# 연결 시 인덱스 생성 여부 (gunicorn은 마스터에서 한 번 만들고 워커에서는 끈다)
+MONGODB_ENSURE_INDEXES = os.getenv("MONGODB_ENSURE_INDEXES", "1") == "1"
+
+READ_PREFERENCES = {
+    "primary": ReadPreference.PRIMARY,
+    "primaryPreferred": ReadPreference.PRIMARY_PREFERRED,
+    "secondary": ReadPreference.SECONDARY,
+    "secondaryPreferred": ReadPreference.SECONDARY_PREFERRED,
+    "nearest": ReadPreference.NEAREST,
+}
 
 # 컬렉션 이름 상수
 LIQUOR_COLLECTION = "liquors"
 FILTER_COLLECTION = "filters"
+REVIEW_COLLECTION = "reviews"
+# 유지보수 작업(app.jobs)의 진행 상태
+JOB_COLLECTION = "jobs"
+
+# 컬렉션별 인덱스 정의 (connect_db에서 생성)
+INDEXES = {
+    LIQUOR_COLLECTION: [
+        # 목록 키셋 페이지네이션 (updated_at, _id)
+        IndexModel([("updated_at", ASCENDING), ("_id", ASCENDING)], name="updated_at_id"),
+        # 종류별 목록 (필터 + 키셋 정렬)
+        IndexModel(
+            [("type", ASCENDING), ("updated_at", ASCENDING), ("_id", ASCENDING)],
+            name="type_updated_at_id",
+        ),
+        # 종류/평점 필터와 패싯 집계
+        IndexModel([("type", ASCENDING), ("rating", ASCENDING)], name="type_rating"),
+        IndexModel([("rating", ASCENDING)], name="rating"),
+        # 판매 가격 범위 필터 (multikey)
+        IndexModel([("stores.price", ASCENDING)], name="stores_price"),
+    ],
+    REVIEW_COLLECTION: [
+        # 주류별 최신순 / 인기순 정렬
+        IndexModel(
+            [("liquor_id", ASCENDING), ("updated_at", DESCENDING), ("_id", DESCENDING)],
+            name="liquor_updated_at",
+        ),
+        IndexModel(
+            [("liquor_id", ASCENDING), ("likes", DESCENDING), ("updated_at", DESCENDING), ("_id", DESCENDING)],
+            name="liquor_likes",
+        ),
+        # 검색 색인 동기화가 최근 수정된 리뷰를 찾을 때 사용
+        IndexModel([("updated_at", ASCENDING)], name="updated_at"),
+        # 재검사 작업이 표시한 리뷰 (표시된 리뷰만 색인)
+        IndexModel(
+            [("flagged", ASCENDING)],
+            name="flagged",
+            partialFilterExpression={"flagged": {"$exists": True}},
+        ),
+    ],
+}
+
+def client_options() -> dict:
+    """환경 변수로 설정한 드라이버 옵션 (설정하지 않은 항목은 드라이버 기본값)"""
+    options = {
+        "maxPoolSize": MONGODB_MAX_POOL_SIZE,
+        "minPoolSize": MONGODB_MIN_POOL_SIZE,
+        "maxIdleTimeMS": MONGODB_MAX_IDLE_TIME_MS,
+        "waitQueueTimeoutMS": MONGODB_WAIT_QUEUE_TIMEOUT_MS,
+        "serverSelectionTimeoutMS": MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+        "connectTimeoutMS": MONGODB_CONNECT_TIMEOUT_MS,
+        "socketTimeoutMS": MONGODB_SOCKET_TIMEOUT_MS,
+        "wTimeoutMS": MONGODB_WRITE_TIMEOUT_MS,
+    }
+    options = {name: int(value) for name, value in options.items() if value is not None}
+    if MONGODB_WRITE_CONCERN:
+        w = MONGODB_WRITE_CONCERN
+        options["w"] = int(w) if w.isdigit() else w
+    return options
+
 
 class Database:
     client: AsyncIOMotorClient = None
     db_name: str = "liquordb"
+    db: Optional[AsyncIOMotorDatabase] = None
+    read_db: Optional[AsyncIOMotorDatabase] = None
+    ensure_indexes_on_connect: bool = MONGODB_ENSURE_INDEXES
 
     @classmethod
     async def connect_db(cls, mongodb_url: str):
-        cls.client = AsyncIOMotorClient(mongodb_url)
+        if MONGODB_LIST_READ_PREFERENCE not in READ_PREFERENCES:
+            raise ValueError(
+                f"Unknown MONGODB_LIST_READ_PREFERENCE: {MONGODB_LIST_READ_PREFERENCE} "
+                f"(available: {', '.join(READ_PREFERENCES)})"
+            )
+        cls.client = AsyncIOMotorClient(
+            mongodb_url,
+            event_listeners=[pool_metrics, command_metrics],
+            appname="liquor-api",
+            **client_options(),
+        )
         # 데이터베이스 연결 테스트
         await cls.client.admin.command('ping')
         print(f"Connected to MongoDB at {mongodb_url}")
+        if cls.ensure_indexes_on_connect:
+            await cls.ensure_indexes()
+
+    @classmethod
+    async def ensure_indexes(cls):
+        db = cls.get_db()
+        for collection, indexes in INDEXES.items():
+            await db[collection].create_indexes(indexes)
 
     @classmethod
     async def close_db(cls):
         if cls.client:
             cls.client.close()
+        cls.db = cls.read_db = None
+
+    @classmethod
+    def get_db(cls) -> AsyncIOMotorDatabase:
+        # 요청마다 클라이언트를 인덱싱하지 않도록 데이터베이스 객체를 재사용 (클라이언트가 바뀌면 다시 생성)
+        if cls.db is None or cls.db.client is not cls.client:
+            cls.db = cls.client[cls.db_name]
+            cls.read_db = cls.client.get_database(
+                cls.db_name,
+                read_preference=READ_PREFERENCES.get(MONGODB_LIST_READ_PREFERENCE, ReadPreference.PRIMARY),
+            )
+        return cls.db
 
     @classmethod
-    def get_db(cls):
-        return cls.client[cls.db_name]
+    def get_read_db(cls) -> AsyncIOMotorDatabase:
+        """목록/검색처럼 약간 오래된 데이터를 허용하는 조회용 데이터베이스"""
+        cls.get_db()
+        return cls.read_db
 
     @classmethod
     async def fetch_all_liquors(cls):
@@ -0,0 +1,214 @@
+"""
+주기적으로 실행하는 유지보수 작업
+
+사용법: python -m app.jobs <이름> [...]
+"""
+import asyncio
+import hashlib
+import logging
+import multiprocessing
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from pymongo import UpdateOne
+
+from .database import Database, LIQUOR_COLLECTION, REVIEW_COLLECTION, JOB_COLLECTION, MONGODB_URL
+from .migrations import BATCH_SIZE
+from .utils.aggregates import PRICE_RANGE_STAGE
+from .utils.bulk_io import flush_writes
+from .utils.text_filter import build_filter_matcher, check_text, get_filter_words
+
+logger = logging.getLogger(__name__)
+
+# 리뷰 재검사 작업 프로세스 수와 한 번에 넘기는 리뷰 수
+RESCAN_WORKERS = int(os.getenv("RESCAN_WORKERS", str(os.cpu_count() or 1)))
+RESCAN_CHUNK_SIZE = int(os.getenv("RESCAN_CHUNK_SIZE", "2000"))
+RESCAN_JOB_ID = "rescan_reviews"
+
+
+async def reconcile_aggregates(db):
+    """
+    주류 문서의 집계 필드(리뷰 수, 좋아요 합계, 가격 범위)를 원본 데이터로 다시 계산
+
+    핸들러의 증분 갱신이 실패했거나 마이그레이션으로 데이터가 옮겨진 경우의 차이를 바로잡는다.
+    """
+    liquors = db[LIQUOR_COLLECTION]
+
+    # 리뷰가 있는 주류의 리뷰 수와 좋아요 합계
+    cursor = db[REVIEW_COLLECTION].aggregate(
+        [{"$group": {"_id": "$liquor_id", "count": {"$sum": 1}, "likes": {"$sum": "$likes"}}}],
+        allowDiskUse=True,
+    )
+    with_reviews = set()
+    operations = []
+    async for group in cursor:
+        with_reviews.add(group["_id"])
+        operations.append(UpdateOne(
+            {"_id": group["_id"]},
+            {"$set": {"review_count": group["count"], "review_likes": group["likes"]}},
+        ))
+        if len(operations) >= BATCH_SIZE:
+            await flush_writes(liquors, operations)
+    await flush_writes(liquors, operations)
+
+    # 리뷰가 없는데 집계가 0이 아니거나 비어 있는 주류
+    cleared = 0
+    cursor = liquors.find(
+        {"$or": [{"review_count": {"$ne": 0}}, {"review_likes": {"$ne": 0}}]},
+        {"_id": 1},
+    )
+    async for doc in cursor:
+        if doc["_id"] in with_reviews:
+            continue
+        operations.append(UpdateOne({"_id": doc["_id"]}, {"$set": {"review_count": 0, "review_likes": 0}}))
+        cleared += 1
+        if len(operations) >= BATCH_SIZE:
+            await flush_writes(liquors, operations)
+    await flush_writes(liquors, operations)
+
+    # 가격 범위는 문서 안의 판매처 배열로 서버에서 계산
+    result = await liquors.update_many({}, [PRICE_RANGE_STAGE])
+
+    logger.info(
+        f"Reconciled review aggregates of {len(with_reviews)} liquors "
+        f"({cleared} reset to zero) and price ranges of {result.modified_count} liquors"
+    )
+    return len(with_reviews) + cleared
+
+
+# 작업 프로세스마다 한 번 만드는 매처 (청크마다 피클링하지 않는다)
+_scan_matcher = None
+
+
+def _init_scan_worker(profanity_words, ad_keywords):
+    global _scan_matcher
+    _scan_matcher = build_filter_matcher(profanity_words, ad_keywords)
+
+
+def scan_chunk(chunk: List[tuple]) -> List[Tuple[object, Optional[str], Optional[str]]]:
+    """(리뷰 ID, 내용, 기존 표시) 목록 중 표시가 바뀌어야 하는 (리뷰 ID, 검사한 내용, 카테고리) 목록 (작업 프로세스에서 실행)"""
+    changes = []
+    for review_id, content, flagged in chunk:
+        category = check_text(_scan_matcher, content or "")
+        if category != flagged:
+            changes.append((review_id, content, category))
+    return changes
+
+
+def words_fingerprint(profanity_words, ad_keywords) -> str:
+    """필터 단어 목록의 해시 (단어가 바뀌면 재검사를 처음부터 다시 한다)"""
+    digest = hashlib.sha1()
+    for words in (profanity_words, ad_keywords):
+        digest.update("\n".join(sorted(words)).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+async def rescan_reviews(db):
+    """
+    모든 리뷰를 현재 필터 단어로 다시 검사해 걸린 리뷰에 flagged(카테고리)를 표시
+
+    필터 단어가 추가/삭제된 뒤 실행한다. 리뷰를 _id 순서로 읽어 청크 단위로 프로세스 풀에서 검사하고,
+    표시가 바뀌는 리뷰만 bulk_write로 갱신한다. 청크가 끝날 때마다 마지막 _id를 jobs 컬렉션에 기록하므로
+    중단된 작업은 같은 필터 단어로 다시 실행하면 이어서 진행한다.
+    """
+    profanity_words, ad_keywords = await get_filter_words()
+    fingerprint = words_fingerprint(profanity_words, ad_keywords)
+    jobs = db[JOB_COLLECTION]
+    reviews = db[REVIEW_COLLECTION]
+
+    state = await jobs.find_one({"_id": RESCAN_JOB_ID})
+    if state and state.get("finished_at") is None and state.get("fingerprint") == fingerprint:
+        logger.info(f"Resuming review rescan after {state['last_id']} ({state['scanned']} reviews scanned)")
+    else:
+        state = {
+            "_id": RESCAN_JOB_ID,
+            "fingerprint": fingerprint,
+            "started_at": datetime.utcnow(),
+            "finished_at": None,
+            "last_id": None,
+            "scanned": 0,
+            "changed": 0,
+        }
+        await jobs.replace_one({"_id": RESCAN_JOB_ID}, state, upsert=True)
+
+    query = {"_id": {"$gt": state["last_id"]}} if state["last_id"] is not None else {}
+    cursor = reviews.find(query, {"content": 1, "flagged": 1}, batch_size=RESCAN_CHUNK_SIZE).sort("_id", 1)
+
+    loop = asyncio.get_running_loop()
+    # 제출 순서대로 (검사 결과, 청크의 마지막 _id, 리뷰 수)
+    pending = deque()
+
+    async def complete_oldest():
+        future, last_id, size = pending.popleft()
+        changes = await future
+        now = datetime.utcnow()
+        # 검사하는 동안 수정된 리뷰는 수정 시 다시 검증되므로 검사한 내용 그대로일 때만 갱신
+        operations = [
+            UpdateOne({"_id": review_id, "content": content}, {"$set": {"flagged": category, "flagged_at": now}})
+            if category else
+            UpdateOne({"_id": review_id, "content": content}, {"$unset": {"flagged": "", "flagged_at": ""}})
+            for review_id, content, category in changes
+        ]
+        await flush_writes(reviews, operations)
+        # 앞선 청크가 모두 끝난 뒤에만 기록하므로 last_id 이전의 리뷰는 모두 검사된 상태다
+        state["last_id"] = last_id
+        state["scanned"] += size
+        state["changed"] += len(changes)
+        await jobs.update_one(
+            {"_id": RESCAN_JOB_ID},
+            {"$set": {"last_id": last_id, "scanned": state["scanned"], "changed": state["changed"], "updated_at": now}},
+        )
+
+    with ProcessPoolExecutor(
+        max_workers=RESCAN_WORKERS,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_scan_worker,
+        initargs=(profanity_words, ad_keywords),
+    ) as pool:
+        chunk = []
+        async for doc in cursor:
+            chunk.append((doc["_id"], doc.get("content"), doc.get("flagged")))
+            if len(chunk) >= RESCAN_CHUNK_SIZE:
+                pending.append((loop.run_in_executor(pool, scan_chunk, chunk), chunk[-1][0], len(chunk)))
+                chunk = []
+                # 작업 프로세스마다 청크 두 개까지만 대기시켜 메모리 사용량을 제한
+                if len(pending) >= RESCAN_WORKERS * 2:
+                    await complete_oldest()
+        if chunk:
+            pending.append((loop.run_in_executor(pool, scan_chunk, chunk), chunk[-1][0], len(chunk)))
+        while pending:
+            await complete_oldest()
+
+    await jobs.update_one({"_id": RESCAN_JOB_ID}, {"$set": {"finished_at": datetime.utcnow()}})
+    logger.info(f"Rescanned {state['scanned']} reviews ({state['changed']} flags changed)")
+    return state["changed"]
+
+
+JOBS = {
+    "aggregates": reconcile_aggregates,
+    "rescan_reviews": rescan_reviews,
+}
+
+
+async def run(names):
+    await Database.connect_db(MONGODB_URL)
+    try:
+        db = Database.get_db()
+        for name in names:
+            await JOBS[name](db)
+    finally:
+        await Database.close_db()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    names = sys.argv[1:] or list(JOBS)
+    unknown = [name for name in names if name not in JOBS]
+    if unknown:
+        sys.exit(f"Unknown job: {', '.join(unknown)} (available: {', '.join(JOBS)})")
+    asyncio.run(run(names))
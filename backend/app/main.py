@@ -1,20 +1,71 @@
-from fastapi import FastAPI, Request
+from contextlib import asynccontextmanager
+import time
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
-from app.routers import liquor, review, store, filter
-from .database import Database
+from app.routers import liquor, review, store, filter, search, system
+from .database import Database, MONGODB_URL
+from .utils.image_variants import image_variants
+from .utils.like_buffer import like_buffer
+from .utils.search_index import search_index
+from .utils.text_filter import reload_filter_matcher
+from .utils.vector_index import profile_index
+from .utils.response_cache import ResponseCacheMiddleware, response_cache
+from .utils.metrics import MetricsMiddleware
+from .utils.health import AdmissionControlMiddleware, loop_monitor
+from .utils.fast_json import ORJSONResponse
 import os
 import logging
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 
+# 워커 시작 시 미리 준비할 항목 (쉼표 구분, 빼면 첫 요청 때 준비)
+WARMUP = [name.strip() for name in os.getenv("WARMUP", "filters,search,profiles").split(",") if name.strip()]
+
+WARMUP_TASKS = {
+    "filters": reload_filter_matcher,
+    "search": search_index.ensure_loaded,
+    "profiles": profile_index.ensure_loaded,
+}
+
+
+async def warm_up():
+    """필터 매처와 메모리 색인을 첫 요청 전에 읽어 둔다 (실패하면 첫 요청 때 다시 시도)"""
+    for name in WARMUP:
+        start = time.perf_counter()
+        try:
+            await WARMUP_TASKS[name]()
+        except Exception as e:
+            logging.error(f"Warm-up of {name} failed: {e}")
+            continue
+        logging.info(f"Warmed up {name} in {time.perf_counter() - start:.2f}s")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 워커 프로세스마다 자기 연결 풀과 캐시를 가진다 (워커 간 공유 상태 없음)
+    await Database.connect_db(MONGODB_URL)
+    await warm_up()
+    loop_monitor.start()
+    yield
+    # 처리 중인 요청이 끝난 뒤 호출되므로 모아 둔 좋아요를 기록하고 자원을 정리한다
+    await loop_monitor.stop()
+    await search_index.stop()
+    await profile_index.stop()
+    await like_buffer.stop()
+    image_variants.shutdown()
+    await Database.close_db()
+
+
 app = FastAPI(
     title="주류 리뷰 API",
     description="주류 정보 관리와 리뷰 시스템을 위한 API",
     version="1.0.0",
     openapi_url="/api/openapi.json",  # OpenAPI 스키마 경로 추가
     docs_url="/api/docs",  # Swagger UI 경로
-    redoc_url="/api/redoc"  # ReDoc 경로
+    redoc_url="/api/redoc",  # ReDoc 경로
+    default_response_class=ORJSONResponse,  # orjson 직렬화
+    lifespan=lifespan,
 )
 
 # 로깅 설정
@@ -29,6 +80,15 @@ async def validation_exception_handler(request, exc):
         content={"detail": exc.errors()},
     )
 
+# 요청 지표 (라우팅 결과를 읽어야 하므로 가장 안쪽에 둔다)
+app.add_middleware(MetricsMiddleware)
+
+# 과부하 시 요청 거절 (캐시 적중 응답은 계속 처리하도록 응답 캐시 안쪽에 둔다)
+app.add_middleware(AdmissionControlMiddleware)
+
+# 응답 캐시 (CORS 헤더는 캐시된 응답에도 붙도록 CORS 미들웨어 안쪽에 둔다)
+app.add_middleware(ResponseCacheMiddleware, cache=response_cache)
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -36,6 +96,7 @@ app.add_middleware(
     allow_credentials=False,  # credentials가 필요없는 경우 False로 설정
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Prev-Cursor"],  # 페이지네이션 커서
 )
 
 # 라우터 등록
@@ -43,15 +104,8 @@ app.include_router(liquor.router, prefix="/api", tags=["liquors"])
 app.include_router(review.router, prefix="/api", tags=["reviews"])
 app.include_router(store.router, prefix="/api", tags=["stores"])
 app.include_router(filter.router, prefix="/api", tags=["filters"])
-
-# 데이터베이스 연결 이벤트
-@app.on_event("startup")
-async def startup_db_client():
-    await Database.connect_db(os.getenv("MONGODB_URL", "mongodb://3.36.132.159:27017"))
-
-@app.on_event("shutdown")
-async def shutdown_db_client():
-    await Database.close_db()
+app.include_router(search.router, prefix="/api", tags=["search"])
+app.include_router(system.router, prefix="/api", tags=["system"])
 
 # OpenAPI 스키마 커스터마이징
 def custom_openapi():
@@ -81,6 +135,14 @@ def custom_openapi():
         {
             "name": "filters",
             "description": "필터 단어 관리 API"
+        },
+        {
+            "name": "search",
+            "description": "주류 검색 API"
+        },
+        {
+            "name": "system",
+            "description": "운영 상태 조회 API"
         }
     ]
     
@@ -0,0 +1,144 @@
+"""
+데이터 마이그레이션 도구
+
+사용법: python -m app.migrations <이름> [...]
+"""
+import asyncio
+import json
+import logging
+import sys
+
+from bson import ObjectId
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+from starlette.concurrency import run_in_threadpool
+
+from .database import Database, LIQUOR_COLLECTION, REVIEW_COLLECTION, MONGODB_URL
+from .models.liquor import Profile
+from .utils.blob_store import blob_store
+from .utils.bulk_io import flush_writes
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 500
+
+
+async def migrate_embedded_images(db):
+    """문서에 내장된 이미지 바이너리를 블롭 저장소로 옮기고 해시만 남긴다"""
+    collection = db[LIQUOR_COLLECTION]
+    cursor = collection.find(
+        {"image": {"$type": "binData"}},
+        {"image": 1},
+    ).batch_size(50)
+
+    migrated = 0
+    operations = []
+    async for doc in cursor:
+        digest, size = await run_in_threadpool(blob_store.put_bytes, bytes(doc["image"]))
+        operations.append(UpdateOne(
+            {"_id": doc["_id"]},
+            {
+                "$set": {"image_id": digest, "image_size": size},
+                "$unset": {"image": ""},
+            },
+        ))
+        migrated += 1
+        if len(operations) >= BATCH_SIZE:
+            await flush_writes(collection, operations)
+    await flush_writes(collection, operations)
+
+    # 이미지가 없던 문서의 빈 필드 정리
+    await collection.update_many(
+        {"image": None, "image_id": {"$exists": False}},
+        {"$set": {"image_id": None}, "$unset": {"image": ""}},
+    )
+    logger.info(f"Migrated {migrated} embedded images")
+    return migrated
+
+
+async def migrate_embedded_reviews(db):
+    """주류 문서에 내장된 reviews 배열을 리뷰 컬렉션으로 옮긴다 (재실행해도 안전)"""
+    liquors = db[LIQUOR_COLLECTION]
+    reviews = db[REVIEW_COLLECTION]
+    cursor = liquors.find({"reviews": {"$exists": True}}, {"reviews": 1}).batch_size(50)
+
+    migrated = 0
+    async for liquor in cursor:
+        docs = []
+        for review in liquor.get("reviews") or []:
+            review_id = review.get("id")
+            docs.append({
+                # 기존 리뷰 ID를 그대로 유지해서 클라이언트의 ID가 바뀌지 않게 한다
+                "_id": ObjectId(review_id) if ObjectId.is_valid(review_id) else ObjectId(),
+                "liquor_id": liquor["_id"],
+                "content": review["content"],
+                "created_at": review.get("created_at"),
+                "updated_at": review.get("updated_at"),
+                "likes": review.get("likes", 0),
+            })
+
+        if docs:
+            try:
+                await reviews.insert_many(docs, ordered=False)
+            except BulkWriteError as e:
+                # 이전 실행에서 이미 옮겨진 리뷰(중복 키)는 무시
+                if any(error["code"] != 11000 for error in e.details["writeErrors"]):
+                    raise
+            migrated += len(docs)
+
+        await liquors.update_one({"_id": liquor["_id"]}, {"$unset": {"reviews": ""}})
+
+    logger.info(f"Migrated {migrated} embedded reviews")
+    return migrated
+
+
+async def migrate_profile_strings(db):
+    """JSON 문자열로 저장된 프로필을 숫자 필드를 가진 하위 문서로 변환"""
+    collection = db[LIQUOR_COLLECTION]
+    cursor = collection.find({"profile": {"$type": "string"}}, {"profile": 1})
+
+    migrated = 0
+    failed = 0
+    operations = []
+    async for doc in cursor:
+        try:
+            profile = Profile(**json.loads(doc["profile"])).dict()
+        except (ValueError, TypeError) as e:
+            # pydantic ValidationError도 ValueError의 하위 클래스
+            logger.warning(f"Skipping liquor {doc['_id']} with invalid profile: {e}")
+            failed += 1
+            continue
+        operations.append(UpdateOne({"_id": doc["_id"]}, {"$set": {"profile": profile}}))
+        migrated += 1
+        if len(operations) >= BATCH_SIZE:
+            await flush_writes(collection, operations)
+    await flush_writes(collection, operations)
+
+    logger.info(f"Migrated {migrated} profiles ({failed} invalid)")
+    return migrated
+
+
+MIGRATIONS = {
+    "images": migrate_embedded_images,
+    "reviews": migrate_embedded_reviews,
+    "profiles": migrate_profile_strings,
+}
+
+
+async def run(names):
+    await Database.connect_db(MONGODB_URL)
+    try:
+        db = Database.get_db()
+        for name in names:
+            await MIGRATIONS[name](db)
+    finally:
+        await Database.close_db()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    names = sys.argv[1:] or list(MIGRATIONS)
+    unknown = [name for name in names if name not in MIGRATIONS]
+    if unknown:
+        sys.exit(f"Unknown migration: {', '.join(unknown)} (available: {', '.join(MIGRATIONS)})")
+    asyncio.run(run(names))
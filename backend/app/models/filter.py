@@ -36,4 +36,29 @@ class FilterWordCreate(BaseModel):
         ..., 
         pattern='^(profanity|ad)$',
         description="필터 타입 (profanity: 비속어, ad: 광고성 키워드)"
-    ) 
\ No newline at end of file
+    ) 
+
+class TextValidationRequest(BaseModel):
+    """
+    텍스트 일괄 검사 요청 모델
+    """
+    texts: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=1000,
+        description="검사할 텍스트 목록 (최대 1000개)"
+    )
+
+class TextValidationResult(BaseModel):
+    """
+    텍스트 검사 결과 모델
+    """
+    valid: bool = Field(..., description="통과 여부")
+    category: Optional[str] = Field(None, description="걸린 필터 타입 (profanity, ad)")
+    message: str = Field("", description="거부 사유")
+
+class TextValidationResponse(BaseModel):
+    """
+    텍스트 일괄 검사 응답 모델 (요청 순서와 같은 순서)
+    """
+    results: List[TextValidationResult]
@@ -15,13 +15,15 @@ class Profile(BaseModel):
     balance: float = Field(..., ge=0, le=5, description="밸런스 점수 (0-5)")
     intensity: float = Field(..., ge=0, le=5, description="강도 점수 (0-5)")
 
+# 프로필 차원 순서 (유사도 벡터와 CSV 열에서 사용)
+PROFILE_FIELDS = ("smoothness", "aroma", "complexity", "finish", "balance", "intensity")
+
 class LiquorBase(BaseModel):
     """주류 기본 모델"""
     name: str = Form(..., description="주류 이름")
     type: str = Form(..., description="주류 종류")
     description: str = Form(..., description="설명")
     rating: float = Form(..., ge=0, le=5, description="평점")
-    image: bytes = Form(..., description="이미지 바이너리")
     profile: Profile = Form(..., description="주류 프로필")
 
 class LiquorCreate(LiquorBase):
@@ -33,14 +35,30 @@ class Liquor(LiquorBase):
     id: str = Field(..., description="주류 ID")
     reviews: List[Review] = Field(default=[], description="리뷰 목록")
     stores: List[Store] = Field(default=[], description="판매처 목록")
+    image_url: Optional[str] = Field(None, description="이미지 URL")
+    thumbnail_url: Optional[str] = Field(None, description="썸네일 이미지 URL")
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
 class LiquorSummary(BaseModel):
-    """주류 요약 모델"""
+    """주류 요약 모델 (fields 파라미터로 선택되지 않은 필드는 응답에서 빠짐)"""
     id: str
-    name: str
-    type: str
-    rating: float
-    image: bytes
-    description: str = Field(..., description="주류 설명")
\ No newline at end of file
+    name: Optional[str] = None
+    type: Optional[str] = None
+    rating: Optional[float] = None
+    image_url: Optional[str] = Field(None, description="이미지 URL")
+    thumbnail_url: Optional[str] = Field(None, description="썸네일 이미지 URL")
+    description: Optional[str] = Field(None, description="주류 설명")
+    profile: Optional[Profile] = Field(None, description="주류 프로필")
+    review_count: Optional[int] = Field(None, description="리뷰 수")
+    avg_likes: Optional[float] = Field(None, description="리뷰당 평균 좋아요 수")
+    min_price: Optional[int] = Field(None, description="최저 판매 가격 (판매처가 없으면 null)")
+    max_price: Optional[int] = Field(None, description="최고 판매 가격 (판매처가 없으면 null)")
+
+class LiquorLookup(LiquorSummary):
+    """ids로 조회한 주류 모델 (존재하지 않는 주류는 id와 not_found만 포함)"""
+    not_found: Optional[bool] = Field(None, description="존재하지 않는 주류 표시")
+
+class SimilarLiquor(LiquorSummary):
+    """유사 주류 모델"""
+    distance: float = Field(..., description="프로필 공간에서의 거리 (작을수록 유사)")
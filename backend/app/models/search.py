@@ -0,0 +1,13 @@
+from pydantic import BaseModel, Field
+from typing import Dict, List
+from .liquor import LiquorSummary
+
+class SearchHit(LiquorSummary):
+    """검색 결과 항목"""
+    score: float = Field(..., description="검색 점수 (클수록 관련성이 높음)")
+    highlights: Dict[str, str] = Field(default={}, description="필드별 하이라이트 (<em>으로 일치 구간 표시, name/description/review)")
+
+class SearchResult(BaseModel):
+    """검색 결과 페이지"""
+    total: int = Field(..., description="전체 결과 수")
+    hits: List[SearchHit] = Field(default=[], description="결과 목록")
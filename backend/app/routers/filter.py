@@ -1,9 +1,14 @@
-from fastapi import APIRouter, HTTPException, Path
-from ..models.filter import FilterWord, FilterWordCreate
+from fastapi import APIRouter, HTTPException, Path, Header
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from ..models.filter import FilterWord, FilterWordCreate, TextValidationRequest, TextValidationResponse
 from ..database import Database, FILTER_COLLECTION, serialize_id
+from ..utils.text_filter import reload_filter_matcher, get_filter_matcher, check_text, REJECT_MESSAGES
+from ..utils.fast_json import shape
+from ..utils.bulk_io import ndjson_stream, wants_ndjson, NDJSON_MEDIA_TYPE, STREAM_BATCH_SIZE
 from datetime import datetime
 from bson import ObjectId
-from typing import List
+from typing import List, Optional
 
 router = APIRouter()
 
@@ -11,11 +16,20 @@ router = APIRouter()
     "/filters",
     response_model=List[FilterWord],
     summary="필터 단어 목록 조회",
-    description="등록된 모든 필터 단어(비속어, 광고성 키워드)를 조회합니다",
+    description="등록된 모든 필터 단어(비속어, 광고성 키워드)를 조회합니다. "
+                "Accept: application/x-ndjson으로 요청하면 한 줄에 단어 하나씩 스트리밍합니다.",
     tags=["filters"]
 )
-async def get_filters():
+async def get_filters(
+    accept: Optional[str] = Header(None, description="application/x-ndjson이면 스트리밍")
+):
     db = Database.get_db()
+    if wants_ndjson(accept):
+        cursor = db[FILTER_COLLECTION].find(batch_size=STREAM_BATCH_SIZE).sort("_id", 1)
+        return StreamingResponse(
+            ndjson_stream(cursor, lambda doc: shape(doc, FilterWord)), media_type=NDJSON_MEDIA_TYPE
+        )
+
     cursor = db[FILTER_COLLECTION].find()
     return [serialize_id(doc) async for doc in cursor]
 
@@ -42,8 +56,28 @@ async def create_filter(filter_word: FilterWordCreate):
     
     result = await db[FILTER_COLLECTION].insert_one(filter_dict)
     created_filter = await db[FILTER_COLLECTION].find_one({"_id": result.inserted_id})
+    await reload_filter_matcher()
     return serialize_id(created_filter)
 
+@router.post(
+    "/filters/validate",
+    response_model=TextValidationResponse,
+    summary="텍스트 일괄 검사",
+    description="여러 텍스트를 현재 필터 단어와 URL/전화번호 규칙으로 한 번에 검사합니다. "
+                "결과는 요청한 순서대로 반환됩니다.",
+    tags=["filters"]
+)
+async def validate_texts(request: TextValidationRequest):
+    # 필터 단어는 요청당 한 번만 읽고, 검사는 이벤트 루프를 막지 않도록 스레드에서 실행
+    matcher = await get_filter_matcher()
+    categories = await run_in_threadpool(lambda: [check_text(matcher, text) for text in request.texts])
+    return {
+        "results": [
+            {"valid": category is None, "category": category, "message": REJECT_MESSAGES.get(category, "")}
+            for category in categories
+        ]
+    }
+
 @router.delete(
     "/filters/{filter_id}",
     summary="필터 단어 삭제",
@@ -57,4 +91,5 @@ async def delete_filter(
     result = await db[FILTER_COLLECTION].delete_one({"_id": ObjectId(filter_id)})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Filter word not found")
+    await reload_filter_matcher()
     return {"message": "Filter word deleted successfully"} 
\ No newline at end of file
@@ -1,54 +1,438 @@
-from fastapi import APIRouter, Path, Query, Body, HTTPException, File, UploadFile
+from fastapi import APIRouter, Path, Query, HTTPException, File, UploadFile, Request, BackgroundTasks, Response, Depends, Header
+from starlette.concurrency import run_in_threadpool
 from typing import List, Optional
-from ..models.liquor import Liquor, LiquorCreate, LiquorSummary
-from ..database import Database, LIQUOR_COLLECTION, serialize_id
+from ..models.liquor import Liquor, LiquorCreate, LiquorLookup, LiquorSummary, Profile, SimilarLiquor
+from ..database import Database, LIQUOR_COLLECTION, REVIEW_COLLECTION, serialize_id
 from datetime import datetime, timezone
 from dateutil import parser  # 날짜 파싱을 위한 라이브러리 추가
 from bson import ObjectId
 from fastapi import Form
-import base64
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from pymongo.errors import BulkWriteError
+from ..utils.blob_store import blob_store, blob_response
+from ..utils.image_variants import image_variants, pick_variant_size, variant_key, VARIANT_FORMATS
+from ..utils.pagination import fetch_page, and_query, stream_cursor
+from ..utils.response_cache import response_cache
+from ..utils.bulk_io import iter_csv_rows, iter_ndjson_rows, ndjson_stream, wants_ndjson, NDJSON_MEDIA_TYPE, STREAM_BATCH_SIZE
+from ..utils.vector_index import profile_index
+from ..utils.search_index import search_index
+from ..utils.aggregates import avg_likes
+from ..utils.fast_json import fast_response, shape
+from .review import REVIEW_SORTS, serialize_review
 import json
 
 
 router = APIRouter()
 
+
+def image_url(doc: dict) -> Optional[str]:
+    """이미지 스트리밍 URL (해시 일부를 버전으로 붙여 변경 시 캐시가 무효화되게 함)"""
+    if not doc.get("image_id"):
+        return None
+    return f"/api/liquors/{doc['id']}/image?v={doc['image_id'][:16]}"
+
+
+# 목록 정렬 기준 (Database.connect_db에서 생성하는 updated_at_id 인덱스와 일치)
+LIST_SORT = [("updated_at", 1), ("_id", 1)]
+
+# 상세 조회에 포함하는 최신 리뷰 수 (전체 목록은 리뷰 목록 API 사용)
+DETAIL_REVIEW_LIMIT = 20
+
+# 일괄 등록 시 한 번에 insert_many 하는 문서 수
+IMPORT_BATCH_SIZE = 1000
+
+# 내보내기 시 커서가 한 번에 가져오는 문서 수
+EXPORT_BATCH_SIZE = 500
+
+# ids 파라미터로 한 번에 조회할 수 있는 최대 주류 수
+MAX_BATCH_IDS = 500
+
+# 목록 타일에서 사용하는 썸네일 크기
+THUMBNAIL_SIZE = 256
+
+# fields 파라미터로 선택 가능한 응답 필드와 이를 위해 읽어야 하는 MongoDB 필드
+SUMMARY_FIELD_PROJECTIONS = {
+    "name": ("name",),
+    "type": ("type",),
+    "rating": ("rating",),
+    "description": ("description",),
+    "profile": ("profile",),
+    "image_url": ("image_id",),
+    "thumbnail_url": ("image_id",),
+    "review_count": ("review_count",),
+    "avg_likes": ("review_count", "review_likes"),
+    "min_price": ("min_price",),
+    "max_price": ("max_price",),
+}
+
+# fields를 지정하지 않았을 때 목록에 포함되는 필드
+DEFAULT_SUMMARY_FIELDS = (
+    "name", "type", "rating", "description", "image_url", "thumbnail_url",
+    "review_count", "avg_likes", "min_price", "max_price",
+)
+
+
+def summary_projection(fields: Optional[str]) -> dict:
+    """쉼표로 구분된 응답 필드 목록을 MongoDB projection으로 변환"""
+    if fields:
+        selected = [field.strip() for field in fields.split(",") if field.strip()]
+        unknown = [field for field in selected if field not in SUMMARY_FIELD_PROJECTIONS]
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown fields: {', '.join(unknown)} "
+                       f"(available: {', '.join(SUMMARY_FIELD_PROJECTIONS)})",
+            )
+    else:
+        selected = DEFAULT_SUMMARY_FIELDS
+
+    projection = {"_id": 1}
+    for field in selected:
+        for db_field in SUMMARY_FIELD_PROJECTIONS[field]:
+            projection[db_field] = 1
+    return projection
+
+
+async def fetch_by_ids(collection, ids: str, projection: dict) -> List[dict]:
+    """
+    쉼표로 구분된 ID 목록을 한 번의 $in 조회로 가져와 요청 순서대로 반환
+
+    존재하지 않거나 형식이 잘못된 ID는 {"id": ..., "not_found": True}로 표시한다.
+    """
+    requested = [liquor_id.strip() for liquor_id in ids.split(",") if liquor_id.strip()]
+    if len(requested) > MAX_BATCH_IDS:
+        raise HTTPException(status_code=400, detail=f"Too many ids (max {MAX_BATCH_IDS})")
+
+    object_ids = {ObjectId(liquor_id) for liquor_id in requested if ObjectId.is_valid(liquor_id)}
+    found = {}
+    if object_ids:
+        async for doc in collection.find({"_id": {"$in": list(object_ids)}}, projection):
+            found[str(doc["_id"])] = doc
+
+    return [
+        to_response(dict(found[liquor_id])) if liquor_id in found else {"id": liquor_id, "not_found": True}
+        for liquor_id in requested
+    ]
+
+
+# 평점 히스토그램 구간 ([0,1), [1,2), ... [4,5])
+RATING_BUCKETS = [0, 1, 2, 3, 4, 5.000001]
+
+
+def _range(field: str, low, high) -> dict:
+    condition = {}
+    if low is not None:
+        condition["$gte"] = low
+    if high is not None:
+        condition["$lte"] = high
+    return {field: condition} if condition else {}
+
+
+def liquor_filters(
+    type: Optional[str] = Query(None, description="주류 종류"),
+    min_rating: Optional[float] = Query(None, ge=0, le=5, description="최소 평점"),
+    max_rating: Optional[float] = Query(None, ge=0, le=5, description="최대 평점"),
+    min_price: Optional[int] = Query(None, ge=0, description="판매처 최저 가격 (이 가격 이상에 파는 판매처가 있는 주류)"),
+    max_price: Optional[int] = Query(None, ge=0, description="판매처 최고 가격 (이 가격 이하에 파는 판매처가 있는 주류)"),
+    min_smoothness: Optional[float] = Query(None, ge=0, le=5, description="최소 부드러움"),
+    max_smoothness: Optional[float] = Query(None, ge=0, le=5, description="최대 부드러움"),
+    min_aroma: Optional[float] = Query(None, ge=0, le=5, description="최소 향"),
+    max_aroma: Optional[float] = Query(None, ge=0, le=5, description="최대 향"),
+    min_complexity: Optional[float] = Query(None, ge=0, le=5, description="최소 복합성"),
+    max_complexity: Optional[float] = Query(None, ge=0, le=5, description="최대 복합성"),
+    min_finish: Optional[float] = Query(None, ge=0, le=5, description="최소 피니시"),
+    max_finish: Optional[float] = Query(None, ge=0, le=5, description="최대 피니시"),
+    min_balance: Optional[float] = Query(None, ge=0, le=5, description="최소 밸런스"),
+    max_balance: Optional[float] = Query(None, ge=0, le=5, description="최대 밸런스"),
+    min_intensity: Optional[float] = Query(None, ge=0, le=5, description="최소 강도"),
+    max_intensity: Optional[float] = Query(None, ge=0, le=5, description="최대 강도"),
+) -> dict:
+    """
+    목록 필터 파라미터를 MongoDB 조건으로 변환
+
+    패싯 계산 시 자기 자신의 필터를 제외할 수 있도록 조건을 항목별로 나눠서 반환한다.
+    """
+    profile = {}
+    for field, low, high in (
+        ("smoothness", min_smoothness, max_smoothness),
+        ("aroma", min_aroma, max_aroma),
+        ("complexity", min_complexity, max_complexity),
+        ("finish", min_finish, max_finish),
+        ("balance", min_balance, max_balance),
+        ("intensity", min_intensity, max_intensity),
+    ):
+        profile.update(_range(f"profile.{field}", low, high))
+
+    price = _range("price", min_price, max_price)
+    return {
+        "type": {"type": type} if type else {},
+        "rating": _range("rating", min_rating, max_rating),
+        "profile": profile,
+        # 한 판매처가 가격 조건을 모두 만족해야 하므로 $elemMatch 사용
+        "price": {"stores": {"$elemMatch": price}} if price else {},
+    }
+
+
+def filter_query(filters: dict, exclude: tuple = ()) -> dict:
+    return and_query(*(condition for name, condition in filters.items() if name not in exclude))
+
+
+def to_response(doc: dict) -> dict:
+    """MongoDB 문서를 응답 형태로 변환 (projection으로 빠진 필드는 건드리지 않음)"""
+    doc = serialize_id(doc)
+    # 마이그레이션(python -m app.migrations profiles) 전의 JSON 문자열 프로필 호환
+    if isinstance(doc.get("profile"), str):
+        doc["profile"] = json.loads(doc["profile"])
+    if "image_id" in doc:
+        doc["image_url"] = image_url(doc)
+        doc["thumbnail_url"] = f"{doc['image_url']}&size={THUMBNAIL_SIZE}" if doc["image_url"] else None
+    if "review_likes" in doc:
+        doc["avg_likes"] = avg_likes(doc)
+    return doc
+
 @router.get(
     "/liquors",
-    response_model=List[LiquorSummary],
+    response_model=List[LiquorLookup],
+    response_model_exclude_unset=True,
     summary="주류 목록 조회",
-    description="등록된 모든 주류 목록을 조회합니다",
+    description="등록된 모든 주류 목록을 수정 시각 순으로 조회합니다. "
+                "종류, 평점, 프로필 차원별 범위, 판매 가격 범위로 필터링할 수 있습니다. "
+                "다음/이전 페이지 커서는 X-Next-Cursor, X-Prev-Cursor 응답 헤더로 전달됩니다. "
+                "fields로 응답에 포함할 필드를 선택할 수 있습니다. "
+                "ids로 여러 주류를 한 번에 조회할 수 있습니다 (즐겨찾기, 비교 화면 등). "
+                "Accept: application/x-ndjson으로 요청하면 limit 없이 커서 다음의 전체 결과를 한 줄에 하나씩 스트리밍합니다.",
     tags=["liquors"],
 )
 async def get_liquors(
-    after: Optional[str] = None, limit: int = Query(20, ge=1, le=100)
+    filters: dict = Depends(liquor_filters),
+    after: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 또는 X-Prev-Cursor 값"),
+    direction: str = Query("next", pattern="^(next|prev)$", description="페이지 방향 (next: 다음, prev: 이전)"),
+    fields: Optional[str] = Query(
+        None,
+        description="응답에 포함할 필드 (쉼표 구분, 예: name,type,rating). "
+                    "name, type, rating, description, profile, image_url, thumbnail_url, "
+                    "review_count, avg_likes, min_price, max_price 중 선택",
+    ),
+    ids: Optional[str] = Query(
+        None,
+        description=f"조회할 주류 ID 목록 (쉼표 구분, 최대 {MAX_BATCH_IDS}개). "
+                    "지정하면 필터와 페이지네이션 없이 요청 순서대로 반환하고, 없는 ID는 not_found로 표시",
+    ),
+    accept: Optional[str] = Header(None, description="application/x-ndjson이면 스트리밍"),
 ):
-    db = Database.get_db()
-    query = {}
+    db = Database.get_read_db()
+    if ids is not None:
+        liquors = await fetch_by_ids(db[LIQUOR_COLLECTION], ids, summary_projection(fields))
+        return fast_response(liquors, LiquorLookup, many=True, exclude_unset=True)
+
+    query = filter_query(filters)
 
     if after:
         try:
-            query["updated_at"] = {"$gt": parser.parse(after)}
+            query = and_query(query, {"updated_at": {"$gt": parser.parse(after)}})
         except ValueError as e:
             raise HTTPException(
                 status_code=400, detail=f"Invalid date format: {str(e)}"
             )
 
-    cursor = db[LIQUOR_COLLECTION].find(query).limit(limit)
-    return [
-        {
-            **serialize_id(doc),
-            "image": base64.b64encode(doc["image"]).decode("utf-8") if doc["image"] else None,
-            "profile": json.loads(doc["profile"]),
-        }
-        async for doc in cursor
+    if wants_ndjson(accept):
+        stream = stream_cursor(
+            db[LIQUOR_COLLECTION], query, LIST_SORT, STREAM_BATCH_SIZE,
+            cursor=cursor, projection=summary_projection(fields),
+        )
+        return StreamingResponse(
+            ndjson_stream(stream, lambda doc: shape(to_response(doc), LiquorSummary, exclude_unset=True)),
+            media_type=NDJSON_MEDIA_TYPE,
+        )
+
+    # 요약에 필요한 필드만 가져와 리뷰/판매처 배열은 전송하지 않는다
+    docs, next_cursor, prev_cursor = await fetch_page(
+        db[LIQUOR_COLLECTION],
+        query,
+        LIST_SORT,
+        limit,
+        cursor=cursor,
+        backward=direction == "prev",
+        projection=summary_projection(fields),
+    )
+
+    headers = {}
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor
+    if prev_cursor:
+        headers["X-Prev-Cursor"] = prev_cursor
+    return fast_response(
+        [to_response(doc) for doc in docs], LiquorSummary, many=True, exclude_unset=True, headers=headers
+    )
+
+
+@router.get(
+    "/liquors/facets",
+    summary="주류 패싯 조회",
+    description="목록 필터와 같은 조건으로 종류별 개수와 평점 분포를 한 번의 집계로 조회합니다. "
+                "종류별 개수는 종류 필터를, 평점 분포는 평점 필터를 제외하고 계산합니다.",
+    tags=["liquors"],
+)
+async def get_liquor_facets(filters: dict = Depends(liquor_filters)):
+    db = Database.get_read_db()
+    pipeline = [
+        {"$match": filter_query(filters, exclude=("type", "rating"))},
+        {"$facet": {
+            "types": [
+                {"$match": filters["rating"]},
+                {"$group": {"_id": "$type", "count": {"$sum": 1}}},
+                {"$sort": {"count": -1, "_id": 1}},
+            ],
+            "ratings": [
+                {"$match": filters["type"]},
+                {"$bucket": {
+                    "groupBy": "$rating",
+                    "boundaries": RATING_BUCKETS,
+                    "default": "other",
+                    "output": {"count": {"$sum": 1}},
+                }},
+            ],
+            "total": [
+                {"$match": filter_query(filters, exclude=("profile", "price"))},
+                {"$count": "count"},
+            ],
+        }},
     ]
+    result = (await db[LIQUOR_COLLECTION].aggregate(pipeline).to_list(1))[0]
+
+    return {
+        "total": result["total"][0]["count"] if result["total"] else 0,
+        "types": [{"type": item["_id"], "count": item["count"]} for item in result["types"]],
+        "ratings": [
+            {"min": item["_id"], "max": min(item["_id"] + 1, 5), "count": item["count"]}
+            for item in result["ratings"]
+            if item["_id"] != "other"
+        ],
+    }
+
+
+def new_liquor_document(liquor: LiquorCreate) -> dict:
+    """검증된 입력으로 저장할 주류 문서 생성"""
+    now = datetime.now(timezone.utc)
+    return {
+        "name": liquor.name,
+        "type": liquor.type,
+        "description": liquor.description,
+        "rating": liquor.rating,
+        "profile": liquor.profile.dict(),
+        "created_at": now,
+        "updated_at": now,
+        "stores": [],
+        "image_id": None,
+        "review_count": 0,
+        "review_likes": 0,
+    }
+
+
+def _validation_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in item['loc'])}: {item['msg']}" for item in error.errors()
+    )
+
+
+async def _insert_batch(collection, batch, errors) -> int:
+    """(행 번호, 문서) 목록을 순서 없이 삽입하고 삽입된 수 반환"""
+    failed = set()
+    try:
+        await collection.insert_many([doc for _, doc in batch], ordered=False)
+    except BulkWriteError as e:
+        for error in e.details["writeErrors"]:
+            failed.add(error["index"])
+            errors.append({"row": batch[error["index"]][0], "error": error["errmsg"]})
+
+    for index, (_, doc) in enumerate(batch):
+        if index not in failed:
+            profile_index.on_write(doc["_id"], doc["profile"])
+            search_index.on_liquor_write(doc["_id"], doc.get("name"), doc.get("description"))
+    return len(batch) - len(failed)
+
+
+@router.post(
+    "/liquors/import",
+    summary="주류 일괄 등록",
+    description="NDJSON(application/x-ndjson) 또는 CSV(text/csv) 본문을 스트리밍으로 읽어 주류를 일괄 등록합니다. "
+                "CSV는 첫 줄이 헤더이며 profile은 JSON 열 또는 smoothness, aroma 등 차원별 열로 받습니다. "
+                "잘못된 행은 건너뛰고 행 번호와 함께 오류를 반환합니다.",
+    tags=["liquors"],
+)
+async def import_liquors(request: Request):
+    content_type = request.headers.get("content-type", "")
+    if content_type.startswith("text/csv"):
+        rows = iter_csv_rows(request.stream())
+    elif not content_type or "json" in content_type:
+        rows = iter_ndjson_rows(request.stream())
+    else:
+        raise HTTPException(status_code=415, detail="Content-Type must be application/x-ndjson or text/csv")
+
+    collection = Database.get_db()[LIQUOR_COLLECTION]
+    inserted = 0
+    errors = []
+    batch = []
+
+    async for row, value in rows:
+        if isinstance(value, Exception):
+            errors.append({"row": row, "error": str(value)})
+            continue
+        try:
+            liquor = LiquorCreate(**value)
+        except ValidationError as e:
+            errors.append({"row": row, "error": _validation_message(e)})
+            continue
+
+        batch.append((row, new_liquor_document(liquor)))
+        if len(batch) >= IMPORT_BATCH_SIZE:
+            inserted += await _insert_batch(collection, batch, errors)
+            batch = []
+
+    if batch:
+        inserted += await _insert_batch(collection, batch, errors)
+
+    if inserted:
+        await response_cache.invalidate("liquors")
+
+    errors.sort(key=lambda error: error["row"])
+    return {"inserted": inserted, "failed": len(errors), "errors": errors}
+
+
+@router.get(
+    "/liquors/export",
+    summary="주류 일괄 내보내기",
+    description="전체 주류를 NDJSON으로 스트리밍합니다. 각 줄은 주류 하나이며 일괄 등록 API에 그대로 사용할 수 있습니다.",
+    tags=["liquors"],
+)
+async def export_liquors():
+    db = Database.get_read_db()
+    cursor = db[LIQUOR_COLLECTION].find(
+        {},
+        {"image": 0},
+        batch_size=EXPORT_BATCH_SIZE,
+    ).sort(LIST_SORT)
+
+    def export_row(doc: dict) -> dict:
+        doc = to_response(doc)
+        doc.pop("image_id", None)
+        return doc
+
+    return StreamingResponse(
+        ndjson_stream(cursor, export_row),
+        media_type=NDJSON_MEDIA_TYPE,
+        headers={"Content-Disposition": 'attachment; filename="liquors.ndjson"'},
+    )
 
 
 @router.get(
     "/liquors/{liquor_id}",
     response_model=Liquor,
     summary="주류 상세 조회",
-    description="특정 주류의 상세 정보를 조회합니다",
+    description=f"특정 주류의 상세 정보를 조회합니다. 리뷰는 최신 {DETAIL_REVIEW_LIMIT}개만 포함됩니다.",
     tags=["liquors"],
 )
 async def get_liquor(liquor_id: str = Path(..., description="조회할 주류의 ID")):
@@ -57,11 +441,113 @@ async def get_liquor(liquor_id: str = Path(..., description="조회할 주류의
 
     if not liquor:
         raise HTTPException(status_code=404, detail="Liquor not found")
-    
-    liquor["image"] = base64.b64encode(liquor["image"]).decode("utf-8") if liquor["image"] else None
-    liquor["profile"] = json.loads(liquor["profile"])
 
-    return serialize_id(liquor)
+    cursor = db[REVIEW_COLLECTION].find({"liquor_id": liquor["_id"]}).sort(
+        REVIEW_SORTS["updated_at"]
+    ).limit(DETAIL_REVIEW_LIMIT)
+    liquor["reviews"] = [serialize_review(doc) async for doc in cursor]
+
+    return fast_response(to_response(liquor), Liquor)
+
+
+@router.get(
+    "/liquors/{liquor_id}/similar",
+    response_model=List[SimilarLiquor],
+    response_model_exclude_unset=True,
+    summary="유사 주류 조회",
+    description="프로필(부드러움, 향, 복합성, 피니시, 밸런스, 강도) 공간에서 가장 가까운 주류를 조회합니다",
+    tags=["liquors"],
+)
+async def get_similar_liquors(
+    liquor_id: str = Path(..., description="기준 주류의 ID"),
+    k: int = Query(10, ge=1, le=50, description="조회할 주류 수"),
+):
+    liquor_oid = ObjectId(liquor_id)
+    await profile_index.ensure_loaded()
+
+    vector = profile_index.vector(liquor_oid)
+    if vector is None:
+        db = Database.get_db()
+        if not await db[LIQUOR_COLLECTION].find_one({"_id": liquor_oid}, {"_id": 1}):
+            raise HTTPException(status_code=404, detail="Liquor not found")
+        raise HTTPException(status_code=400, detail="Liquor has no profile")
+
+    neighbors = profile_index.nearest(vector, k, exclude=liquor_oid)
+    if not neighbors:
+        return []
+
+    db = Database.get_db()
+    cursor = db[LIQUOR_COLLECTION].find(
+        {"_id": {"$in": [neighbor_id for neighbor_id, _ in neighbors]}},
+        summary_projection(None),
+    )
+    docs = {doc["_id"]: doc async for doc in cursor}
+    return [
+        {**to_response(docs[neighbor_id]), "distance": distance}
+        for neighbor_id, distance in neighbors
+        if neighbor_id in docs
+    ]
+
+
+@router.get(
+    "/liquors/{liquor_id}/image",
+    response_class=Response,
+    summary="주류 이미지 조회",
+    description="주류 이미지를 스트리밍합니다. size를 지정하면 해당 크기 이상인 가장 작은 썸네일을 반환합니다. "
+                "ETag/Last-Modified 조건부 요청과 Range 요청을 지원합니다.",
+    tags=["liquors"],
+)
+async def get_liquor_image(
+    request: Request,
+    liquor_id: str = Path(..., description="조회할 주류의 ID"),
+    v: Optional[str] = Query(None, description="이미지 버전 (image_url에 포함된 값)"),
+    size: Optional[int] = Query(None, ge=1, description="썸네일 크기 (px, 64/256/1024 중 가까운 크기로 제공)"),
+    image_format: str = Query("webp", alias="format", pattern="^(webp|jpeg)$", description="썸네일 포맷 (webp, jpeg)"),
+):
+    db = Database.get_db()
+    liquor = await db[LIQUOR_COLLECTION].find_one(
+        {"_id": ObjectId(liquor_id)},
+        {"image_id": 1, "image_content_type": 1},
+    )
+
+    if not liquor:
+        raise HTTPException(status_code=404, detail="Liquor not found")
+    if not liquor.get("image_id"):
+        raise HTTPException(status_code=404, detail="Image not found")
+
+    digest = liquor["image_id"]
+    stat = await run_in_threadpool(blob_store.stat, digest)
+    if stat is None:
+        raise HTTPException(status_code=404, detail="Image not found")
+
+    # 버전이 일치하는 URL은 내용이 바뀌지 않으므로 장기 캐시 허용
+    if v and digest.startswith(v):
+        cache_control = "public, max-age=31536000, immutable"
+    else:
+        cache_control = "public, no-cache"
+
+    if size:
+        variant_size = pick_variant_size(size)
+        variant_stat = await image_variants.get_variant(digest, variant_size, image_format)
+        # 디코딩할 수 없는 이미지는 원본으로 대체
+        if variant_stat is not None:
+            return blob_response(
+                request,
+                image_variants.cache.store,
+                variant_key(digest, variant_size, image_format),
+                VARIANT_FORMATS[image_format],
+                cache_control,
+                stat=variant_stat,
+            )
+
+    return blob_response(
+        request,
+        blob_store,
+        digest,
+        liquor.get("image_content_type") or "application/octet-stream",
+        cache_control,
+        stat=stat,
+    )
 
 
 @router.post(
@@ -72,6 +558,7 @@ async def get_liquor(liquor_id: str = Path(..., description="조회할 주류의
     tags=["liquors"],
 )
 async def create_liquor(
+    background_tasks: BackgroundTasks,
     name: str = Form(...),
     type: str = Form(...),
     description: str = Form(...),
@@ -81,28 +568,43 @@ async def create_liquor(
 ):
     db = Database.get_db()
 
+    # 프로필은 검증 후 숫자 필드를 가진 하위 문서로 저장
+    try:
+        profile_data = Profile(**json.loads(profile)).dict()
+    except (ValueError, TypeError, ValidationError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid profile: {e}")
+
     liquor_dict = {
         "name": name,
         "type": type,
         "description": description,
         "rating": rating,
-        "profile": profile,
+        "profile": profile_data,
         "created_at": datetime.now(timezone.utc),
         "updated_at": datetime.now(timezone.utc),
-        "reviews": [],
         "stores": [],
+        "review_count": 0,
+        "review_likes": 0,
     }
 
-    # 이미지 저장
+    # 이미지는 문서 밖 블롭 저장소에 저장하고 해시만 기록
     if image:
-        liquor_dict["image"] = await image.read()
+        digest, size = await run_in_threadpool(blob_store.put_file, image.file)
+        liquor_dict["image_id"] = digest
+        liquor_dict["image_size"] = size
+        liquor_dict["image_content_type"] = image.content_type
+        # 썸네일은 응답 후 백그라운드에서 생성
+        background_tasks.add_task(image_variants.ensure_variants, digest)
     else:
-        liquor_dict["image"] = None
+        liquor_dict["image_id"] = None
 
     result = await db[LIQUOR_COLLECTION].insert_one(liquor_dict)
     created_liquor = await db[LIQUOR_COLLECTION].find_one({"_id": result.inserted_id})
+    profile_index.on_write(result.inserted_id, profile_data)
+    search_index.on_liquor_write(result.inserted_id, name, description)
+    await response_cache.invalidate("liquors")
 
-    return serialize_id(created_liquor)
+    return to_response(created_liquor)
 
 
 @router.delete(
@@ -118,4 +620,9 @@ async def delete_liquor(liquor_id: str = Path(..., description="삭제할 주류
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Liquor not found")
 
+    await db[REVIEW_COLLECTION].delete_many({"liquor_id": ObjectId(liquor_id)})
+    profile_index.on_delete(ObjectId(liquor_id))
+    search_index.on_liquor_delete(ObjectId(liquor_id))
+    await response_cache.invalidate("liquors", f"liquor:{liquor_id}")
+
     return {"message": "Liquor deleted successfully"}
@@ -1,49 +1,102 @@
-from fastapi import APIRouter, Path, Query, Body, HTTPException
-from typing import List
+from fastapi import APIRouter, Path, Query, Body, HTTPException, Header
+from fastapi.responses import StreamingResponse
+from typing import List, Optional
 from ..models.review import Review, ReviewCreate
-from ..database import Database, LIQUOR_COLLECTION
+from ..database import Database, LIQUOR_COLLECTION, REVIEW_COLLECTION
 from datetime import datetime
 from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import ReturnDocument
 from ..utils.text_filter import validate_review_text
+from ..utils.pagination import fetch_page, stream_cursor
+from ..utils.bulk_io import ndjson_stream, wants_ndjson, NDJSON_MEDIA_TYPE, STREAM_BATCH_SIZE
+from ..utils.like_buffer import like_buffer
+from ..utils.response_cache import response_cache
+from ..utils.search_index import search_index
+from ..utils.fast_json import fast_response
 
 router = APIRouter()
 
+# 정렬 기준별 정렬 키 (REVIEW_COLLECTION 인덱스와 일치)
+REVIEW_SORTS = {
+    "updated_at": [("updated_at", -1), ("_id", -1)],
+    "likes": [("likes", -1), ("updated_at", -1), ("_id", -1)],
+}
+
+# 커서만 지정하고 limit을 생략했을 때의 페이지 크기
+DEFAULT_REVIEW_PAGE_SIZE = 20
+
+def review_object_id(review_id: str) -> ObjectId:
+    """리뷰 ID를 ObjectId로 변환 (형식이 잘못된 ID는 존재하지 않는 리뷰로 처리)"""
+    try:
+        return ObjectId(review_id)
+    except (InvalidId, TypeError):
+        raise HTTPException(status_code=404, detail="Review not found")
+
+def serialize_review(doc: dict) -> dict:
+    """리뷰 문서를 응답 형태로 변환 (아직 기록되지 않은 좋아요 포함)"""
+    return {
+        "id": str(doc["_id"]),
+        "content": doc["content"],
+        "created_at": doc["created_at"],
+        "updated_at": doc["updated_at"],
+        "likes": doc.get("likes", 0) + like_buffer.pending(doc["liquor_id"], doc["_id"]),
+    }
+
+async def ensure_liquor_exists(db, liquor_id: str) -> ObjectId:
+    liquor_oid = ObjectId(liquor_id)
+    if not await db[LIQUOR_COLLECTION].find_one({"_id": liquor_oid}, {"_id": 1}):
+        raise HTTPException(status_code=404, detail="Liquor not found")
+    return liquor_oid
+
 @router.get(
     "/liquors/{liquor_id}/reviews",
     response_model=List[Review],
     summary="리뷰 목록 조회",
-    description="특정 주류의 리뷰 목록을 조회합니다",
+    description="특정 주류의 리뷰 목록을 조회합니다. limit을 지정하면 상위 N개만 반환하고, "
+                "다음/이전 페이지 커서를 X-Next-Cursor, X-Prev-Cursor 응답 헤더로 전달합니다. "
+                "Accept: application/x-ndjson으로 요청하면 한 줄에 리뷰 하나씩 스트리밍합니다.",
     tags=["reviews"]
 )
 async def get_reviews(
     liquor_id: str = Path(..., description="조회할 주류의 ID"),
-    sort: str = Query("updated_at", description="정렬 기준 (updated_at: 최신순, likes: 인기순)")
+    sort: str = Query("updated_at", description="정렬 기준 (updated_at: 최신순, likes: 인기순)"),
+    limit: Optional[int] = Query(None, ge=1, le=100, description="최대 리뷰 수 (생략 시 전체)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 또는 X-Prev-Cursor 값"),
+    direction: str = Query("next", pattern="^(next|prev)$", description="페이지 방향 (next: 다음, prev: 이전)"),
+    accept: Optional[str] = Header(None, description="application/x-ndjson이면 스트리밍")
 ):
     db = Database.get_db()
-    
-    liquor = await db[LIQUOR_COLLECTION].find_one(
-        {"_id": ObjectId(liquor_id)}
+    liquor_oid = await ensure_liquor_exists(db, liquor_id)
+    review_sort = REVIEW_SORTS.get(sort, REVIEW_SORTS["updated_at"])
+
+    # NDJSON 스트리밍은 limit 없이 커서 다음의 리뷰를 끝까지 보낸다
+    if wants_ndjson(accept):
+        stream = stream_cursor(
+            db[REVIEW_COLLECTION], {"liquor_id": liquor_oid}, review_sort, STREAM_BATCH_SIZE, cursor=cursor
+        )
+        return StreamingResponse(ndjson_stream(stream, serialize_review), media_type=NDJSON_MEDIA_TYPE)
+
+    # 정렬과 limit은 인덱스를 타고 DB에서 수행
+    if limit is None and cursor is None:
+        cursor = db[REVIEW_COLLECTION].find({"liquor_id": liquor_oid}).sort(review_sort)
+        return fast_response([serialize_review(doc) async for doc in cursor], Review, many=True)
+
+    docs, next_cursor, prev_cursor = await fetch_page(
+        db[REVIEW_COLLECTION],
+        {"liquor_id": liquor_oid},
+        review_sort,
+        limit or DEFAULT_REVIEW_PAGE_SIZE,
+        cursor=cursor,
+        backward=direction == "prev",
     )
-    
-    if not liquor:
-        raise HTTPException(status_code=404, detail="Liquor not found")
-        
-    reviews = liquor.get("reviews", [])
-    
-    # likes 필드가 없는 리뷰에 대해 기본값 0 설정
-    for review in reviews:
-        if "likes" not in review:
-            review["likes"] = 0
-    
-    # 정렬
-    sort_key = {
-        "updated_at": lambda x: x["updated_at"],
-        "likes": lambda x: (x.get("likes", 0), x["updated_at"])  # 좋아요 수가 없으면 0으로 처리
-    }.get(sort, lambda x: x["updated_at"])
-    
-    reviews.sort(key=sort_key, reverse=True)
-        
-    return reviews
+
+    headers = {}
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor
+    if prev_cursor:
+        headers["X-Prev-Cursor"] = prev_cursor
+    return fast_response([serialize_review(doc) for doc in docs], Review, many=True, headers=headers)
 
 @router.post(
     "/liquors/{liquor_id}/reviews",
@@ -65,26 +118,29 @@ async def add_review(
         )
 
     db = Database.get_db()
-    
+    liquor_oid = await ensure_liquor_exists(db, liquor_id)
+
     # 리뷰 객체 생성
-    review_obj = {
-        "id": str(ObjectId()),
+    now = datetime.utcnow()
+    review_doc = {
+        "_id": ObjectId(),
+        "liquor_id": liquor_oid,
         "content": review.content,
-        "created_at": datetime.utcnow(),
-        "updated_at": datetime.utcnow(),
+        "created_at": now,
+        "updated_at": now,
         "likes": 0
     }
-    
-    # 리뷰 추가
-    result = await db[LIQUOR_COLLECTION].update_one(
-        {"_id": ObjectId(liquor_id)},
-        {"$push": {"reviews": review_obj}}
+
+    # 리뷰를 먼저 추가하고 주류의 리뷰 수를 올린다 (추가가 실패하면 리뷰 수가 부풀지 않도록)
+    await db[REVIEW_COLLECTION].insert_one(review_doc)
+    await db[LIQUOR_COLLECTION].update_one(
+        {"_id": liquor_oid},
+        {"$inc": {"review_count": 1}}
     )
+    search_index.on_review_write(liquor_oid, review.content)
+    await response_cache.invalidate("liquors", f"liquor:{liquor_id}")
     
-    if result.modified_count == 0:
-        raise HTTPException(status_code=404, detail="Liquor not found")
-    
-    return review_obj
+    return serialize_review(review_doc)
 
 @router.put(
     "/liquors/{liquor_id}/reviews/{review_id}",
@@ -108,40 +164,34 @@ async def update_review(
 
     db = Database.get_db()
     
-    # 리뷰 수정
-    result = await db[LIQUOR_COLLECTION].update_one(
+    # 리뷰 수정 (검색 색인에서 이전 내용을 빼기 위해 수정 전 문서를 받는다)
+    changes = {
+        "content": review.content,
+        "updated_at": datetime.utcnow()
+    }
+    previous_review = await db[REVIEW_COLLECTION].find_one_and_update(
         {
-            "_id": ObjectId(liquor_id),
-            "reviews.id": review_id
+            "_id": review_object_id(review_id),
+            "liquor_id": ObjectId(liquor_id)
         },
-        {
-            "$set": {
-                "reviews.$.content": review.content,
-                "reviews.$.updated_at": datetime.utcnow()
-            }
-        }
+        # 새 내용은 현재 필터를 통과했으므로 재검사 작업의 표시를 지운다
+        {"$set": changes, "$unset": {"flagged": "", "flagged_at": ""}},
+        return_document=ReturnDocument.BEFORE
     )
     
-    if result.modified_count == 0:
+    if not previous_review:
         raise HTTPException(status_code=404, detail="Review not found")
-    
-    # 업데이트된 리뷰 조회
-    liquor = await db[LIQUOR_COLLECTION].find_one(
-        {"_id": ObjectId(liquor_id)}
-    )
-    
-    updated_review = next(
-        (r for r in liquor["reviews"] if r["id"] == review_id),
-        None
-    )
-    
-    return updated_review
+
+    updated_review = {**previous_review, **changes}
+    search_index.on_review_write(updated_review["liquor_id"], review.content, previous_review["content"])
+    await response_cache.invalidate(f"liquor:{liquor_id}")
+    return serialize_review(updated_review)
 
 @router.post(
     "/liquors/{liquor_id}/reviews/{review_id}/like",
     response_model=Review,
     summary="리뷰 좋아요",
-    description="특정 리뷰에 좋아요를 추가합니다",
+    description="특정 리뷰에 좋아요를 추가합니다. 좋아요는 모아서 주기적으로 기록됩니다.",
     tags=["reviews"]
 )
 async def like_review(
@@ -149,32 +199,34 @@ async def like_review(
     review_id: str = Path(..., description="좋아요할 리뷰의 ID")
 ):
     db = Database.get_db()
-    
-    # 리뷰의 좋아요 수 증가
-    result = await db[LIQUOR_COLLECTION].update_one(
-        {
-            "_id": ObjectId(liquor_id),
-            "reviews.id": review_id
-        },
-        {
-            "$inc": {"reviews.$.likes": 1}
-        }
-    )
-    
-    if result.modified_count == 0:
+    review_filter = {
+        "_id": review_object_id(review_id),
+        "liquor_id": ObjectId(liquor_id)
+    }
+
+    if not like_buffer.enabled:
+        # 리뷰의 좋아요 수 즉시 증가
+        updated_review = await db[REVIEW_COLLECTION].find_one_and_update(
+            review_filter,
+            {"$inc": {"likes": 1}},
+            return_document=ReturnDocument.AFTER
+        )
+        if not updated_review:
+            raise HTTPException(status_code=404, detail="Review not found")
+        await db[LIQUOR_COLLECTION].update_one(
+            {"_id": updated_review["liquor_id"]},
+            {"$inc": {"review_likes": 1}}
+        )
+        await response_cache.invalidate(f"liquor:{liquor_id}")
+        return serialize_review(updated_review)
+
+    review = await db[REVIEW_COLLECTION].find_one(review_filter)
+    if not review:
         raise HTTPException(status_code=404, detail="Review not found")
-    
-    # 업데이트된 리뷰 조회
-    liquor = await db[LIQUOR_COLLECTION].find_one(
-        {"_id": ObjectId(liquor_id)}
-    )
-    
-    updated_review = next(
-        (r for r in liquor["reviews"] if r["id"] == review_id),
-        None
-    )
-    
-    return updated_review
+
+    # 증가분은 버퍼에 합산하고 주기적으로 bulk_write (상세 캐시는 기록할 때 무효화)
+    like_buffer.add(review["liquor_id"], review["_id"])
+    return serialize_review(review)
 
 @router.delete(
     "/liquors/{liquor_id}/reviews/{review_id}",
@@ -188,12 +240,20 @@ async def delete_review(
 ):
     db = Database.get_db()
     
-    result = await db[LIQUOR_COLLECTION].update_one(
-        {"_id": ObjectId(liquor_id)},
-        {"$pull": {"reviews": {"id": review_id}}}
-    )
+    deleted_review = await db[REVIEW_COLLECTION].find_one_and_delete({
+        "_id": review_object_id(review_id),
+        "liquor_id": ObjectId(liquor_id)
+    })
     
-    if result.modified_count == 0:
+    if not deleted_review:
         raise HTTPException(status_code=404, detail="Review not found")
-    
-    return {"message": "Review deleted successfully"} 
\ No newline at end of file
+
+    # 주류 집계에서 리뷰 수와 기록된 좋아요를 빼고, 아직 기록되지 않은 좋아요는 버린다
+    await db[LIQUOR_COLLECTION].update_one(
+        {"_id": deleted_review["liquor_id"]},
+        {"$inc": {"review_count": -1, "review_likes": -deleted_review.get("likes", 0)}}
+    )
+    like_buffer.discard(deleted_review["liquor_id"], deleted_review["_id"])
+    search_index.on_review_delete(deleted_review["liquor_id"], deleted_review["content"])
+    await response_cache.invalidate("liquors", f"liquor:{liquor_id}")
+    return {"message": "Review deleted successfully"}
@@ -0,0 +1,91 @@
+from fastapi import APIRouter, Query
+import asyncio
+from ..models.search import SearchResult
+from ..database import Database, LIQUOR_COLLECTION, REVIEW_COLLECTION
+from ..utils.search_index import search_index, tokenize, highlight
+from .liquor import to_response
+from .review import REVIEW_SORTS
+
+router = APIRouter()
+
+# 검색 결과에 포함하는 주류 필드
+SEARCH_PROJECTION = {
+    "name": 1, "type": 1, "rating": 1, "description": 1, "image_id": 1,
+    "review_count": 1, "review_likes": 1, "min_price": 1, "max_price": 1,
+}
+
+
+# 리뷰 스니펫을 찾을 때 주류마다 읽는 최대 리뷰 수 (liquor_likes 인덱스 순서로 인기 리뷰부터)
+SNIPPET_SCAN_REVIEWS = 20
+
+
+async def review_snippet(db, liquor_id, tokens: set):
+    """인기 리뷰 SNIPPET_SCAN_REVIEWS개 중 질의와 일치하는 첫 리뷰의 하이라이트 (없으면 None)"""
+    cursor = db[REVIEW_COLLECTION].find(
+        {"liquor_id": liquor_id}, {"content": 1}
+    ).sort(REVIEW_SORTS["likes"]).limit(SNIPPET_SCAN_REVIEWS)
+    async for doc in cursor:
+        snippet = highlight(doc.get("content"), tokens, snippet=True)
+        if snippet:
+            return snippet
+    return None
+
+
+async def review_snippets(db, liquor_ids, tokens: set) -> dict:
+    """주류별 리뷰 스니펫 (주류마다 읽는 리뷰 수를 제한하고 동시에 조회)"""
+    if not liquor_ids or not tokens:
+        return {}
+    snippets = await asyncio.gather(*(review_snippet(db, liquor_id, tokens) for liquor_id in liquor_ids))
+    return {liquor_id: snippet for liquor_id, snippet in zip(liquor_ids, snippets) if snippet}
+
+
+@router.get(
+    "/search",
+    response_model=SearchResult,
+    response_model_exclude_unset=True,
+    summary="주류 검색",
+    description="주류 이름, 설명, 리뷰 내용으로 주류를 검색합니다. 결과는 관련도 순으로 정렬됩니다.",
+    tags=["search"]
+)
+async def search_liquors(
+    q: str = Query(..., min_length=1, max_length=100, description="검색어"),
+    limit: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    offset: int = Query(0, ge=0, le=1000, description="건너뛸 결과 수"),
+):
+    db = Database.get_read_db()
+    await search_index.ensure_loaded()
+
+    total, ranked = search_index.search(q, limit, offset)
+    if not ranked:
+        return {"total": total, "hits": []}
+
+    ids = [liquor_id for liquor_id, _ in ranked]
+    docs = {
+        doc["_id"]: doc
+        async for doc in db[LIQUOR_COLLECTION].find({"_id": {"$in": ids}}, SEARCH_PROJECTION)
+    }
+
+    tokens = set(tokenize(q))
+    hits = []
+    for liquor_id, score in ranked:
+        doc = docs.get(liquor_id)
+        if doc is None:
+            # 다른 워커에서 삭제된 주류
+            continue
+        highlights = {
+            "name": highlight(doc.get("name"), tokens),
+            "description": highlight(doc.get("description"), tokens, snippet=True),
+        }
+        hit = to_response(doc)
+        hit["score"] = round(score, 4)
+        hit["highlights"] = {field: value for field, value in highlights.items() if value}
+        hits.append((liquor_id, hit))
+
+    # 이름/설명에 일치하는 부분이 없는 결과는 리뷰 스니펫으로 보여준다
+    review_only = [liquor_id for liquor_id, hit in hits if not hit["highlights"]]
+    snippets = await review_snippets(db, review_only, tokens)
+    for liquor_id, hit in hits:
+        if liquor_id in snippets:
+            hit["highlights"]["review"] = snippets[liquor_id]
+
+    return {"total": total, "hits": [hit for _, hit in hits]}
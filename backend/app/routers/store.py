@@ -2,6 +2,8 @@ from fastapi import APIRouter, Path, Query, Body, HTTPException
 from typing import List
 from ..models.store import Store, StoreCreate
 from ..database import Database, LIQUOR_COLLECTION
+from ..utils.response_cache import response_cache
+from ..utils.aggregates import PRICE_RANGE_STAGE
 from bson import ObjectId
 
 router = APIRouter()
@@ -55,15 +57,22 @@ async def add_store(
     store_obj = store.dict()
     store_obj["id"] = str(ObjectId())
     
-    # 판매처 추가
+    # 판매처 추가와 가격 범위 갱신을 한 번의 쓰기로 처리
     result = await db[LIQUOR_COLLECTION].update_one(
         {"_id": ObjectId(liquor_id)},
-        {"$push": {"stores": store_obj}}
+        [
+            {"$set": {"stores": {"$concatArrays": [
+                {"$ifNull": ["$stores", []]},
+                {"$literal": [store_obj]},
+            ]}}},
+            PRICE_RANGE_STAGE,
+        ]
     )
     
-    if result.modified_count == 0:
+    if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="Liquor not found")
-    
+
+    await response_cache.invalidate("liquors", f"liquor:{liquor_id}")
     return store_obj
 
 @router.delete(
@@ -78,12 +87,20 @@ async def delete_store(
 ):
     db = Database.get_db()
     
+    # 판매처 삭제 후 남은 판매처로 가격 범위를 다시 계산
     result = await db[LIQUOR_COLLECTION].update_one(
-        {"_id": ObjectId(liquor_id)},
-        {"$pull": {"stores": {"id": store_id}}}
+        {"_id": ObjectId(liquor_id), "stores.id": store_id},
+        [
+            {"$set": {"stores": {"$filter": {
+                "input": "$stores",
+                "cond": {"$ne": ["$$this.id", store_id]},
+            }}}},
+            PRICE_RANGE_STAGE,
+        ]
     )
     
-    if result.modified_count == 0:
+    if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="Store not found")
-    
+
+    await response_cache.invalidate("liquors", f"liquor:{liquor_id}")
     return {"message": "Store deleted successfully"} 
\ No newline at end of file
@@ -0,0 +1,86 @@
+import os
+import time
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from ..database import Database, client_options, MONGODB_LIST_READ_PREFERENCE
+from ..utils.fast_json import ORJSONResponse
+from ..utils.health import STARTED_AT, admission_control, loop_monitor, ping_mongo, pool_saturation
+from ..utils.response_cache import response_cache
+from ..utils.pool_metrics import pool_metrics
+from ..utils.metrics import registry
+
+router = APIRouter()
+
+@router.get(
+    "/cache/stats",
+    summary="응답 캐시 통계",
+    description="응답 캐시의 적중/미스 횟수와 항목 수를 조회합니다",
+    tags=["system"]
+)
+async def get_cache_stats():
+    return response_cache.stats()
+
+@router.get(
+    "/db/pool",
+    summary="DB 커넥션 풀 상태",
+    description="이 워커 프로세스의 서버별 커넥션 수, 사용 중인 커넥션 수, 체크아웃 대기 시간 분포와 드라이버 설정을 조회합니다",
+    tags=["system"]
+)
+async def get_pool_stats():
+    return {
+        **pool_metrics.snapshot(),
+        "options": client_options(),
+        "list_read_preference": MONGODB_LIST_READ_PREFERENCE,
+    }
+
+@router.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    summary="Prometheus 지표",
+    description="라우트별 요청 수, 지연 시간, 요청/응답 크기, 처리 중인 요청 수와 "
+                "컬렉션/명령별 MongoDB 지연 시간을 Prometheus 텍스트 형식으로 조회합니다 (워커 프로세스별 값)",
+    tags=["system"]
+)
+async def get_metrics():
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+@router.get(
+    "/health/live",
+    summary="생존 확인",
+    description="워커 프로세스가 응답할 수 있는지 확인합니다. 외부 의존성은 확인하지 않으므로 실패하면 재시작 대상입니다.",
+    tags=["system"]
+)
+async def get_liveness():
+    return {
+        "status": "ok",
+        "pid": os.getpid(),
+        "uptime_seconds": round(time.time() - STARTED_AT, 1),
+        "event_loop": loop_monitor.snapshot(),
+    }
+
+@router.get(
+    "/health/ready",
+    summary="준비 상태 확인",
+    description="MongoDB ping 시간, 커넥션 풀 사용률, 이벤트 루프 지연, 처리 중인 요청 수를 조회합니다. "
+                "MongoDB에 연결할 수 없거나 과부하로 요청을 거절하는 중이면 503을 반환합니다 (트래픽 제외 대상).",
+    tags=["system"]
+)
+async def get_readiness():
+    try:
+        mongo = await ping_mongo(Database.get_db())
+    except Exception as e:  # 연결 전 (lifespan 시작 중)
+        mongo = {"ok": False, "error": str(e) or type(e).__name__}
+    admission = admission_control.snapshot()
+    ready = mongo["ok"] and admission["overloaded"] is None
+    return ORJSONResponse(
+        {
+            "status": "ready" if ready else "unavailable",
+            "pid": os.getpid(),
+            "mongo": mongo,
+            "pools": pool_saturation(),
+            "event_loop": loop_monitor.snapshot(),
+            "admission": admission,
+        },
+        status_code=200 if ready else 503,
+    )
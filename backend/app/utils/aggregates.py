@@ -0,0 +1,21 @@
+from typing import Optional
+
+# 주류 문서에 비정규화해서 저장하는 집계 필드
+#   review_count: 리뷰 수, review_likes: 리뷰 좋아요 합계 (평균은 응답 시 계산)
+#   min_price / max_price: 판매처 가격 범위 (판매처가 없으면 null)
+
+# 판매처 배열을 바꾸는 파이프라인 업데이트 끝에 붙여 가격 범위를 같은 쓰기에서 다시 계산
+PRICE_RANGE_STAGE = {
+    "$set": {
+        "min_price": {"$min": "$stores.price"},
+        "max_price": {"$max": "$stores.price"},
+    }
+}
+
+
+def avg_likes(doc: dict) -> Optional[float]:
+    """리뷰당 평균 좋아요 수 (집계 필드가 없는 문서는 None)"""
+    if "review_count" not in doc or "review_likes" not in doc:
+        return None
+    count = doc["review_count"]
+    return round(doc["review_likes"] / count, 2) if count > 0 else 0.0
@@ -0,0 +1,149 @@
+import csv
+import json
+import os
+from typing import AsyncIterator, Callable, Dict, Optional, Tuple, Union
+
+from ..models.liquor import PROFILE_FIELDS
+from .fast_json import dumps
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# 스트리밍 응답에서 커서가 한 번에 가져오는 문서 수
+STREAM_BATCH_SIZE = int(os.getenv("STREAM_BATCH_SIZE", "500"))
+# 이 개수만큼 줄을 모아서 한 청크로 전송 (너무 작으면 전송 횟수가, 너무 크면 첫 바이트까지의 시간이 늘어남)
+STREAM_CHUNK_DOCS = int(os.getenv("STREAM_CHUNK_DOCS", "100"))
+
+
+def _decode_line(line: bytearray, number: int) -> Union[str, ValueError]:
+    try:
+        return line.decode("utf-8-sig")
+    except UnicodeDecodeError as e:
+        return ValueError(f"line {number}: invalid UTF-8 ({e.reason} at byte {e.start})")
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[Union[str, ValueError]]:
+    """
+    바이트 스트림을 줄 단위로 나눠서 반환 (줄바꿈 문자 포함)
+
+    UTF-8로 디코딩할 수 없는 줄은 문자열 대신 줄 번호가 담긴 ValueError를 반환한다.
+    줄바꿈은 새로 받은 청크에서만 찾으므로 긴 줄이 여러 청크에 걸쳐도 전체 길이에 비례한 시간만 쓴다.
+    """
+    buffer = bytearray()
+    number = 0
+    async for chunk in chunks:
+        view = memoryview(chunk)
+        start = 0
+        end = chunk.find(b"\n")
+        while end >= 0:
+            buffer += view[start:end + 1]
+            number += 1
+            yield _decode_line(buffer, number)
+            buffer.clear()
+            start = end + 1
+            end = chunk.find(b"\n", start)
+        buffer += view[start:]
+    if buffer:
+        yield _decode_line(buffer, number + 1)
+
+
+async def iter_ndjson_rows(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, dict]]:
+    """NDJSON 스트림을 (행 번호, 객체)로 반환. 파싱 실패 시 객체 대신 ValueError를 반환"""
+    row = 0
+    async for line in iter_lines(chunks):
+        if isinstance(line, ValueError):
+            row += 1
+            yield row, line
+            continue
+        if not line.strip():
+            continue
+        row += 1
+        try:
+            value = json.loads(line)
+            if not isinstance(value, dict):
+                raise ValueError("row must be a JSON object")
+            yield row, value
+        except ValueError as e:
+            yield row, e
+
+
+async def iter_csv_rows(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, dict]]:
+    """
+    첫 줄이 헤더인 CSV 스트림을 (행 번호, 객체)로 반환
+
+    따옴표 안의 줄바꿈을 지원하기 위해 따옴표 개수가 짝수가 될 때까지 줄을 모아 한 레코드로 파싱한다.
+    """
+    header = None
+    row = 0
+    record = ""
+    async for line in iter_lines(chunks):
+        if isinstance(line, ValueError):
+            if header is None:
+                # 헤더를 읽을 수 없으면 나머지 행도 해석할 수 없다
+                yield 0, line
+                return
+            # 읽을 수 없는 줄이 포함된 레코드는 버린다
+            row += 1
+            record = ""
+            yield row, line
+            continue
+        record += line
+        if record.count('"') % 2:
+            continue
+        text, record = record, ""
+        if not text.strip():
+            continue
+
+        values = next(csv.reader([text]))
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+
+        row += 1
+        if len(values) != len(header):
+            yield row, ValueError(f"expected {len(header)} columns, got {len(values)}")
+            continue
+        yield row, csv_row_to_liquor(dict(zip(header, values)))
+
+    if record.strip():
+        yield row + 1, ValueError("unterminated quoted field")
+
+
+def csv_row_to_liquor(values: Dict[str, str]) -> dict:
+    """CSV 행을 주류 입력 형태로 변환 (profile은 JSON 열 또는 차원별 열)"""
+    liquor = {key: value for key, value in values.items() if key not in PROFILE_FIELDS}
+    if liquor.get("profile"):
+        try:
+            liquor["profile"] = json.loads(liquor["profile"])
+        except ValueError:
+            pass
+    elif any(field in values for field in PROFILE_FIELDS):
+        liquor["profile"] = {field: values.get(field) for field in PROFILE_FIELDS}
+    return liquor
+
+
+async def flush_writes(collection, operations: list):
+    """모아 둔 쓰기 연산을 순서 없는 bulk_write로 기록하고 목록을 비운다 (배치 작업, 마이그레이션에서 사용)"""
+    if operations:
+        await collection.bulk_write(operations, ordered=False)
+        operations.clear()
+
+
+def ndjson_line(doc: dict) -> bytes:
+    return dumps(doc) + b"\n"
+
+
+def wants_ndjson(accept: Optional[str]) -> bool:
+    """Accept 헤더로 NDJSON 스트리밍을 요청했는지 여부"""
+    return bool(accept) and NDJSON_MEDIA_TYPE in accept
+
+
+async def ndjson_stream(cursor, transform: Callable[[dict], dict]) -> AsyncIterator[bytes]:
+    """커서에서 받는 대로 문서를 변환해 NDJSON 청크로 반환 (전체 결과를 메모리에 모으지 않음)"""
+    chunk = []
+    async for doc in cursor:
+        chunk.append(ndjson_line(transform(doc)))
+        if len(chunk) >= STREAM_CHUNK_DOCS:
+            yield b"".join(chunk)
+            chunk = []
+    if chunk:
+        yield b"".join(chunk)
@@ -0,0 +1,113 @@
+from string import ascii_lowercase, digits
+
+# 도메인 라벨에 쓰이는 문자 (텍스트는 소문자로 바꾼 뒤 검사한다)
+DOMAIN_CHARS = frozenset(ascii_lowercase + digits + "-")
+LETTERS = frozenset(ascii_lowercase)
+DIGITS = frozenset(digits)
+# 전화번호 구분자 (정규식의 \s와 같은 공백 문자들과 -, .)
+SEPARATORS = frozenset(chr(code) for code in range(0x3001) if chr(code).isspace()) | {"-", "."}
+# 상태를 바꿀 수 있는 문자. 나머지 문자(한글 등)는 진행 중인 도메인/번호를 끝낼 뿐이다.
+SIGNIFICANT = DOMAIN_CHARS | SEPARATORS
+
+# 최상위 도메인으로 보는 마지막 라벨 길이
+TLD_MIN_LENGTH = 2
+TLD_MAX_LENGTH = 6
+
+
+class ContactScanner:
+    """
+    URL(도메인), 전화번호를 찾는 상태 기계
+
+    문자를 하나씩 feed로 넣고 끝나면 end를 호출한다. 문자마다 상수 시간만 쓰므로
+    정규식 역추적과 달리 입력이 아무리 길거나 악의적이어도 검사 시간이 텍스트 길이에 비례한다.
+    KeywordMatcher.match에 넘기면 키워드 검사와 같은 순회에서 함께 검사된다.
+
+    - 도메인: 점으로 이어진 라벨([a-z0-9-]+)이 둘 이상이고 마지막 라벨이 영문자 2~6자 (naver.com, a.co.kr/path)
+    - 전화번호: 숫자 2~4자, 3~4자, 4자가 구분자(-, 공백, .) 하나씩을 사이에 두거나 붙어서 이어진 것
+      (기존 정규식 \\d{2,4}[-\\s.]?\\d{3,4}[-\\s.]?\\d{4}와 같은 규칙)
+    """
+
+    __slots__ = (
+        "category", "_labels", "_label_length", "_label_alpha",
+        "_digits", "_group", "_group2", "_after_separator", "_idle",
+    )
+
+    def __init__(self, category: str = "ad"):
+        self.category = category
+        # 도메인: 현재 라벨 앞에 완성된 라벨 수, 현재 라벨 길이와 영문자로만 이루어졌는지
+        self._labels = 0
+        self._label_length = 0
+        self._label_alpha = True
+        # 전화번호: 현재 숫자 묶음 길이, 구분자 하나를 사이에 둔 직전/그 전 숫자 묶음 길이
+        self._digits = 0
+        self._group = 0
+        self._group2 = 0
+        self._after_separator = False
+        # 진행 중인 도메인/번호가 없으면 True (한글 위주의 리뷰에서 대부분의 문자를 바로 건너뛴다)
+        self._idle = True
+
+    def feed(self, char: str) -> bool:
+        """문자 하나를 읽고 도메인이나 전화번호가 완성됐으면 True"""
+        if char not in SIGNIFICANT:
+            if self._idle:
+                return False
+            self._idle = True
+            self._digits = self._group = self._group2 = 0
+            self._after_separator = False
+            return self._domain_ends()
+        self._idle = False
+        return self._feed_phone(char) | self._feed_domain(char)
+
+    def end(self) -> bool:
+        """텍스트 끝에서 마지막 라벨이 최상위 도메인인지 확인"""
+        return self._domain_ends()
+
+    def _domain_ends(self) -> bool:
+        found = (
+            self._labels > 0
+            and self._label_alpha
+            and TLD_MIN_LENGTH <= self._label_length <= TLD_MAX_LENGTH
+        )
+        self._labels = 0
+        self._label_length = 0
+        self._label_alpha = True
+        return found
+
+    def _feed_domain(self, char: str) -> bool:
+        if char in DOMAIN_CHARS:
+            self._label_length += 1
+            if char not in LETTERS:
+                self._label_alpha = False
+            return False
+        if char == ".":
+            if self._label_length:
+                self._labels += 1
+                self._label_length = 0
+                self._label_alpha = True
+                return False
+            # 빈 라벨(.. 또는 점으로 시작)은 도메인이 아니다
+            self._labels = 0
+            return False
+        return self._domain_ends()
+
+    def _feed_phone(self, char: str) -> bool:
+        if char in DIGITS:
+            self._digits += 1
+            self._after_separator = False
+            digits, group, group2 = self._digits, self._group, self._group2
+            return (
+                digits >= 9
+                or (group >= 2 and digits >= 7)
+                or (group >= 5 and digits >= 4)
+                or (group2 >= 2 and 3 <= group <= 4 and digits >= 4)
+            )
+        if char in SEPARATORS and not self._after_separator:
+            if self._digits:
+                self._group2, self._group = self._group, self._digits
+                self._digits = 0
+                self._after_separator = True
+                return False
+        # 구분자가 연달아 오거나 다른 문자가 오면 숫자 묶음이 끊긴다
+        self._digits = self._group = self._group2 = 0
+        self._after_separator = False
+        return False
@@ -0,0 +1,93 @@
+import json
+import logging
+import os
+from datetime import date, datetime
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Dict, Mapping, Optional, Tuple, Type
+
+from bson import ObjectId
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json으로 직렬화
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# 1이면 fast_response도 응답 모델로 검증 (개발/디버그용, 운영에서는 테스트에서 검증)
+RESPONSE_VALIDATION = os.getenv("RESPONSE_VALIDATION", "0") == "1"
+
+
+def _default(value):
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, BaseModel):
+        return value.dict()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """MongoDB 문서를 JSON 바이트로 직렬화 (ObjectId, datetime 포함)"""
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":"), default=_default).encode("utf-8")
+
+
+class ORJSONResponse(JSONResponse):
+    """orjson으로 직렬화하는 JSON 응답 (앱 기본 응답 클래스)"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+@lru_cache(maxsize=None)
+def _model_defaults(model: Type[BaseModel]) -> Tuple[Tuple[str, ...], Dict[str, Any]]:
+    """모델 필드 이름과 (필수가 아닌 필드의) 기본값"""
+    # pydantic v2는 model_fields, v1은 __fields__
+    fields = getattr(model, "model_fields", None) or model.__fields__
+    defaults = {}
+    for name, field in fields.items():
+        if hasattr(field, "is_required"):
+            if not field.is_required():
+                defaults[name] = field.get_default(call_default_factory=True)
+        elif not field.required:
+            defaults[name] = field.get_default()
+    return tuple(fields), defaults
+
+
+def shape(item: Mapping, model: Type[BaseModel], exclude_unset: bool = False) -> dict:
+    """응답 모델에 없는 키를 버리고, exclude_unset이 아니면 빠진 필드를 기본값으로 채운다"""
+    names, defaults = _model_defaults(model)
+    if exclude_unset:
+        return {name: item[name] for name in names if name in item}
+    return {name: item[name] if name in item else defaults.get(name) for name in names}
+
+
+def fast_response(
+    content: Any,
+    model: Type[BaseModel],
+    many: bool = False,
+    exclude_unset: bool = False,
+    headers: Optional[Dict[str, str]] = None,
+) -> ORJSONResponse:
+    """
+    핸들러가 만든 dict를 response_model 검증 없이 바로 직렬화한 응답
+
+    최상위 필드만 모델 기준으로 고르므로, 중첩 값(리뷰, 판매처, 프로필)은 핸들러가 응답 형태로 만들어야 한다.
+    RESPONSE_VALIDATION=1이면 모델 검증을 함께 수행한다.
+    """
+    items = content if many else [content]
+    shaped = [shape(item, model, exclude_unset) for item in items]
+    if RESPONSE_VALIDATION:
+        for item in shaped:
+            model(**item)
+    return ORJSONResponse(shaped if many else shaped[0], headers=headers)
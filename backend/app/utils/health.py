@@ -0,0 +1,181 @@
+import asyncio
+import os
+import time
+from typing import Optional
+
+from .metrics import Counter, registry, _gauge_lines
+from .pool_metrics import pool_metrics
+
+# 이벤트 루프 지연 측정 주기 (초)
+LOOP_LAG_INTERVAL = float(os.getenv("LOOP_LAG_INTERVAL", "0.25"))
+# 워커당 동시에 처리할 요청 수 상한 (0이면 제한 없음)
+ADMISSION_MAX_IN_FLIGHT = int(os.getenv("ADMISSION_MAX_IN_FLIGHT", "256"))
+# 이벤트 루프 지연이 이 값(초)을 넘으면 새 요청을 거절 (0이면 사용 안 함)
+ADMISSION_MAX_LOOP_LAG = float(os.getenv("ADMISSION_MAX_LOOP_LAG", "0.5"))
+# 거절 응답의 Retry-After (초)
+ADMISSION_RETRY_AFTER = int(os.getenv("ADMISSION_RETRY_AFTER", "1"))
+# 거절하지 않는 경로 (상태 확인, 지표 수집)
+ADMISSION_EXEMPT_PREFIXES = ("/api/health", "/api/metrics")
+# 준비 상태 확인의 MongoDB ping 제한 시간 (초)
+HEALTH_PING_TIMEOUT = float(os.getenv("HEALTH_PING_TIMEOUT", "1.0"))
+
+STARTED_AT = time.time()
+
+rejected_requests = registry.register(Counter(
+    "http_requests_rejected_total", "Requests rejected by admission control.", ("reason",),
+))
+
+
+class LoopLagMonitor:
+    """
+    일정 주기로 잠들었다 깨어나는 데 걸린 초과 시간으로 이벤트 루프 지연을 측정
+
+    CPU를 오래 쓰는 핸들러나 동기 호출이 루프를 막으면 지연이 커진다.
+    """
+
+    def __init__(self, interval: float = LOOP_LAG_INTERVAL):
+        self.interval = interval
+        self.lag = 0.0
+        self.max_lag = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            self.lag = max(time.perf_counter() - expected, 0.0)
+            self.max_lag = max(self.max_lag, self.lag)
+
+    def snapshot(self) -> dict:
+        return {"lag_seconds": round(self.lag, 4), "max_lag_seconds": round(self.max_lag, 4)}
+
+
+loop_monitor = LoopLagMonitor()
+
+
+class AdmissionControl:
+    """워커의 처리 중인 요청 수와 한도 (미들웨어와 상태 확인이 함께 사용)"""
+
+    def __init__(
+        self,
+        max_in_flight: int = ADMISSION_MAX_IN_FLIGHT,
+        max_loop_lag: float = ADMISSION_MAX_LOOP_LAG,
+        retry_after: int = ADMISSION_RETRY_AFTER,
+        monitor: LoopLagMonitor = loop_monitor,
+    ):
+        self.max_in_flight = max_in_flight
+        self.max_loop_lag = max_loop_lag
+        self.retry_after = retry_after
+        self.monitor = monitor
+        self.in_flight = 0
+
+    def overload_reason(self) -> Optional[str]:
+        """새 요청을 거절해야 하면 그 이유 (in_flight, loop_lag), 아니면 None"""
+        if self.max_in_flight and self.in_flight >= self.max_in_flight:
+            return "in_flight"
+        if self.max_loop_lag and self.monitor.lag > self.max_loop_lag:
+            return "loop_lag"
+        return None
+
+    def snapshot(self) -> dict:
+        return {
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight or None,
+            "max_loop_lag_seconds": self.max_loop_lag or None,
+            "overloaded": self.overload_reason(),
+        }
+
+
+admission_control = AdmissionControl()
+
+
+class AdmissionControlMiddleware:
+    """
+    처리 중인 요청 수나 이벤트 루프 지연이 한도를 넘으면 새 요청을 바로 503 + Retry-After로 거절하는 ASGI 미들웨어
+
+    과부하 상태의 워커에 요청이 쌓여 클라이언트 타임아웃까지 기다리는 대신, 로드 밸런서/클라이언트가
+    다른 워커나 나중으로 재시도하게 한다. 캐시 적중 응답은 부담이 작으므로 응답 캐시 미들웨어 안쪽에 둔다.
+    """
+
+    def __init__(self, app, control: AdmissionControl = admission_control):
+        self.app = app
+        self.control = control
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"].startswith(ADMISSION_EXEMPT_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+
+        control = self.control
+        reason = control.overload_reason()
+        if reason is not None:
+            rejected_requests.inc(reason)
+            await send({
+                "type": "http.response.start",
+                "status": 503,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"retry-after", str(control.retry_after).encode()),
+                ],
+            })
+            await send({"type": "http.response.body", "body": b'{"detail":"Server is overloaded, retry later"}'})
+            return
+
+        control.in_flight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            control.in_flight -= 1
+
+
+async def ping_mongo(db) -> dict:
+    """MongoDB ping 성공 여부와 왕복 시간 (제한 시간 안에 응답이 없으면 실패)"""
+    start = time.perf_counter()
+    try:
+        await asyncio.wait_for(db.command("ping"), HEALTH_PING_TIMEOUT)
+    except Exception as e:
+        return {
+            "ok": False,
+            "error": str(e) or type(e).__name__,
+            "latency_seconds": round(time.perf_counter() - start, 4),
+        }
+    return {"ok": True, "latency_seconds": round(time.perf_counter() - start, 4)}
+
+
+def pool_saturation() -> dict:
+    """서버별 사용 중인 커넥션 비율과 커넥션을 기다리는 요청 수"""
+    pools = {}
+    for address, pool in pool_metrics.snapshot()["pools"].items():
+        max_size = pool["max_size"]
+        pools[address] = {
+            "in_use": pool["in_use"],
+            "max_size": max_size,
+            "waiting": pool["waiting"],
+            "saturation": round(pool["in_use"] / max_size, 4) if max_size else None,
+        }
+    return pools
+
+
+def collect_health_metrics():
+    """이벤트 루프 지연과 처리 중인 요청 수"""
+    return (
+        _gauge_lines("event_loop_lag_seconds", "Event loop lag.", "gauge", [("", loop_monitor.lag)])
+        + _gauge_lines("admission_in_flight_requests", "Requests admitted and in progress.", "gauge",
+                       [("", admission_control.in_flight)])
+    )
+
+
+registry.add_collector(collect_health_metrics)
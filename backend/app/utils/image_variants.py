@@ -0,0 +1,283 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Set, Tuple
+
+from starlette.concurrency import run_in_threadpool
+
+from .blob_store import BlobStore, blob_store
+
+logger = logging.getLogger(__name__)
+
+# 미리 생성하는 썸네일 크기 (긴 변 기준 px)
+VARIANT_SIZES = (64, 256, 1024)
+
+# 지원 포맷과 MIME 타입
+VARIANT_FORMATS = {
+    "webp": "image/webp",
+    "jpeg": "image/jpeg",
+}
+
+IMAGE_VARIANT_DIR = os.getenv("IMAGE_VARIANT_DIR", "data/variants")
+IMAGE_VARIANT_CACHE_BYTES = int(os.getenv("IMAGE_VARIANT_CACHE_BYTES", str(512 * 1024 * 1024)))
+
+
+def _default_workers() -> int:
+    """
+    워커 프로세스마다 따로 만드는 변형 생성 풀의 기본 크기
+
+    gunicorn.conf.py가 WEB_CONCURRENCY에 워커 수를 넣어 두므로, 모든 워커의 풀을 합쳐 CPU 코어 수를 넘지 않게 나눈다
+    (프로세스당 최대 2개).
+    """
+    web_workers = max(int(os.getenv("WEB_CONCURRENCY") or 1), 1)
+    return min(2, max(1, (os.cpu_count() or 1) // web_workers))
+
+
+# 비워두면 워커 수에 맞춰 정함
+IMAGE_VARIANT_WORKERS = int(os.getenv("IMAGE_VARIANT_WORKERS") or _default_workers())
+# 변형 생성에 실패한 원본을 다시 시도하기까지의 시간 (초)과 기억할 최대 개수
+IMAGE_VARIANT_RETRY_AFTER = float(os.getenv("IMAGE_VARIANT_RETRY_AFTER", "600"))
+IMAGE_VARIANT_FAILED_MAX = int(os.getenv("IMAGE_VARIANT_FAILED_MAX", "1024"))
+
+
+def variant_key(digest: str, size: int, fmt: str) -> str:
+    return f"{digest}-{size}.{fmt}"
+
+
+def pick_variant_size(requested: int) -> int:
+    """요청 크기 이상인 가장 작은 변형 크기 (없으면 가장 큰 변형)"""
+    for size in VARIANT_SIZES:
+        if size >= requested:
+            return size
+    return VARIANT_SIZES[-1]
+
+
+def render_variants(source_path: str, root: str, digest: str) -> List[Tuple[str, int]]:
+    """
+    원본을 한 번 디코딩해서 모든 크기/포맷 변형을 생성 (프로세스 풀에서 실행)
+
+    생성된 (키, 파일 크기) 목록을 반환한다.
+    """
+    from PIL import Image, ImageOps
+
+    store = BlobStore(root)
+    results = []
+    with Image.open(source_path) as original:
+        original = ImageOps.exif_transpose(original)
+        for size in sorted(VARIANT_SIZES, reverse=True):
+            image = original.copy()
+            image.thumbnail((size, size), Image.LANCZOS)
+            for fmt in VARIANT_FORMATS:
+                key = variant_key(digest, size, fmt)
+                path = store.path(key)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+
+                converted = image
+                if fmt == "jpeg" and image.mode not in ("RGB", "L"):
+                    converted = image.convert("RGB")
+
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                converted.save(tmp_path, format=fmt.upper(), quality=85)
+                os.replace(tmp_path, path)
+                results.append((key, os.path.getsize(path)))
+    return results
+
+
+class VariantCache:
+    """
+    디스크 변형 이미지의 용량 제한 캐시
+
+    여러 워커가 같은 디렉터리를 쓰므로 용량 제한은 디렉터리 전체 크기로 확인하고(sweep),
+    접근 시간이 오래된 파일부터 지운다. 메모리의 키 목록은 있는 파일을 빨리 찾기 위한 것이다.
+    """
+
+    def __init__(self, root: str, max_bytes: int):
+        self.store = BlobStore(root)
+        self.max_bytes = max_bytes
+        # 이 워커가 이만큼 추가할 때마다 디렉터리 크기를 확인
+        self.sweep_bytes = max(max_bytes // 10, 1)
+        self._keys: Set[str] = set()
+        self._added_bytes = 0
+        self.loaded = False
+
+    def load(self):
+        """디스크의 기존 변형 파일을 스캔하고 용량을 넘으면 정리"""
+        if self.loaded:
+            return
+        self.sweep()
+        self.loaded = True
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._keys
+
+    def add(self, key: str, size: int) -> bool:
+        """항목을 추가하고 디렉터리 크기를 확인할 때가 되었는지 반환"""
+        self._keys.add(key)
+        self._added_bytes += size
+        if self._added_bytes < self.sweep_bytes:
+            return False
+        self._added_bytes = 0
+        return True
+
+    def discard(self, key: str):
+        self._keys.discard(key)
+
+    def touch(self, key: str) -> Optional[os.stat_result]:
+        """파일 정보를 반환하고 접근 시간을 갱신 (정리 순서에 반영, 수정 시각은 유지)"""
+        stat = self.store.stat(key)
+        if stat is not None:
+            try:
+                os.utime(self.store.path(key), ns=(time.time_ns(), stat.st_mtime_ns))
+            except FileNotFoundError:
+                return None
+        return stat
+
+    def sweep(self) -> List[str]:
+        """
+        디렉터리 전체 크기가 max_bytes를 넘으면 접근 시간이 오래된 파일부터 지우고 지운 키 목록 반환
+
+        다른 워커가 만든 파일도 키 목록에 더한다. 디렉터리를 훑으므로 스레드에서 실행한다.
+        """
+        found = []
+        total = 0
+        for dirpath, _, filenames in os.walk(self.store.root):
+            for filename in filenames:
+                if filename.endswith(".tmp"):
+                    continue
+                try:
+                    stat = os.stat(os.path.join(dirpath, filename))
+                except FileNotFoundError:
+                    # 다른 워커가 지운 파일
+                    continue
+                found.append((stat.st_atime, filename, stat.st_size))
+                total += stat.st_size
+
+        found.sort()
+        removed = []
+        for _, key, size in found[:-1]:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(self.store.path(key))
+            except FileNotFoundError:
+                pass
+            removed.append(key)
+            total -= size
+        self._keys.update(key for _, key, _ in found)
+        self._keys.difference_update(removed)
+        return removed
+
+
+class ImageVariantPipeline:
+    """업로드된 이미지의 썸네일 변형을 프로세스 풀에서 생성하고 캐시"""
+
+    def __init__(self, cache: VariantCache, workers: int):
+        self.cache = cache
+        self.workers = workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending: Dict[str, asyncio.Future] = {}
+        # 디코딩에 실패한 원본 -> 다시 시도할 시각 (매 요청마다 다시 시도하지 않도록 기억, 오래된 것부터 잊음)
+        self._failed: "OrderedDict[str, float]" = OrderedDict()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # 이벤트 루프 스레드가 있는 프로세스를 fork하지 않도록 spawn 사용
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def _recently_failed(self, digest: str) -> bool:
+        retry_at = self._failed.get(digest)
+        if retry_at is None:
+            return False
+        if time.monotonic() < retry_at:
+            return True
+        del self._failed[digest]
+        return False
+
+    def _mark_failed(self, digest: str):
+        self._failed.pop(digest, None)
+        self._failed[digest] = time.monotonic() + IMAGE_VARIANT_RETRY_AFTER
+        while len(self._failed) > IMAGE_VARIANT_FAILED_MAX:
+            self._failed.popitem(last=False)
+
+    def _submit(self, digest: str) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        args = (render_variants, blob_store.path(digest), self.cache.store.root, digest)
+        try:
+            return loop.run_in_executor(self._get_executor(), *args)
+        except BrokenProcessPool:
+            self._executor = None
+            return loop.run_in_executor(self._get_executor(), *args)
+
+    async def ensure_variants(self, digest: str) -> bool:
+        """모든 변형이 캐시에 있도록 보장 (동일 이미지의 동시 요청은 한 번만 생성)"""
+        if not self.cache.loaded:
+            await run_in_threadpool(self.cache.load)
+        if all(
+            variant_key(digest, size, fmt) in self.cache
+            for size in VARIANT_SIZES
+            for fmt in VARIANT_FORMATS
+        ):
+            return True
+        if self._recently_failed(digest):
+            return False
+
+        future = self._pending.get(digest)
+        if future is None:
+            future = self._submit(digest)
+            self._pending[digest] = future
+            future.add_done_callback(lambda _: self._pending.pop(digest, None))
+
+        try:
+            results = await asyncio.shield(future)
+        except BrokenProcessPool as e:
+            # 워커가 비정상 종료된 풀은 다음 요청에서 새로 만든다
+            logger.error(f"Image variant worker pool crashed: {e}")
+            self._executor = None
+            return False
+        except Exception as e:
+            logger.warning(f"Failed to render image variants for {digest}: {e}")
+            self._mark_failed(digest)
+            return False
+
+        sweep = False
+        for key, size in results:
+            sweep = self.cache.add(key, size) or sweep
+        if sweep:
+            # 디렉터리를 훑고 파일을 지우는 동안 이벤트 루프를 막지 않도록 스레드에서 실행
+            await run_in_threadpool(self.cache.sweep)
+        return True
+
+    async def get_variant(self, digest: str, size: int, fmt: str) -> Optional[os.stat_result]:
+        """변형 파일 정보 반환 (생성할 수 없는 이미지면 None)"""
+        key = variant_key(digest, size, fmt)
+        if key not in self.cache and not await self.ensure_variants(digest):
+            return None
+
+        stat = await run_in_threadpool(self.cache.touch, key)
+        if stat is None:
+            # 다른 프로세스가 지운 경우 다시 생성
+            self.cache.discard(key)
+            if not await self.ensure_variants(digest):
+                return None
+            stat = await run_in_threadpool(self.cache.touch, key)
+        return stat
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+image_variants = ImageVariantPipeline(
+    VariantCache(IMAGE_VARIANT_DIR, IMAGE_VARIANT_CACHE_BYTES),
+    IMAGE_VARIANT_WORKERS,
+)
@@ -0,0 +1,98 @@
+from collections import deque
+from typing import AbstractSet, Dict, Iterable, List, Optional, Sequence
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick 오토마톤 기반 다중 키워드 매처
+
+    단어 수와 상관없이 텍스트를 한 번만 훑어서 포함된 키워드의 카테고리를 찾는다.
+    categories는 우선순위 순서이며, 앞선 카테고리가 발견되면 즉시 반환한다.
+    """
+
+    def __init__(self, keywords: Dict[str, Iterable[str]], categories: Sequence[str]):
+        self.categories = tuple(categories)
+        self.size = 0
+        rank = {category: i for i, category in enumerate(self.categories)}
+
+        # 상태별 전이(goto), 실패 링크(fail), 출력 카테고리 순위(out)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Optional[int]] = [None]
+
+        for category, words in keywords.items():
+            for word in words:
+                if word:
+                    self._add(word.lower(), rank[category])
+        self._build()
+
+    def _add(self, word: str, rank: int):
+        state = 0
+        for char in word:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(None)
+            state = next_state
+        if self._out[state] is None:
+            self.size += 1
+        self._out[state] = self._best(self._out[state], rank)
+
+    def _build(self):
+        # BFS로 실패 링크를 계산하고 접미 상태의 출력을 병합
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(char, 0)
+                self._fail[next_state] = fail
+                self._out[next_state] = self._best(self._out[next_state], self._out[fail])
+
+    @staticmethod
+    def _best(a: Optional[int], b: Optional[int]) -> Optional[int]:
+        if a is None:
+            return b
+        if b is None:
+            return a
+        return min(a, b)
+
+    def match(self, text: str, scanner=None, not_followed_by: AbstractSet[str] = frozenset()) -> Optional[str]:
+        """
+        텍스트에 포함된 키워드 중 우선순위가 가장 높은 카테고리 (없으면 None)
+
+        scanner(feed/end 메서드와 category 속성을 가진 상태 기계, 예: ContactScanner)를 넘기면
+        같은 순회에서 문자를 함께 넣고, 패턴이 발견되면 scanner.category로 본다.
+        not_followed_by에 있는 문자가 바로 뒤에 오는 일치는 버린다 (자모열에서 받침 앞에서 끝나는 일치 등).
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        best = None
+        state = 0
+        feed = scanner.feed if scanner is not None else None
+        scanned = self.categories.index(scanner.category) if scanner is not None else None
+        last = len(text) - 1
+        for i, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            found = out[state]
+            if found is not None and i < last and text[i + 1] in not_followed_by:
+                found = None
+            # 이미 같거나 높은 우선순위가 발견됐으면 스캐너는 더 볼 필요가 없다
+            if feed is not None and (best is None or scanned < best) and feed(char):
+                found = scanned if found is None else min(found, scanned)
+                feed = None
+            if found is not None and (best is None or found < best):
+                best = found
+                if best == 0:
+                    break
+        else:
+            if feed is not None and (best is None or scanned < best) and scanner.end():
+                best = scanned
+        return None if best is None else self.categories[best]
@@ -0,0 +1,140 @@
+import asyncio
+import logging
+import os
+from typing import Dict, Optional, Tuple
+
+from bson import ObjectId
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+from ..database import Database, LIQUOR_COLLECTION, REVIEW_COLLECTION
+from .response_cache import response_cache
+
+logger = logging.getLogger(__name__)
+
+# 좋아요를 모아서 기록하는 주기 (초). 프로세스가 비정상 종료될 때 유실될 수 있는 최대 구간이며, 0이면 즉시 기록
+LIKE_FLUSH_INTERVAL = float(os.getenv("LIKE_FLUSH_INTERVAL", "1.0"))
+# 대기 중인 리뷰 수가 이 값을 넘으면 주기를 기다리지 않고 바로 기록
+LIKE_FLUSH_MAX_PENDING = int(os.getenv("LIKE_FLUSH_MAX_PENDING", "1000"))
+
+LikeKey = Tuple[ObjectId, ObjectId]
+
+
+class LikeBuffer:
+    """
+    리뷰 좋아요 증가분을 메모리에 합산했다가 bulk_write로 한 번에 기록하는 버퍼
+
+    같은 리뷰에 대한 클릭은 (liquor_id, review_id) 단위로 합쳐지므로,
+    몰리는 트래픽에서도 기록 횟수는 주기당 리뷰 수를 넘지 않는다.
+    """
+
+    def __init__(self, interval: float, max_pending: int):
+        self.interval = interval
+        self.max_pending = max_pending
+        self._pending: Dict[LikeKey, int] = {}
+        # 기록 중인 증가분 (완료 전까지 읽기에 반영)
+        self._flushing: Dict[LikeKey, int] = {}
+        self._task: Optional[asyncio.Task] = None
+        # 대기 중인 리뷰가 많아 주기를 기다리지 않고 시작한 기록 작업
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.interval > 0
+
+    def add(self, liquor_id: ObjectId, review_id: ObjectId, count: int = 1):
+        key = (liquor_id, review_id)
+        self._pending[key] = self._pending.get(key, 0) + count
+        self._ensure_started()
+        if len(self._pending) >= self.max_pending and (self._flush_task is None or self._flush_task.done()):
+            self._flush_task = asyncio.ensure_future(self.flush())
+            self._flush_task.add_done_callback(self._log_flush_error)
+
+    @staticmethod
+    def _log_flush_error(task: asyncio.Task):
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Like flush failed: {task.exception()!r}")
+
+    def pending(self, liquor_id: ObjectId, review_id: ObjectId) -> int:
+        """아직 DB에 기록되지 않은 좋아요 수"""
+        key = (liquor_id, review_id)
+        return self._pending.get(key, 0) + self._flushing.get(key, 0)
+
+    def discard(self, liquor_id: ObjectId, review_id: ObjectId):
+        """삭제된 리뷰의 기록되지 않은 좋아요 제거 (기록 중인 증가분도 주류 합계에 더하지 않는다)"""
+        self._pending.pop((liquor_id, review_id), None)
+        self._flushing.pop((liquor_id, review_id), None)
+
+    async def flush(self):
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        async with self._flush_lock:
+            if not self._pending:
+                return
+            self._flushing, self._pending = self._pending, {}
+            keys = list(self._flushing)
+            operations = [
+                UpdateOne(
+                    {"_id": review_id, "liquor_id": liquor_id},
+                    {"$inc": {"likes": self._flushing[(liquor_id, review_id)]}},
+                )
+                for liquor_id, review_id in keys
+            ]
+            db = Database.get_db()
+            failed = set()
+            try:
+                await db[REVIEW_COLLECTION].bulk_write(operations, ordered=False)
+            except BulkWriteError as e:
+                # 순서 없는 bulk_write는 일부만 적용될 수 있으므로 실패한 연산만 다시 기록
+                failed = {keys[error["index"]] for error in e.details.get("writeErrors", [])}
+                logger.error(f"Failed to flush {len(failed)} of {len(operations)} review likes: {e}")
+            except Exception as e:
+                # 적용 여부를 알 수 없는 오류 (연결 끊김 등)는 전부 다음 주기에 다시 기록
+                failed = set(keys)
+                logger.error(f"Failed to flush {len(operations)} review likes: {e}")
+
+            # 실패한 증가분은 다음 주기에 다시 기록 (기록 중 삭제된 리뷰는 discard로 빠져 있다)
+            flushed, self._flushing = self._flushing, {}
+            for key in failed:
+                if key in flushed:
+                    self._pending[key] = self._pending.get(key, 0) + flushed.pop(key)
+            if not flushed:
+                return
+
+            # 주류별 좋아요 합계 (실패해도 리뷰에는 이미 기록되었으므로 다시 시도하지 않고 재계산 작업에 맡긴다)
+            totals: Dict[ObjectId, int] = {}
+            for (liquor_id, _), count in flushed.items():
+                totals[liquor_id] = totals.get(liquor_id, 0) + count
+            try:
+                await db[LIQUOR_COLLECTION].bulk_write(
+                    [UpdateOne({"_id": liquor_id}, {"$inc": {"review_likes": count}}) for liquor_id, count in totals.items()],
+                    ordered=False,
+                )
+            except Exception as e:
+                logger.error(f"Failed to update like totals of {len(totals)} liquors: {e}")
+            # 좋아요마다 무효화하지 않고 기록한 주류의 상세 캐시만 한 번에 무효화
+            await response_cache.invalidate(*(f"liquor:{liquor_id}" for liquor_id in totals))
+
+    def _ensure_started(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.flush()
+
+    async def stop(self):
+        """주기 작업을 멈추고 남은 증가분을 기록"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+
+like_buffer = LikeBuffer(LIKE_FLUSH_INTERVAL, LIKE_FLUSH_MAX_PENDING)
@@ -0,0 +1,315 @@
+import logging
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from pymongo import monitoring
+
+from .pool_metrics import WAIT_BUCKETS, pool_metrics
+from .response_cache import response_cache
+
+logger = logging.getLogger(__name__)
+
+# 이 시간(초)보다 오래 걸린 요청은 경고 로그를 남김 (0이면 사용 안 함)
+SLOW_REQUEST_SECONDS = float(os.getenv("SLOW_REQUEST_SECONDS", "1.0"))
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Iterable[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric(ABC):
+    """레이블 조합별 값을 가진 지표 (드라이버 스레드에서도 갱신되므로 잠금 사용)"""
+
+    type = ""
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+        self._lock = threading.Lock()
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type}"] + self._samples()
+
+    @abstractmethod
+    def _samples(self) -> List[str]:
+        """지표 이름과 레이블을 붙인 샘플 줄 목록"""
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        super().__init__(name, help, labels)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [f"{self.name}{_labels(self.label_names, labels)} {_number(value)}" for labels, value in items]
+
+
+class Gauge(Counter):
+    type = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1):
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, help, labels)
+        self.buckets = tuple(buckets)
+        # 레이블 조합 -> (구간별 개수 (마지막은 +Inf), 합계)
+        self._values: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, *labels: str):
+        with self._lock:
+            entry = self._values.get(labels)
+            if entry is None:
+                entry = self._values[labels] = ([0] * (len(self.buckets) + 1), [0.0])
+            counts, total = entry
+            index = next((i for i, bound in enumerate(self.buckets) if value <= bound), len(self.buckets))
+            counts[index] += 1
+            total[0] += value
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = [(labels, list(counts), total[0]) for labels, (counts, total) in self._values.items()]
+        lines = []
+        for labels, counts, total in items:
+            lines.extend(histogram_lines(self.name, self.label_names, labels, self.buckets, counts, total))
+        return lines
+
+
+def histogram_lines(name, label_names, labels, buckets, counts, total) -> List[str]:
+    """구간별 개수를 Prometheus 누적 버킷 형식으로 변환"""
+    lines = []
+    cumulative = 0
+    for bound, count in zip(tuple(buckets) + (float("inf"),), counts):
+        cumulative += count
+        le = 'le="%s"' % _number(bound)
+        lines.append(f"{name}_bucket{_labels(label_names, labels, le)} {cumulative}")
+    lines.append(f"{name}_sum{_labels(label_names, labels)} {_number(total)}")
+    lines.append(f"{name}_count{_labels(label_names, labels)} {cumulative}")
+    return lines
+
+
+class Registry:
+    """지표 목록과 외부 수집 함수를 모아 Prometheus 텍스트 형식으로 출력"""
+
+    def __init__(self):
+        self.metrics: List[Metric] = []
+        self.collectors: List[Callable[[], List[str]]] = []
+
+    def register(self, metric: Metric) -> Metric:
+        self.metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Callable[[], List[str]]):
+        self.collectors.append(collector)
+
+    def render(self) -> str:
+        lines = []
+        for metric in self.metrics:
+            lines.extend(metric.render())
+        for collector in self.collectors:
+            try:
+                lines.extend(collector())
+            except Exception as e:
+                logger.error(f"Metrics collector {collector.__name__} failed: {e}")
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+http_requests = registry.register(Counter(
+    "http_requests_total", "Total HTTP requests.", ("method", "route", "status"),
+))
+http_latency = registry.register(Histogram(
+    "http_request_duration_seconds", "HTTP request latency.", ("method", "route"),
+))
+http_request_size = registry.register(Histogram(
+    "http_request_size_bytes", "HTTP request body size.", ("method", "route"), SIZE_BUCKETS,
+))
+http_response_size = registry.register(Histogram(
+    "http_response_size_bytes", "HTTP response body size.", ("method", "route"), SIZE_BUCKETS,
+))
+http_in_progress = registry.register(Gauge(
+    "http_requests_in_progress", "HTTP requests currently being handled.", ("method",),
+))
+mongo_latency = registry.register(Histogram(
+    "mongodb_command_duration_seconds", "MongoDB command latency.", ("collection", "command"),
+))
+mongo_failures = registry.register(Counter(
+    "mongodb_command_failures_total", "Failed MongoDB commands.", ("collection", "command"),
+))
+
+
+class MetricsMiddleware:
+    """
+    요청별 지연 시간, 요청/응답 크기, 처리 중인 요청 수를 라우트 템플릿 단위로 기록하는 ASGI 미들웨어
+
+    경로의 ID 대신 /api/liquors/{liquor_id} 같은 템플릿을 레이블로 써서 레이블 수가 라우트 수를 넘지 않는다.
+    라우팅 결과(scope의 endpoint, path_params)를 읽으므로 응답 캐시 미들웨어 안쪽에 둔다.
+    캐시 적중 응답은 response_cache_* 지표로 집계된다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    @staticmethod
+    def route_template(scope) -> str:
+        """라우팅 후 scope의 경로 파라미터 값을 {이름}으로 바꾼 경로 (라우트가 없으면 unmatched)"""
+        if "endpoint" not in scope:
+            return "unmatched"
+        names = {str(value): name for name, value in scope.get("path_params", {}).items()}
+        return "/".join(
+            f"{{{names[segment]}}}" if segment in names else segment
+            for segment in scope["path"].split("/")
+        )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        # 처리 중인 요청 수는 라우팅 전에 기록해야 하므로 경로 템플릿 대신 메서드만 레이블로 쓴다
+        status = 500
+        request_size = 0
+        response_size = 0
+
+        async def counting_receive():
+            nonlocal request_size
+            message = await receive()
+            if message["type"] == "http.request":
+                request_size += len(message.get("body", b""))
+            return message
+
+        async def counting_send(message):
+            nonlocal status, response_size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+            await send(message)
+
+        http_in_progress.inc(method)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, counting_receive, counting_send)
+        finally:
+            elapsed = time.perf_counter() - start
+            route = self.route_template(scope)
+            http_in_progress.dec(method)
+            http_requests.inc(method, route, str(status))
+            http_latency.observe(elapsed, method, route)
+            http_request_size.observe(request_size, method, route)
+            http_response_size.observe(response_size, method, route)
+            if SLOW_REQUEST_SECONDS > 0 and elapsed >= SLOW_REQUEST_SECONDS:
+                logger.warning(f"Slow request: {method} {scope['path']} {status} took {elapsed:.3f}s")
+
+
+class CommandMetrics(monitoring.CommandListener):
+    """드라이버 명령 모니터링으로 컬렉션/명령별 MongoDB 지연 시간 기록"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # (연결, 요청 ID) -> 컬렉션 이름 (완료 이벤트에는 명령 본문이 없음)
+        self._collections: Dict[Tuple[object, int], str] = {}
+
+    @staticmethod
+    def _collection(event) -> str:
+        name = event.command_name
+        value = event.command.get("collection") if name == "getMore" else event.command.get(name)
+        return value if isinstance(value, str) else "-"
+
+    def started(self, event):
+        with self._lock:
+            self._collections[(event.connection_id, event.request_id)] = self._collection(event)
+
+    def _finish(self, event) -> Optional[str]:
+        with self._lock:
+            return self._collections.pop((event.connection_id, event.request_id), "-")
+
+    def succeeded(self, event):
+        collection = self._finish(event)
+        mongo_latency.observe(event.duration_micros / 1e6, collection, event.command_name)
+
+    def failed(self, event):
+        collection = self._finish(event)
+        mongo_latency.observe(event.duration_micros / 1e6, collection, event.command_name)
+        mongo_failures.inc(collection, event.command_name)
+
+
+command_metrics = CommandMetrics()
+
+
+def _gauge_lines(name: str, help: str, type: str, samples: List[Tuple[str, float]]) -> List[str]:
+    return [f"# HELP {name} {help}", f"# TYPE {name} {type}"] + [f"{name}{labels} {_number(value)}" for labels, value in samples]
+
+
+def collect_pool_metrics() -> List[str]:
+    """커넥션 풀 리스너(pool_metrics)의 현재 값"""
+    pools = pool_metrics.snapshot()["pools"]
+    connections = []
+    checkouts = []
+    lines = []
+    for address, pool in pools.items():
+        for state in ("open", "in_use", "waiting"):
+            connections.append((_labels(("address", "state"), (address, state)), pool[state]))
+        checkouts.append((_labels(("address",), (address,)), pool["checkouts"]))
+    lines += _gauge_lines("mongodb_pool_connections", "MongoDB pool connections by state.", "gauge", connections)
+    lines += _gauge_lines("mongodb_pool_checkouts_total", "MongoDB pool checkouts.", "counter", checkouts)
+    lines += ["# HELP mongodb_pool_checkout_wait_seconds MongoDB pool checkout wait time.",
+              "# TYPE mongodb_pool_checkout_wait_seconds histogram"]
+    for address, pool in pools.items():
+        counts = list(pool["wait_histogram"].values())
+        lines += histogram_lines(
+            "mongodb_pool_checkout_wait_seconds", ("address",), (address,),
+            WAIT_BUCKETS, counts, pool["wait_seconds_total"],
+        )
+    return lines
+
+
+def collect_cache_metrics() -> List[str]:
+    """응답 캐시 적중/미스/무효화 횟수"""
+    stats = response_cache.stats()
+    return (
+        _gauge_lines("response_cache_hits_total", "Response cache hits.", "counter", [("", stats["hits"])])
+        + _gauge_lines("response_cache_misses_total", "Response cache misses.", "counter", [("", stats["misses"])])
+        + _gauge_lines("response_cache_invalidations_total", "Response cache entries invalidated.", "counter",
+                       [("", stats["invalidations"])])
+    )
+
+
+registry.add_collector(collect_pool_metrics)
+registry.add_collector(collect_cache_metrics)
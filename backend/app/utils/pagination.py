@@ -0,0 +1,101 @@
+import base64
+import binascii
+from typing import Any, List, Optional, Sequence, Tuple
+
+from bson import json_util
+from fastapi import HTTPException
+
+# (필드 이름, 정렬 방향) 목록. 방향은 1(오름차순) 또는 -1(내림차순)
+SortSpec = Sequence[Tuple[str, int]]
+
+
+def encode_cursor(doc: dict, sort: SortSpec) -> str:
+    """문서의 정렬 키 값을 불투명한 커서 토큰으로 인코딩"""
+    values = [doc.get(field) for field, _ in sort]
+    raw = json_util.dumps(values).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, sort: SortSpec) -> List[Any]:
+    """커서 토큰을 정렬 키 값 목록으로 디코딩 (잘못된 토큰이면 400)"""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        values = json_util.loads(raw.decode("utf-8"))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(values, list) or len(values) != len(sort):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+
+def keyset_filter(sort: SortSpec, values: Sequence[Any], backward: bool = False) -> dict:
+    """
+    정렬 키가 커서 값 다음(backward면 이전)인 문서만 고르는 조건
+
+    (a, b) > (x, y) 는 a > x 또는 (a == x 이고 b > y) 로 펼쳐진다.
+    """
+    clauses = []
+    for i, (field, direction) in enumerate(sort):
+        ascending = (direction == 1) != backward
+        clause = {prev_field: values[j] for j, (prev_field, _) in enumerate(sort[:i])}
+        clause[field] = {"$gt" if ascending else "$lt": values[i]}
+        clauses.append(clause)
+    return {"$or": clauses}
+
+
+def reverse_sort(sort: SortSpec) -> List[Tuple[str, int]]:
+    return [(field, -direction) for field, direction in sort]
+
+
+def and_query(*conditions: dict) -> dict:
+    """비어 있지 않은 조건들을 $and로 결합"""
+    conditions = [condition for condition in conditions if condition]
+    if not conditions:
+        return {}
+    if len(conditions) == 1:
+        return conditions[0]
+    return {"$and": conditions}
+
+
+async def fetch_page(collection, query: dict, sort: SortSpec, limit: int,
+                     cursor: Optional[str] = None, backward: bool = False,
+                     projection: Optional[dict] = None):
+    """
+    키셋 페이지네이션으로 한 페이지 조회
+
+    (문서 목록, 다음 페이지 커서, 이전 페이지 커서)를 반환한다. 더 이상 페이지가
+    없는 방향의 커서는 None이다.
+    """
+    if cursor:
+        query = and_query(query, keyset_filter(sort, decode_cursor(cursor, sort), backward))
+
+    if projection is not None:
+        projection = {**projection, **{field: 1 for field, _ in sort}}
+
+    order = reverse_sort(sort) if backward else list(sort)
+    docs = await collection.find(query, projection).sort(order).limit(limit + 1).to_list(limit + 1)
+
+    has_more = len(docs) > limit
+    docs = docs[:limit]
+    if backward:
+        docs.reverse()
+
+    if not docs:
+        return docs, None, None
+
+    first, last = encode_cursor(docs[0], sort), encode_cursor(docs[-1], sort)
+    if backward:
+        next_cursor = last if cursor else None
+        prev_cursor = first if has_more else None
+    else:
+        next_cursor = last if has_more else None
+        prev_cursor = first if cursor else None
+    return docs, next_cursor, prev_cursor
+
+
+def stream_cursor(collection, query: dict, sort: SortSpec, batch_size: int,
+                  cursor: Optional[str] = None, projection: Optional[dict] = None):
+    """커서 토큰 다음부터 끝까지 정렬 순서대로 읽는 MongoDB 커서 (스트리밍 응답용)"""
+    if cursor:
+        query = and_query(query, keyset_filter(sort, decode_cursor(cursor, sort)))
+    return collection.find(query, projection, batch_size=batch_size).sort(list(sort))
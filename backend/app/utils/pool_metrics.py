@@ -0,0 +1,124 @@
+import os
+import threading
+from typing import Dict, Tuple
+
+from pymongo import monitoring
+from pymongo.common import MAX_POOL_SIZE
+
+# 커넥션 대기 시간 히스토그램 구간 (초)
+WAIT_BUCKETS: Tuple[float, ...] = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+
+def _new_pool() -> dict:
+    return {
+        "max_size": None,
+        "open": 0,
+        "in_use": 0,
+        "max_in_use": 0,
+        "waiting": 0,
+        "max_waiting": 0,
+        "checkouts": 0,
+        "checkout_failures": {},
+        "wait_seconds_total": 0.0,
+        "wait_seconds_max": 0.0,
+        # 구간별 개수 (마지막은 +Inf)
+        "wait_buckets": [0] * (len(WAIT_BUCKETS) + 1),
+        "cleared": 0,
+    }
+
+
+class PoolMetrics(monitoring.ConnectionPoolListener):
+    """
+    드라이버 커넥션 풀 이벤트로 서버별 사용 중인 커넥션 수와 체크아웃 대기 시간을 집계
+
+    드라이버가 백그라운드 스레드에서도 이벤트를 보내므로 잠금으로 보호한다.
+    값은 워커 프로세스마다 따로 집계된다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pools: Dict[str, dict] = {}
+
+    def _pool(self, address) -> dict:
+        key = f"{address[0]}:{address[1]}"
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = self._pools[key] = _new_pool()
+        return pool
+
+    def pool_created(self, event):
+        # 이벤트 옵션에는 기본값과 다른 항목만 들어 있으므로 없으면 드라이버 기본값 (MONGODB_MAX_POOL_SIZE=100일 때도 빠짐)
+        with self._lock:
+            self._pool(event.address)["max_size"] = event.options.get("maxPoolSize", MAX_POOL_SIZE)
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        with self._lock:
+            self._pool(event.address)["cleared"] += 1
+
+    def pool_closed(self, event):
+        with self._lock:
+            self._pools.pop(f"{event.address[0]}:{event.address[1]}", None)
+
+    def connection_created(self, event):
+        with self._lock:
+            self._pool(event.address)["open"] += 1
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        with self._lock:
+            pool = self._pool(event.address)
+            pool["open"] = max(pool["open"] - 1, 0)
+
+    def connection_check_out_started(self, event):
+        with self._lock:
+            pool = self._pool(event.address)
+            pool["waiting"] += 1
+            pool["max_waiting"] = max(pool["max_waiting"], pool["waiting"])
+
+    def connection_check_out_failed(self, event):
+        with self._lock:
+            pool = self._pool(event.address)
+            pool["waiting"] = max(pool["waiting"] - 1, 0)
+            failures = pool["checkout_failures"]
+            failures[event.reason] = failures.get(event.reason, 0) + 1
+
+    def connection_checked_out(self, event):
+        with self._lock:
+            pool = self._pool(event.address)
+            pool["waiting"] = max(pool["waiting"] - 1, 0)
+            pool["in_use"] += 1
+            pool["max_in_use"] = max(pool["max_in_use"], pool["in_use"])
+            pool["checkouts"] += 1
+            # duration은 pymongo 4.7부터 제공
+            duration = getattr(event, "duration", None)
+            if duration is not None:
+                pool["wait_seconds_total"] += duration
+                pool["wait_seconds_max"] = max(pool["wait_seconds_max"], duration)
+                index = next((i for i, bound in enumerate(WAIT_BUCKETS) if duration <= bound), len(WAIT_BUCKETS))
+                pool["wait_buckets"][index] += 1
+
+    def connection_checked_in(self, event):
+        with self._lock:
+            pool = self._pool(event.address)
+            pool["in_use"] = max(pool["in_use"] - 1, 0)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            pools = {}
+            for address, pool in self._pools.items():
+                pool = dict(pool, checkout_failures=dict(pool["checkout_failures"]))
+                buckets = pool.pop("wait_buckets")
+                pool["wait_histogram"] = {
+                    **{str(bound): count for bound, count in zip(WAIT_BUCKETS, buckets)},
+                    "+Inf": buckets[-1],
+                }
+                pools[address] = pool
+        return {"pid": os.getpid(), "pools": pools}
+
+
+pool_metrics = PoolMetrics()
@@ -0,0 +1,256 @@
+import hashlib
+import os
+import re
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Pattern, Sequence, Set, Tuple
+from urllib.parse import parse_qsl, urlencode
+
+# 캐시 항목 유효 시간 (초). 다른 워커에서 일어난 변경은 최대 이 시간만큼 늦게 반영된다
+RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL", "30"))
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "2048"))
+
+# 캐시 대상 경로와 무효화 태그 (태그의 {id}는 경로의 id 그룹으로 채움)
+CACHE_RULES: List[Tuple[Pattern, str]] = [
+    (re.compile(r"^/api/liquors$"), "liquors"),
+    (re.compile(r"^/api/liquors/(?P<id>[0-9a-f]{24})(/reviews|/stores)?$"), "liquor:{id}"),
+]
+
+# 캐시된 응답에 다시 붙이지 않는 헤더
+_SKIPPED_HEADERS = {b"content-length", b"etag", b"x-cache"}
+
+
+@dataclass
+class CachedResponse:
+    body: bytes
+    headers: List[Tuple[bytes, bytes]]
+    etag: str
+
+
+class CacheBackend(ABC):
+    """응답 캐시 저장소 인터페이스 (Redis 등 외부 저장소로 교체 가능)"""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, value: CachedResponse, ttl: float, tags: Iterable[str]):
+        ...
+
+    @abstractmethod
+    async def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """태그가 붙은 항목을 삭제하고 삭제한 개수 반환"""
+
+    @abstractmethod
+    async def clear(self):
+        ...
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """TTL과 LRU 제거를 지원하는 프로세스 내 캐시"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.evictions = 0
+        self._entries: "OrderedDict[str, Tuple[float, CachedResponse, Tuple[str, ...]]]" = OrderedDict()
+        self._tags: Dict[str, Set[str]] = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value, _ = entry
+        if expires_at < time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: CachedResponse, ttl: float, tags: Iterable[str]):
+        self._remove(key)
+        tags = tuple(tags)
+        self._entries[key] = (time.monotonic() + ttl, value, tags)
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> int:
+        removed = 0
+        for tag in tags:
+            for key in list(self._tags.get(tag, ())):
+                self._remove(key)
+                removed += 1
+        return removed
+
+    async def clear(self):
+        self._entries.clear()
+        self._tags.clear()
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[2]:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+
+class ResponseCache:
+    """경로 규칙, 키 정규화, 적중률 통계를 담당하는 응답 캐시"""
+
+    def __init__(self, backend: CacheBackend, ttl: float, rules: Sequence[Tuple[Pattern, str]]):
+        self.backend = backend
+        self.ttl = ttl
+        self.rules = rules
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        # 무효화가 일어날 때마다 증가 (응답 생성 중 무효화된 결과를 저장하지 않기 위함)
+        self.generation = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def match(self, path: str) -> Optional[str]:
+        """캐시 대상 경로면 무효화 태그 반환"""
+        for pattern, tag in self.rules:
+            match = pattern.match(path)
+            if match:
+                return tag.format(**match.groupdict())
+        return None
+
+    @staticmethod
+    def key(path: str, query_string: bytes) -> str:
+        """경로와 정렬된 쿼리 파라미터로 만든 캐시 키"""
+        query = sorted(parse_qsl(query_string.decode("latin-1"), keep_blank_values=True))
+        return f"{path}?{urlencode(query)}"
+
+    async def invalidate(self, *tags: str):
+        self.generation += 1
+        self.invalidations += await self.backend.invalidate_tags(tags)
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        stats = {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / total if total else 0.0,
+            "invalidations": self.invalidations,
+        }
+        if isinstance(self.backend, InMemoryCacheBackend):
+            stats["entries"] = len(self.backend)
+            stats["evictions"] = self.backend.evictions
+        return stats
+
+
+def _etag_matches(if_none_match: Optional[bytes], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.decode("latin-1").split(",")]
+    return etag in tags or f"W/{etag}" in tags or "*" in tags
+
+
+class ResponseCacheMiddleware:
+    """
+    GET JSON 응답을 캐시하고 ETag / If-None-Match로 304를 돌려주는 ASGI 미들웨어
+
+    데이터를 바꾸는 핸들러는 response_cache.invalidate()로 관련 태그를 무효화한다.
+    """
+
+    def __init__(self, app, cache: "ResponseCache"):
+        self.app = app
+        self.cache = cache
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "GET" or not self.cache.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        tag = self.cache.match(scope["path"])
+        if tag is None:
+            await self.app(scope, receive, send)
+            return
+
+        # NDJSON 스트리밍 요청은 캐시하지 않는다 (캐시 키에 Accept가 없으므로 JSON 응답을 돌려주면 안 됨)
+        headers = dict(scope["headers"])
+        if b"application/x-ndjson" in headers.get(b"accept", b""):
+            await self.app(scope, receive, send)
+            return
+
+        key = self.cache.key(scope["path"], scope.get("query_string", b""))
+        if_none_match = headers.get(b"if-none-match")
+
+        cached = await self.cache.backend.get(key)
+        if cached is not None:
+            self.cache.hits += 1
+            await self._send(send, cached, if_none_match, b"HIT")
+            return
+
+        self.cache.misses += 1
+        generation = self.cache.generation
+        start_message = None
+        body = []
+
+        async def capture(message):
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                start_message = message
+            elif message["type"] == "http.response.body":
+                body.append(message.get("body", b""))
+
+        await self.app(scope, receive, capture)
+
+        headers = [
+            (name, value) for name, value in start_message.get("headers", [])
+            if name.lower() not in _SKIPPED_HEADERS
+        ]
+        content = b"".join(body)
+        status = start_message["status"]
+        content_type = dict(headers).get(b"content-type", b"")
+
+        if status != 200 or not content_type.startswith(b"application/json"):
+            await send({**start_message, "headers": headers + [(b"content-length", str(len(content)).encode())]})
+            await send({"type": "http.response.body", "body": content})
+            return
+
+        response = CachedResponse(
+            body=content,
+            headers=headers,
+            etag=f'"{hashlib.sha1(content).hexdigest()}"',
+        )
+        # 응답을 만드는 동안 무효화가 있었다면 이전 데이터일 수 있으므로 저장하지 않는다
+        if generation == self.cache.generation:
+            await self.cache.backend.set(key, response, self.cache.ttl, (tag,))
+        await self._send(send, response, if_none_match, b"MISS")
+
+    @staticmethod
+    async def _send(send, response: CachedResponse, if_none_match: Optional[bytes], state: bytes):
+        headers = response.headers + [(b"etag", response.etag.encode()), (b"x-cache", state)]
+        if _etag_matches(if_none_match, response.etag):
+            headers = [(name, value) for name, value in headers if name.lower() != b"content-type"]
+            await send({"type": "http.response.start", "status": 304, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        headers.append((b"content-length", str(len(response.body)).encode()))
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": response.body})
+
+
+response_cache = ResponseCache(
+    InMemoryCacheBackend(RESPONSE_CACHE_MAX_ENTRIES),
+    RESPONSE_CACHE_TTL,
+    CACHE_RULES,
+)
@@ -0,0 +1,350 @@
+import asyncio
+import heapq
+import html
+import logging
+import math
+import os
+import re
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from bson import ObjectId
+
+from ..database import Database, LIQUOR_COLLECTION, REVIEW_COLLECTION
+from .synced_index import SyncedIndex
+
+logger = logging.getLogger(__name__)
+
+# 필드별 가중치 (리뷰는 여러 개가 합산되므로 낮게 둔다)
+FIELD_WEIGHTS = {"name": 3.0, "description": 1.0, "review": 0.5}
+
+# 토큰 점수 포화 상수 (가중치 w는 w / (w + K)로 반영되어 리뷰가 많아도 점수가 무한정 커지지 않음)
+SATURATION = 1.0
+
+# 하이라이트 스니펫 길이 (글자 수)
+SNIPPET_LENGTH = 80
+
+# 다른 워커의 쓰기를 반영하는 동기화 주기 (초, 0이면 최초 로드 후 동기화하지 않음)
+SEARCH_INDEX_SYNC_INTERVAL = float(os.getenv("SEARCH_INDEX_SYNC_INTERVAL", "60"))
+# 동기화 시 한 번에 다시 색인하는 주류 수와 이벤트 루프에 양보하는 리뷰 간격
+SYNC_BATCH_LIQUORS = 200
+SYNC_YIELD_REVIEWS = 200
+# 수정된 리뷰를 찾을 때 이전 동기화 시작 시각보다 이만큼 앞에서부터 찾는다 (워커 간 시계 차이, 늦게 끝난 쓰기)
+SYNC_CLOCK_SKEW = timedelta(seconds=30)
+# 다시 색인하는 동안 이 워커에서 바뀐 주류를 같은 동기화 안에서 다시 시도하는 횟수
+SYNC_RETRY_ROUNDS = 2
+
+_WORD = re.compile(r"\w+")
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """
+    소문자로 바꾼 단어를 2-gram으로 분해
+
+    한국어는 띄어쓰기와 조사가 불규칙하므로 형태소 분석 대신 겹치는 두 글자 조각을 토큰으로 쓴다.
+    한 글자 단어는 그대로 토큰이 된다.
+    """
+    tokens = []
+    for word in _WORD.findall((text or "").lower()):
+        if len(word) == 1:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+def _weights(fields: Iterable[Tuple[str, Optional[str]]]) -> Dict[str, float]:
+    """(필드, 텍스트) 목록의 토큰 가중치 (필드 안에서 같은 토큰은 한 번만 셈)"""
+    weights: Dict[str, float] = {}
+    for field, text in fields:
+        for token in set(tokenize(text)):
+            weights[token] = weights.get(token, 0.0) + FIELD_WEIGHTS[field]
+    return weights
+
+
+def highlight(text: Optional[str], query_tokens: Set[str], snippet: bool = False) -> Optional[str]:
+    """
+    질의 토큰과 겹치는 구간을 <em>으로 감싼 HTML 반환 (겹치는 곳이 없으면 None)
+
+    snippet이면 첫 일치 위치 주변 SNIPPET_LENGTH 글자만 잘라낸다.
+    """
+    if not text:
+        return None
+    lower = text.lower()
+    marked = [False] * len(text)
+    for i in range(len(lower)):
+        # 마지막 글자에서는 두 글자 조각이 만들어지지 않는다 (한 글자 토큰만 확인)
+        if i + 1 < len(lower) and lower[i:i + 2] in query_tokens:
+            marked[i] = marked[i + 1] = True
+        elif lower[i] in query_tokens:
+            marked[i] = True
+    if not any(marked):
+        return None
+
+    start, end = 0, len(text)
+    if snippet and len(text) > SNIPPET_LENGTH:
+        first = marked.index(True)
+        start = max(0, min(first - SNIPPET_LENGTH // 4, len(text) - SNIPPET_LENGTH))
+        end = start + SNIPPET_LENGTH
+
+    parts = ["…"] if start > 0 else []
+    i = start
+    while i < end:
+        j = i
+        while j < end and marked[j] == marked[i]:
+            j += 1
+        chunk = html.escape(text[i:j])
+        parts.append(f"<em>{chunk}</em>" if marked[i] else chunk)
+        i = j
+    if end < len(text):
+        parts.append("…")
+    return "".join(parts)
+
+
+class SearchIndex(SyncedIndex):
+    """
+    주류 이름, 설명, 리뷰 내용에 대한 프로세스 내 역색인
+
+    리뷰는 주류 단위로 합산해서 색인하므로 게시 목록의 크기는 리뷰 수가 아니라 주류 수에 비례한다.
+    리뷰를 수정/삭제할 때는 이전 내용을 넘겨받아 그만큼 가중치를 뺀다.
+    동기화는 주류별 (updated_at, review_count)와 최근 수정된 리뷰로 바뀐 주류만 찾아 DB에서 다시 색인한다.
+    """
+
+    name = "search index"
+
+    def __init__(self, interval: float = SEARCH_INDEX_SYNC_INTERVAL):
+        super().__init__(interval)
+        # 토큰 -> {주류 ID: 가중치}
+        self._postings: Dict[str, Dict[ObjectId, float]] = {}
+        # 주류 ID -> {토큰: 가중치} (주류 삭제 시 게시 목록 정리에 사용)
+        self._forward: Dict[ObjectId, Dict[str, float]] = {}
+        # 글자 -> 그 글자를 포함하는 두 글자 토큰 (한 글자 질의를 더 긴 단어와 맞추기 위함)
+        self._by_char: Dict[str, Set[str]] = {}
+        # 주류 ID -> 이름/설명 토큰 가중치 (주류 정보가 바뀔 때 이전 값을 빼기 위함)
+        self._fields: Dict[ObjectId, Dict[str, float]] = {}
+        # 주류 ID -> DB에서 색인할 때의 (updated_at, review_count)
+        self._versions: Dict[ObjectId, tuple] = {}
+        # 이 시각 이후에 수정된 리뷰의 주류를 다시 색인 (첫 동기화 전에는 None)
+        self._reviews_since: Optional[datetime] = None
+
+    def __len__(self):
+        return len(self._forward)
+
+    def _postings_for_write(self, token: str) -> Dict[ObjectId, float]:
+        postings = self._postings.get(token)
+        if postings is None:
+            postings = self._postings[token] = {}
+            if len(token) == 2:
+                for char in set(token):
+                    self._by_char.setdefault(char, set()).add(token)
+        return postings
+
+    def _drop_if_empty(self, token: str, postings: Dict[ObjectId, float]):
+        if postings:
+            return
+        del self._postings[token]
+        if len(token) == 2:
+            for char in set(token):
+                tokens = self._by_char.get(char)
+                if tokens is not None:
+                    tokens.discard(token)
+                    if not tokens:
+                        del self._by_char[char]
+
+    def _postings_for_query(self, token: str) -> Dict[ObjectId, float]:
+        """
+        질의 토큰의 게시 목록
+
+        한 글자 토큰은 그 글자를 포함하는 두 글자 토큰의 게시 목록을 합친다 ("술"로 "술이에요"를 찾음).
+        같은 주류가 여러 토큰에 있으면 가중치가 가장 큰 값을 쓴다.
+        """
+        if len(token) != 1:
+            return self._postings.get(token) or {}
+        merged = dict(self._postings.get(token, {}))
+        for bigram in self._by_char.get(token, ()):
+            for liquor_id, weight in self._postings[bigram].items():
+                if weight > merged.get(liquor_id, 0.0):
+                    merged[liquor_id] = weight
+        return merged
+
+    def _apply(self, liquor_id: ObjectId, weights: Dict[str, float], sign: float):
+        forward = self._forward.setdefault(liquor_id, {})
+        for token, weight in weights.items():
+            value = forward.get(token, 0.0) + sign * weight
+            postings = self._postings_for_write(token)
+            if value > 1e-9:
+                forward[token] = value
+                postings[liquor_id] = value
+            else:
+                forward.pop(token, None)
+                postings.pop(liquor_id, None)
+                self._drop_if_empty(token, postings)
+
+    def add_liquor(self, liquor_id: ObjectId, name: Optional[str], description: Optional[str]):
+        previous = self._fields.pop(liquor_id, None)
+        if previous:
+            self._apply(liquor_id, previous, -1)
+        weights = _weights((("name", name), ("description", description)))
+        self._fields[liquor_id] = weights
+        self._apply(liquor_id, weights, 1)
+
+    def remove_liquor(self, liquor_id: ObjectId):
+        self._fields.pop(liquor_id, None)
+        for token in self._forward.pop(liquor_id, {}):
+            postings = self._postings.get(token)
+            if postings is not None:
+                postings.pop(liquor_id, None)
+                self._drop_if_empty(token, postings)
+
+    def add_review(self, liquor_id: ObjectId, content: Optional[str], previous: Optional[str] = None):
+        if previous is not None:
+            self.remove_review(liquor_id, previous)
+        self._apply(liquor_id, _weights((("review", content),)), 1)
+
+    def remove_review(self, liquor_id: ObjectId, content: Optional[str]):
+        if liquor_id in self._forward:
+            self._apply(liquor_id, _weights((("review", content),)), -1)
+
+    def search(self, query: str, limit: int, offset: int = 0) -> Tuple[int, List[Tuple[ObjectId, float]]]:
+        """
+        (전체 결과 수, [(주류 ID, 점수)]) 반환
+
+        점수는 토큰별 idf * 포화된 가중치의 합에 질의 토큰 포함 비율의 제곱을 곱한 값이다.
+        """
+        tokens = set(tokenize(query))
+        if not tokens:
+            return 0, []
+
+        total_docs = max(len(self._forward), 1)
+        scores: Dict[ObjectId, float] = {}
+        matched: Dict[ObjectId, int] = {}
+        for token in tokens:
+            postings = self._postings_for_query(token)
+            if not postings:
+                continue
+            idf = math.log(1 + total_docs / len(postings))
+            for liquor_id, weight in postings.items():
+                scores[liquor_id] = scores.get(liquor_id, 0.0) + idf * weight / (weight + SATURATION)
+                matched[liquor_id] = matched.get(liquor_id, 0) + 1
+
+        count = len(tokens)
+        top = heapq.nlargest(
+            offset + limit,
+            ((score * (matched[liquor_id] / count) ** 2, liquor_id) for liquor_id, score in scores.items()),
+            key=lambda item: item[0],
+        )
+        return len(scores), [(liquor_id, score) for score, liquor_id in top[offset:]]
+
+    def _replace_liquor(self, liquor_id: ObjectId, fields: Dict[str, float], reviews: Dict[str, float]):
+        self.remove_liquor(liquor_id)
+        self._fields[liquor_id] = fields
+        self._apply(liquor_id, fields, 1)
+        self._apply(liquor_id, reviews, 1)
+
+    async def _reindex(self, liquor_ids: List[ObjectId], versions: Dict[ObjectId, tuple]) -> List[ObjectId]:
+        """
+        주류들의 이름/설명과 리뷰 전체를 DB에서 읽어 다시 색인하고, 읽는 동안 이 워커에서 바뀐 주류 목록 반환
+
+        토큰 가중치는 지역 변수에 합산하며 리뷰 SYNC_YIELD_REVIEWS개마다 이벤트 루프에 양보하고,
+        인덱스 교체는 주류마다 await 없이 한 번에 한다.
+        """
+        db = Database.get_db()
+        self._touched.difference_update(liquor_ids)
+        fields = {}
+        cursor = db[LIQUOR_COLLECTION].find({"_id": {"$in": liquor_ids}}, {"name": 1, "description": 1})
+        async for doc in cursor:
+            fields[doc["_id"]] = _weights((("name", doc.get("name")), ("description", doc.get("description"))))
+
+        reviews: Dict[ObjectId, Dict[str, float]] = {liquor_id: {} for liquor_id in fields}
+        review_weight = FIELD_WEIGHTS["review"]
+        count = 0
+        cursor = db[REVIEW_COLLECTION].find(
+            {"liquor_id": {"$in": list(fields)}}, {"liquor_id": 1, "content": 1}, batch_size=5000
+        )
+        async for doc in cursor:
+            weights = reviews.get(doc.get("liquor_id"))
+            if weights is None:
+                continue
+            for token in set(tokenize(doc.get("content"))):
+                weights[token] = weights.get(token, 0.0) + review_weight
+            count += 1
+            if count % SYNC_YIELD_REVIEWS == 0:
+                await asyncio.sleep(0)
+
+        touched = []
+        for liquor_id in liquor_ids:
+            if liquor_id in self._touched:
+                # 읽은 값에 이 쓰기가 들어 있는지 알 수 없으므로 다시 읽는다
+                touched.append(liquor_id)
+            elif liquor_id not in fields:
+                # 읽는 사이에 다른 워커에서 삭제됨
+                self.remove_liquor(liquor_id)
+                self._versions.pop(liquor_id, None)
+            else:
+                self._replace_liquor(liquor_id, fields[liquor_id], reviews[liquor_id])
+                self._versions[liquor_id] = versions[liquor_id]
+        return touched
+
+    async def sync(self):
+        """바뀐 주류만 DB에서 다시 색인 (첫 동기화에서는 전체)"""
+        db = Database.get_db()
+        started = datetime.utcnow()
+
+        # 주류별 버전 (리뷰 추가/삭제는 review_count, 주류 수정은 updated_at이 바뀐다)
+        versions: Dict[ObjectId, tuple] = {}
+        cursor = db[LIQUOR_COLLECTION].find({}, {"updated_at": 1, "review_count": 1}, batch_size=5000)
+        async for doc in cursor:
+            versions[doc["_id"]] = (doc.get("updated_at"), doc.get("review_count"))
+        changed = {liquor_id for liquor_id, version in versions.items() if self._versions.get(liquor_id) != version}
+
+        # 내용이 수정된 리뷰 (리뷰 수는 그대로이므로 따로 찾는다)
+        if self._reviews_since is not None:
+            cursor = db[REVIEW_COLLECTION].find({"updated_at": {"$gte": self._reviews_since}}, {"liquor_id": 1})
+            async for doc in cursor:
+                if doc.get("liquor_id") in versions:
+                    changed.add(doc["liquor_id"])
+
+        # 다른 워커에서 삭제된 주류 (동기화 중 이 워커에서 만든 주류는 목록에 없을 수 있으므로 제외)
+        for liquor_id in (set(self._forward) | set(self._versions)) - set(versions) - self._touched:
+            self.remove_liquor(liquor_id)
+            self._versions.pop(liquor_id, None)
+
+        pending = list(changed)
+        for _ in range(1 + SYNC_RETRY_ROUNDS):
+            retry = []
+            for start in range(0, len(pending), SYNC_BATCH_LIQUORS):
+                retry.extend(await self._reindex(pending[start:start + SYNC_BATCH_LIQUORS], versions))
+            pending = retry
+            if not pending:
+                break
+        # 계속 바뀌는 주류는 다음 동기화에서 다시 색인
+        for liquor_id in pending:
+            self._versions.pop(liquor_id, None)
+
+        self._reviews_since = started - SYNC_CLOCK_SKEW
+        logger.info(f"Synced {len(changed)} of {len(versions)} liquors into the search index")
+
+    # 라우터에서 호출하는 갱신 훅 (아직 로드 전이면 로드할 때 반영되므로 무시)
+
+    def on_liquor_write(self, liquor_id: ObjectId, name: Optional[str], description: Optional[str]):
+        if self.active:
+            self.touch(liquor_id)
+            self.add_liquor(liquor_id, name, description)
+
+    def on_liquor_delete(self, liquor_id: ObjectId):
+        if self.active:
+            self.touch(liquor_id)
+            self.remove_liquor(liquor_id)
+
+    def on_review_write(self, liquor_id: ObjectId, content: str, previous: Optional[str] = None):
+        if self.active:
+            self.touch(liquor_id)
+            self.add_review(liquor_id, content, previous)
+
+    def on_review_delete(self, liquor_id: ObjectId, content: str):
+        if self.active:
+            self.touch(liquor_id)
+            self.remove_review(liquor_id, content)
+
+
+search_index = SearchIndex()
@@ -0,0 +1,91 @@
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from typing import Optional, Set
+
+from bson import ObjectId
+
+logger = logging.getLogger(__name__)
+
+
+class SyncedIndex(ABC):
+    """
+    MongoDB 데이터로 만든 프로세스 내 인덱스의 공통 동기화 로직
+
+    gunicorn 워커마다 인덱스를 따로 가지므로, 최초 사용 시 sync로 전체를 읽고 이후에는 interval마다
+    백그라운드에서 sync를 다시 실행해 다른 워커의 쓰기를 반영한다.
+    sync가 DB를 읽는 동안 이 워커의 쓰기 훅이 바꾼 주류는 touched에 남으므로, sync는 읽기 전에 바뀐 값으로
+    이 주류를 덮어쓰거나 같은 쓰기를 두 번 반영하지 않도록 touched를 확인해야 한다.
+    """
+
+    name = "index"
+
+    def __init__(self, interval: float):
+        # 0이면 최초 로드 후 다시 동기화하지 않음
+        self.interval = interval
+        self.loaded = False
+        self._syncing = False
+        self._touched: Set[ObjectId] = set()
+        self._synced_at = 0.0
+        self._load_lock: Optional[asyncio.Lock] = None
+        self._sync_task: Optional[asyncio.Task] = None
+
+    @abstractmethod
+    async def sync(self):
+        """DB의 현재 상태를 인덱스에 반영"""
+
+    @property
+    def active(self) -> bool:
+        """쓰기 훅을 반영해야 하는지 (로드 전이면 로드할 때 반영되므로 무시)"""
+        return self.loaded or self._syncing
+
+    def touch(self, liquor_id: ObjectId):
+        """쓰기 훅에서 호출 (동기화 중이면 해당 주류를 기록)"""
+        if self._syncing:
+            self._touched.add(liquor_id)
+
+    async def ensure_loaded(self):
+        """최초 사용 시 전체를 읽어 인덱스 구성 (interval이 지났으면 백그라운드에서 동기화 시작)"""
+        if self.loaded:
+            if (
+                self.interval > 0
+                and (self._sync_task is None or self._sync_task.done())
+                and time.monotonic() - self._synced_at > self.interval
+            ):
+                self._sync_task = asyncio.ensure_future(self._sync_in_background())
+            return
+        if self._load_lock is None:
+            self._load_lock = asyncio.Lock()
+        async with self._load_lock:
+            if self.loaded:
+                return
+            await self._run_sync()
+            self.loaded = True
+
+    async def _run_sync(self):
+        self._syncing = True
+        self._touched = set()
+        try:
+            await self.sync()
+        finally:
+            self._syncing = False
+            self._touched = set()
+            # 실패해도 interval 동안은 다시 시도하지 않음
+            self._synced_at = time.monotonic()
+
+    async def _sync_in_background(self):
+        try:
+            await self._run_sync()
+        except Exception as e:
+            logger.error(f"Failed to sync the {self.name}: {e}")
+
+    async def stop(self):
+        """진행 중인 백그라운드 동기화 취소"""
+        if self._sync_task is not None:
+            self._sync_task.cancel()
+            try:
+                await self._sync_task
+            except asyncio.CancelledError:
+                pass
+            self._sync_task = None
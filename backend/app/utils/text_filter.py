@@ -1,5 +1,18 @@
+import asyncio
+import os
 import re
+import time
+import unicodedata
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Sequence
 from ..database import Database, FILTER_COLLECTION
+from .keyword_matcher import KeywordMatcher
+from .contact_scanner import ContactScanner
+
+# 필터 단어가 변경되지 않아도 매처를 다시 읽어오는 주기 (초, 다른 워커의 변경 반영용)
+FILTER_MATCHER_TTL = float(os.getenv("FILTER_MATCHER_TTL", "60"))
+# 정규화 결과를 캐시할 텍스트 수 (같은 텍스트의 반복 검사, 도배 대비)
+NORMALIZE_CACHE_SIZE = int(os.getenv("NORMALIZE_CACHE_SIZE", "4096"))
 
 # 비속어 목록 (예시)
 PROFANITY_WORDS = {
@@ -14,47 +27,211 @@ AD_KEYWORDS = {
     '전화번호', '연락처', '문의전화'
 }
 
+# 카테고리별 거부 메시지
+REJECT_MESSAGES = {
+    "profanity": "비속어가 포함되어 있습니다.",
+    "ad": "광고성 내용이 포함되어 있습니다.",
+}
+
+# 보이지 않는 서식 문자 (soft hyphen, zero-width space/joiner, 방향 제어 문자, BOM)
+_INVISIBLE = re.compile("[\u00ad\u180e\u200b-\u200f\u202a-\u202e\u2060-\u206f\ufeff]")
+_REPEATED = re.compile(r"(.)\1+")
+_PUNCTUATION = re.compile(r"[^\w\s]|_")
+# 글자와 숫자가 이어진 조각 (공백, 문장부호, 기호가 단어를 나눈다)
+_WORD_PART = re.compile(r"[^\W_]+")
+# 결합 부호 (글자 사이에 끼워 넣어도 단어를 나누지 않도록 먼저 지운다)
+_COMBINING = re.compile("[\u0300-\u036f\u1ab0-\u1aff\u1dc0-\u1dff\u20d0-\u20ff\ufe20-\ufe2f]")
+# 앞 글자에 붙어 같은 음절을 이루는 자모 ("ㅂㅏㄹ"은 NFKC 뒤 "바"와 초성 ㄹ이 되지만 한 음절이다)
+_ATTACHED_JAMO = re.compile("(?<=.)[\u1100-\u11ff]")
+
+# 모음 뒤에 오고 뒤에 모음이 없는 초성은 받침으로 바꾼다 ("ㄱㅘㅇ고"와 "광고"를 같은 자모열로 만듦)
+# NFKC 뒤에도 음절로 합쳐지지 않은 초성은 자모로 나눠 쓴 텍스트에만 있다
+_LOOSE_INITIAL = re.compile("[\u1100-\u1112]")
+_TRAILING_INITIAL = re.compile("(?<=[\u1161-\u1175])([\u1100-\u1112])(?![\u1161-\u1175])")
+
+def _initial_to_final() -> Dict[str, str]:
+    table = {}
+    for code in range(0x1100, 0x1113):
+        name = unicodedata.name(chr(code)).replace("CHOSEONG", "JONGSEONG")
+        try:
+            table[chr(code)] = unicodedata.lookup(name)
+        except KeyError:  # 대응하는 받침이 없는 초성
+            pass
+    return table
+
+_FINALS = _initial_to_final()
+# 받침 (이 자모가 뒤따르면 일치가 음절 중간에서 끝난 것이다: "특가"는 "특강"과 일치하지 않음)
+_JONGSEONG = frozenset(chr(code) for code in range(0x11A8, 0x11C3))
+
+def _join_words(text: str) -> str:
+    """
+    조각 사이를 공백 하나로 남기되, 한 음절 조각이 이어지면 붙인다
+
+    "광 고", "광.고"는 "광고"가 되지만 "처음 광 고민했는데"나 "맛이 독특 가격도"처럼
+    여러 글자 단어의 경계는 남겨 두어 단어에 걸친 일치("광고", "특가")를 막는다.
+    """
+    parts = []
+    previous_single = False
+    for word in _WORD_PART.findall(text):
+        single = len(word) - len(_ATTACHED_JAMO.findall(word)) <= 1
+        if single and previous_single:
+            parts[-1] += word
+        else:
+            parts.append(word)
+        previous_single = single
+    return " ".join(parts)
+
+def fold_text(text: str) -> str:
+    """호환 문자(전각 영숫자 등) 통일, 소문자화, 보이지 않는 문자 제거 (문장부호는 유지)"""
+    return _INVISIBLE.sub("", unicodedata.normalize("NFKC", text)).lower()
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def normalize_text(text: str) -> str:
+    """
+    키워드 매칭용 정규화
+
+    fold_text 뒤 공백/문장부호/기호로 나눈 조각을 공백 하나로 잇고 한 음절 조각끼리는 붙인 다음("광 고", "광.고" -> "광고"),
+    연속된 같은 글자를 하나로 줄이고("광고고고" -> "광고") 한글을 자모로 분해한다.
+    자모로 나눠 쓴 글자("ㄱㅘㅇ고")도 같은 자모열이 된다.
+    필터 단어와 입력 텍스트에 똑같이 적용하므로 변형마다 단어를 따로 등록할 필요가 없다.
+    """
+    # 글자와 숫자 조각만 남긴다 (공백, 문장부호, 기호는 단어 경계가 되고 결합 부호는 지움)
+    text = _REPEATED.sub(r"\1", _join_words(_COMBINING.sub("", fold_text(text))))
+    split_jamo = _LOOSE_INITIAL.search(text) is not None
+    text = unicodedata.normalize("NFKD", text)
+    if split_jamo:
+        text = _TRAILING_INITIAL.sub(lambda m: _FINALS.get(m.group(1), m.group(1)), text)
+    return text
+
+def is_fragment(word: str) -> bool:
+    """문장부호가 있어 정규화하면 뜻이 바뀌는 단어인지 ('http://', '.com' 같은 URL 조각)"""
+    return _PUNCTUATION.search(word) is not None
+
+
+class FilterMatcher:
+    """
+    정규화한 텍스트로 단어를 찾는 매처와, 원문에서 URL 조각 키워드와 URL/전화번호를 찾는 매처의 묶음
+
+    URL 조각('.com')은 문장부호를 지우면 일반 단어('com')와 구분되지 않으므로 fold_text만 적용한 원문에서 찾는다.
+    categories는 우선순위 순서이며 scan_category에 URL/전화번호 검사 결과를 합친다.
+    """
+
+    def __init__(self, keywords: Dict[str, Iterable[str]], categories: Sequence[str], scan_category: str = "ad"):
+        self.categories = tuple(categories)
+        self.scan_category = scan_category
+        words: Dict[str, set] = {category: set() for category in self.categories}
+        fragments: Dict[str, set] = {category: set() for category in self.categories}
+        for category, category_words in keywords.items():
+            for word in category_words:
+                if is_fragment(word):
+                    fragments[category].add(fold_text(word))
+                else:
+                    words[category].add(normalize_text(word))
+        self.words = KeywordMatcher(words, self.categories)
+        self.fragments = KeywordMatcher(fragments, self.categories)
+        self.size = self.words.size + self.fragments.size
+
+    def match(self, text: str) -> Optional[str]:
+        """우선순위가 가장 높은 카테고리 (없으면 None)"""
+        category = self.words.match(normalize_text(text), not_followed_by=_JONGSEONG)
+        if category == self.categories[0]:
+            return category
+        found = self.fragments.match(fold_text(text), ContactScanner(self.scan_category))
+        if category is None or (found is not None and self.categories.index(found) < self.categories.index(category)):
+            return found
+        return category
+
+
 def contains_profanity(text: str) -> bool:
     """비속어 포함 여부 확인"""
-    text = text.lower()
-    return any(word in text for word in PROFANITY_WORDS)
+    return _STATIC_MATCHER.match(text) == "profanity"
 
 def contains_ad(text: str) -> bool:
-    """광고성 텍스트 포함 여부 확인"""
-    text = text.lower()
-    # URL 패턴 체크
-    url_pattern = r'(https?:\/\/)?([\da-z\.-]+)\.([a-z\.]{2,6})([\/\w \.-]*)*\/?'
-    if re.search(url_pattern, text):
-        return True
-    
-    # 전화번호 패턴 체크
-    phone_pattern = r'(\d{2,4}[-\s\.]?\d{3,4}[-\s\.]?\d{4})'
-    if re.search(phone_pattern, text):
-        return True
-    
-    # 광고 키워드 체크
-    return any(keyword in text for keyword in AD_KEYWORDS)
+    """광고성 텍스트 포함 여부 확인 (광고 키워드와 URL, 전화번호)"""
+    return _AD_MATCHER.match(text) == "ad"
+
+def contains_contact_pattern(text: str) -> bool:
+    """URL, 전화번호 패턴 포함 여부 확인"""
+    scanner = ContactScanner()
+    return any(scanner.feed(char) for char in fold_text(text)) or scanner.end()
 
 async def get_filter_words():
     db = Database.get_db()
-    profanity_cursor = db[FILTER_COLLECTION].find({"type": "profanity"})
-    ad_cursor = db[FILTER_COLLECTION].find({"type": "ad"})
-    
-    profanity_words = {doc["word"] async for doc in profanity_cursor}
-    ad_keywords = {doc["word"] async for doc in ad_cursor}
-    
+    cursor = db[FILTER_COLLECTION].find({}, {"_id": 0, "word": 1, "type": 1})
+
+    profanity_words, ad_keywords = set(), set()
+    async for doc in cursor:
+        if doc.get("type") == "profanity":
+            profanity_words.add(doc["word"])
+        elif doc.get("type") == "ad":
+            ad_keywords.add(doc["word"])
+
     return profanity_words, ad_keywords
 
+def build_filter_matcher(profanity_words, ad_keywords) -> FilterMatcher:
+    """정적 목록과 DB 필터 단어를 합쳐 매처 생성 (비속어가 광고보다 우선)"""
+    return FilterMatcher(
+        {
+            "profanity": PROFANITY_WORDS | set(profanity_words),
+            "ad": AD_KEYWORDS | set(ad_keywords),
+        },
+        categories=("profanity", "ad"),
+    )
+
+# DB 단어 없이 정적 목록만으로 만든 매처 (임포트 시 한 번 생성)
+_STATIC_MATCHER = build_filter_matcher((), ())
+_AD_MATCHER = FilterMatcher({"ad": AD_KEYWORDS}, categories=("ad",))
+
+# 현재 사용 중인 매처. 재생성 후 참조만 교체하므로 읽는 쪽은 잠금이 필요 없다.
+_matcher: Optional[FilterMatcher] = None
+_matcher_loaded_at = 0.0
+_matcher_generation = 0
+_matcher_refreshing = False
+
+async def reload_filter_matcher() -> FilterMatcher:
+    """필터 단어를 다시 읽어 매처를 재생성하고 교체"""
+    global _matcher, _matcher_loaded_at, _matcher_generation
+    _matcher_generation += 1
+    generation = _matcher_generation
+
+    profanity_words, ad_keywords = await get_filter_words()
+    loop = asyncio.get_running_loop()
+    matcher = await loop.run_in_executor(
+        None, build_filter_matcher, profanity_words, ad_keywords
+    )
+
+    # 그 사이 더 최근의 reload가 시작됐다면 그쪽 결과를 우선한다
+    if generation == _matcher_generation:
+        _matcher = matcher
+        _matcher_loaded_at = time.monotonic()
+    return _matcher or matcher
+
+async def _refresh_filter_matcher():
+    global _matcher_refreshing
+    try:
+        await reload_filter_matcher()
+    finally:
+        _matcher_refreshing = False
+
+async def get_filter_matcher() -> FilterMatcher:
+    """현재 매처 반환 (최초 호출 시 생성, TTL 경과 시 백그라운드 갱신)"""
+    global _matcher_refreshing
+    if _matcher is None:
+        return await reload_filter_matcher()
+
+    if not _matcher_refreshing and time.monotonic() - _matcher_loaded_at > FILTER_MATCHER_TTL:
+        _matcher_refreshing = True
+        asyncio.ensure_future(_refresh_filter_matcher())
+    return _matcher
+
+def check_text(matcher: FilterMatcher, text: str) -> Optional[str]:
+    """필터 단어와 URL/전화번호를 검사해 걸린 카테고리 반환 (입력 길이에 비례하는 시간)"""
+    return matcher.match(text)
+
 async def validate_review_text(text: str) -> tuple[bool, str]:
     """리뷰 텍스트 검증"""
-    profanity_words, ad_keywords = await get_filter_words()
-    
-    text = text.lower()
-    
-    if any(word in text for word in profanity_words):
-        return False, "비속어가 포함되어 있습니다."
-    
-    if contains_ad(text):
-        return False, "광고성 내용이 포함되어 있습니다."
-        
-    return True, "" 
\ No newline at end of file
+    matcher = await get_filter_matcher()
+    category = check_text(matcher, text)
+    if category:
+        return False, REJECT_MESSAGES[category]
+    return True, ""
@@ -0,0 +1,129 @@
+import json
+import logging
+import os
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from bson import ObjectId
+
+from ..database import Database, LIQUOR_COLLECTION
+from ..models.liquor import PROFILE_FIELDS
+from .synced_index import SyncedIndex
+
+logger = logging.getLogger(__name__)
+
+# 다른 워커의 쓰기를 반영하는 동기화 주기 (초, 0이면 최초 로드 후 동기화하지 않음)
+PROFILE_INDEX_SYNC_INTERVAL = float(os.getenv("PROFILE_INDEX_SYNC_INTERVAL", "60"))
+
+
+def profile_vector(profile) -> Optional[np.ndarray]:
+    """프로필(dict 또는 이전 형식의 JSON 문자열)을 6차원 벡터로 변환"""
+    if isinstance(profile, str):
+        try:
+            profile = json.loads(profile)
+        except ValueError:
+            return None
+    if not isinstance(profile, dict):
+        return None
+    try:
+        return np.array([float(profile[field]) for field in PROFILE_FIELDS], dtype=np.float32)
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class ProfileIndex(SyncedIndex):
+    """
+    주류 프로필 6차원 공간의 최근접 이웃 인덱스
+
+    벡터는 연속된 NumPy 배열에 보관하고, 쓰기 시 해당 행만 갱신한다.
+    동기화는 프로필만 읽어 같은 배열의 행을 제자리에서 갱신한다.
+    """
+
+    name = "similarity index"
+
+    def __init__(self, dims: Sequence[str] = PROFILE_FIELDS, interval: float = PROFILE_INDEX_SYNC_INTERVAL):
+        super().__init__(interval)
+        self.dims = len(dims)
+        self._ids: List[ObjectId] = []
+        self._rows: Dict[ObjectId, int] = {}
+        self._vectors = np.zeros((1024, self.dims), dtype=np.float32)
+
+    def __len__(self):
+        return len(self._ids)
+
+    def upsert(self, liquor_id: ObjectId, profile):
+        vector = profile_vector(profile)
+        if vector is None:
+            self.remove(liquor_id)
+            return
+
+        row = self._rows.get(liquor_id)
+        if row is None:
+            row = len(self._ids)
+            if row == len(self._vectors):
+                self._vectors = np.concatenate([self._vectors, np.zeros_like(self._vectors)])
+            self._ids.append(liquor_id)
+            self._rows[liquor_id] = row
+        self._vectors[row] = vector
+
+    def remove(self, liquor_id: ObjectId):
+        row = self._rows.pop(liquor_id, None)
+        if row is None:
+            return
+        # 마지막 행을 빈 자리로 옮겨 배열을 연속으로 유지
+        last = len(self._ids) - 1
+        if row != last:
+            moved = self._ids[last]
+            self._ids[row] = moved
+            self._vectors[row] = self._vectors[last]
+            self._rows[moved] = row
+        self._ids.pop()
+
+    def vector(self, liquor_id: ObjectId) -> Optional[np.ndarray]:
+        row = self._rows.get(liquor_id)
+        return None if row is None else self._vectors[row]
+
+    def nearest(self, vector: np.ndarray, k: int, exclude: Optional[ObjectId] = None) -> List[Tuple[ObjectId, float]]:
+        """유클리드 거리 기준 가장 가까운 k개의 (주류 ID, 거리)"""
+        size = len(self._ids)
+        if size == 0 or k <= 0:
+            return []
+
+        distances = np.linalg.norm(self._vectors[:size] - vector, axis=1)
+        exclude_row = self._rows.get(exclude) if exclude is not None else None
+        if exclude_row is not None:
+            distances[exclude_row] = np.inf
+
+        count = min(k, size - (exclude_row is not None))
+        if count <= 0:
+            return []
+        rows = np.argpartition(distances, count - 1)[:count]
+        rows = rows[np.argsort(distances[rows], kind="stable")]
+        return [(self._ids[row], float(distances[row])) for row in rows]
+
+    async def sync(self):
+        """전체 주류의 프로필을 읽어 반영 (읽는 동안 이 워커에서 바뀐 주류는 훅이 반영한 값을 유지)"""
+        seen = set()
+        cursor = Database.get_db()[LIQUOR_COLLECTION].find({}, {"profile": 1}, batch_size=5000)
+        async for doc in cursor:
+            seen.add(doc["_id"])
+            if doc["_id"] not in self._touched:
+                self.upsert(doc["_id"], doc.get("profile"))
+        # 다른 워커에서 삭제된 주류
+        for liquor_id in set(self._rows) - seen - self._touched:
+            self.remove(liquor_id)
+        logger.info(f"Synced {len(self)} liquor profiles into the similarity index")
+
+    def on_write(self, liquor_id: ObjectId, profile):
+        """주류 생성/수정 시 호출 (아직 로드 전이면 로드할 때 반영되므로 무시)"""
+        if self.active:
+            self.touch(liquor_id)
+            self.upsert(liquor_id, profile)
+
+    def on_delete(self, liquor_id: ObjectId):
+        if self.active:
+            self.touch(liquor_id)
+            self.remove(liquor_id)
+
+
+profile_index = ProfileIndex()
@@ -0,0 +1,52 @@
+"""
+운영용 gunicorn 설정 (uvicorn 워커 여러 개)
+
+사용법: gunicorn -c gunicorn.conf.py app.main:app
+개발 중에는 uvicorn app.main:app --reload를 그대로 사용한다.
+
+워커는 앱을 각자 임포트해서 MongoDB 연결 풀, 응답 캐시, 검색/프로필 색인을 따로 가진다.
+인덱스는 워커를 띄우기 전에 마스터에서 한 번만 생성하고, 각 워커는 lifespan에서 필터 매처와 색인을 미리 읽는다.
+"""
+import asyncio
+import multiprocessing
+import os
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+# 기본값은 CPU 코어 수 (비어 있어도 기본값 사용)
+workers = int(os.getenv("WEB_CONCURRENCY") or multiprocessing.cpu_count())
+# 워커가 프로세스별 풀(이미지 변형 생성 등)의 크기를 워커 수로 나눠 정할 수 있도록 전달
+os.environ["WEB_CONCURRENCY"] = str(workers)
+worker_class = "uvicorn_worker.UvicornWorker"
+
+# Motor 클라이언트는 fork 이후에 만들어야 하므로 앱을 마스터에서 미리 읽지 않는다
+preload_app = False
+
+# 종료 신호를 받으면 새 연결을 받지 않고 처리 중인 요청을 이 시간(초)까지 기다린 뒤 lifespan 종료 처리를 한다
+graceful_timeout = int(os.getenv("GRACEFUL_TIMEOUT", "30"))
+# 응답 없는 워커를 재시작하기까지의 시간 (초, 워밍업 시간보다 길어야 함)
+timeout = int(os.getenv("WORKER_TIMEOUT", "120"))
+keepalive = int(os.getenv("KEEPALIVE", "5"))
+
+# 요청 수마다 워커 교체 (0이면 사용 안 함, 여러 워커가 동시에 재시작하지 않도록 jitter)
+max_requests = int(os.getenv("MAX_REQUESTS", "0"))
+max_requests_jitter = int(os.getenv("MAX_REQUESTS_JITTER", "0"))
+
+accesslog = os.getenv("ACCESS_LOG") or None
+errorlog = "-"
+loglevel = os.getenv("LOG_LEVEL", "info")
+
+
+def on_starting(server):
+    """워커를 띄우기 전에 인덱스를 한 번만 생성하고 워커에서는 건너뛰게 한다"""
+    from app.database import Database, MONGODB_URL
+
+    async def ensure_indexes():
+        await Database.connect_db(MONGODB_URL)
+        await Database.close_db()
+
+    if Database.ensure_indexes_on_connect:
+        asyncio.run(ensure_indexes())
+        server.log.info("Ensured MongoDB indexes")
+    # fork된 워커는 이미 임포트된 모듈을 물려받으므로 클래스 속성과 환경 변수를 모두 끈다
+    Database.ensure_indexes_on_connect = False
+    os.environ["MONGODB_ENSURE_INDEXES"] = "0"
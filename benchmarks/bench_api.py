@@ -0,0 +1,309 @@
+"""
+API 부하 측정 도구
+
+합성 카탈로그(주류 x 리뷰 x 판매처 x 이미지 크기)를 만든 뒤 주요 엔드포인트를 동시 요청으로 호출하고
+시나리오별 p50/p95/p99 지연 시간과 처리량을 JSON으로 출력한다.
+앱은 httpx.AsyncClient의 ASGI 전송으로 같은 프로세스에서 실행한다.
+
+사용법:
+    pip install -r benchmarks/requirements.txt
+    python benchmarks/bench_api.py [--liquors 1000] [--reviews 20] [--stores 3] [--image-bytes 100000]
+                                   [--concurrency 32] [--requests 2000] [--scenarios list,detail,...]
+                                   [--mongo-url mongodb://localhost:27017] [--no-cache] [--output result.json]
+
+--mongo-url을 생략하면 mongomock-motor로 메모리에서 실행한다 (절대값보다는 변경 전후 비교용).
+--mongo-url을 지정하면 해당 서버의 --db-name 데이터베이스(기본 liquordb_bench)를 만들고 끝나면 삭제한다.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "backend"))
+
+PROFILE_FIELDS = ("smoothness", "aroma", "complexity", "finish", "balance", "intensity")
+TYPES = ("위스키", "소주", "맥주", "와인", "진", "럼", "보드카", "막걸리")
+SYLLABLES = "가나다마바사아자차타파하스키위소주맥진럼보드막걸리향맛"
+PROFANITY = ("나쁜말", "욕설단어")
+AD_WORDS = ("광고문구", "할인쿠폰")
+
+# 시나리오별 정상 응답 코드
+EXPECTED_STATUS = {
+    "list": {200},
+    "detail": {200},
+    "search": {200},
+    "image": {200},
+    "review_add": {200},
+    "review_like": {200},
+    "review_rejected": {400},
+}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="주류 API 부하 측정")
+    parser.add_argument("--liquors", type=int, default=1000, help="주류 수")
+    parser.add_argument("--reviews", type=int, default=20, help="주류당 리뷰 수")
+    parser.add_argument("--stores", type=int, default=3, help="주류당 판매처 수")
+    parser.add_argument("--images", type=int, default=20, help="서로 다른 이미지 수 (주류들이 나눠 사용, 0이면 이미지 없음)")
+    parser.add_argument("--image-bytes", type=int, default=100_000, help="이미지 크기 (바이트)")
+    parser.add_argument("--concurrency", type=int, default=32, help="동시 요청 수")
+    parser.add_argument("--requests", type=int, default=2000, help="시나리오별 측정 요청 수")
+    parser.add_argument("--warmup", type=int, default=50, help="시나리오별 측정 전 요청 수")
+    parser.add_argument("--scenarios", default=",".join(EXPECTED_STATUS), help="실행할 시나리오 (쉼표 구분)")
+    parser.add_argument("--mongo-url", help="로컬 mongod 주소 (생략하면 mongomock-motor)")
+    parser.add_argument("--db-name", default="liquordb_bench", help="--mongo-url 사용 시 데이터베이스 이름")
+    parser.add_argument("--keep", action="store_true", help="끝난 뒤 벤치마크 데이터베이스를 삭제하지 않음")
+    parser.add_argument("--no-cache", action="store_true", help="응답 캐시를 끄고 측정")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (생략하면 표준 출력)")
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.scenarios.split(",") if name not in EXPECTED_STATUS]
+    if unknown:
+        parser.error(f"Unknown scenario: {', '.join(unknown)} (available: {', '.join(EXPECTED_STATUS)})")
+    return args
+
+
+def configure_environment(args) -> list:
+    """앱 모듈을 불러오기 전에 설정해야 하는 환경 변수 (새로 만든 임시 디렉터리 목록 반환)"""
+    temp_dirs = []
+    for name, prefix in (("IMAGE_STORE_DIR", "bench-images-"), ("IMAGE_VARIANT_DIR", "bench-variants-")):
+        if name not in os.environ:
+            os.environ[name] = tempfile.mkdtemp(prefix=prefix)
+            temp_dirs.append(os.environ[name])
+    if args.no_cache:
+        os.environ["RESPONSE_CACHE_TTL"] = "0"
+    if not args.mongo_url:
+        # 설치된 mongomock의 bulk_write는 pymongo 4의 UpdateOne을 받지 못하므로 좋아요를 즉시 기록
+        os.environ.setdefault("LIKE_FLUSH_INTERVAL", "0")
+    os.environ.setdefault("SLOW_REQUEST_SECONDS", "0")
+    return temp_dirs
+
+
+def words(rng: random.Random, count: int) -> str:
+    return " ".join("".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))) for _ in range(count))
+
+
+async def seed(db, args, rng: random.Random) -> dict:
+    """합성 데이터를 DB와 블롭 저장소에 직접 기록"""
+    from bson import ObjectId
+    from app.database import LIQUOR_COLLECTION, REVIEW_COLLECTION, FILTER_COLLECTION
+    from app.utils.blob_store import blob_store
+
+    started = time.perf_counter()
+    images = [blob_store.put_bytes(rng.randbytes(args.image_bytes)) for _ in range(args.images)]
+
+    now = datetime.now(timezone.utc)
+    liquor_ids = []
+    reviews = []
+    liquors = []
+    for i in range(args.liquors):
+        liquor_id = ObjectId()
+        liquor_ids.append(liquor_id)
+        stores = [
+            {"id": str(ObjectId()), "name": f"store-{j}", "address": None, "contact": None,
+             "price": rng.randrange(5_000, 300_000, 100)}
+            for j in range(args.stores)
+        ]
+        prices = [store["price"] for store in stores]
+        likes = 0
+        for _ in range(args.reviews):
+            review_likes = rng.randint(0, 50)
+            likes += review_likes
+            created = now - timedelta(minutes=rng.randint(0, 100_000))
+            reviews.append({
+                "_id": ObjectId(), "liquor_id": liquor_id, "content": words(rng, 8),
+                "created_at": created, "updated_at": created, "likes": review_likes,
+            })
+        image = images[i % len(images)] if images else None
+        liquors.append({
+            "_id": liquor_id,
+            "name": words(rng, 2),
+            "type": rng.choice(TYPES),
+            "description": words(rng, 12),
+            "rating": round(rng.uniform(0, 5), 1),
+            "profile": {field: round(rng.uniform(0, 5), 1) for field in PROFILE_FIELDS},
+            "created_at": now,
+            "updated_at": now - timedelta(seconds=i),
+            "stores": stores,
+            "min_price": min(prices) if prices else None,
+            "max_price": max(prices) if prices else None,
+            "review_count": args.reviews,
+            "review_likes": likes,
+            "image_id": image[0] if image else None,
+            "image_size": image[1] if image else None,
+            "image_content_type": "image/jpeg" if image else None,
+        })
+
+    for start in range(0, len(liquors), 1000):
+        await db[LIQUOR_COLLECTION].insert_many(liquors[start:start + 1000], ordered=False)
+    for start in range(0, len(reviews), 5000):
+        await db[REVIEW_COLLECTION].insert_many(reviews[start:start + 5000], ordered=False)
+    await db[FILTER_COLLECTION].insert_many(
+        [{"word": word, "type": "profanity", "created_at": now} for word in PROFANITY]
+        + [{"word": word, "type": "ad", "created_at": now} for word in AD_WORDS]
+    )
+
+    return {
+        "liquor_ids": liquor_ids,
+        "reviews": [(review["liquor_id"], review["_id"]) for review in reviews],
+        "summary": {
+            "liquors": len(liquors),
+            "reviews": len(reviews),
+            "stores": len(liquors) * args.stores,
+            "images": len(images),
+            "seconds": round(time.perf_counter() - started, 3),
+        },
+    }
+
+
+def scenario_request(name: str, data: dict, rng: random.Random):
+    """시나리오 이름에 해당하는 (메서드, 경로, 요청 옵션)"""
+    liquor_id = rng.choice(data["liquor_ids"])
+    if name == "list":
+        return "GET", "/api/liquors", {"params": {"limit": 20, "type": rng.choice(TYPES)}}
+    if name == "detail":
+        return "GET", f"/api/liquors/{liquor_id}", {}
+    if name == "search":
+        return "GET", "/api/search", {"params": {"q": words(rng, 1)}}
+    if name == "image":
+        return "GET", f"/api/liquors/{liquor_id}/image", {}
+    if name == "review_add":
+        return "POST", f"/api/liquors/{liquor_id}/reviews", {"json": {"content": words(rng, 6)}}
+    if name == "review_like":
+        review_liquor_id, review_id = rng.choice(data["reviews"])
+        return "POST", f"/api/liquors/{review_liquor_id}/reviews/{review_id}/like", {}
+    if name == "review_rejected":
+        bad_word = rng.choice(PROFANITY + AD_WORDS)
+        return "POST", f"/api/liquors/{liquor_id}/reviews", {"json": {"content": f"{words(rng, 3)} {bad_word}"}}
+    raise ValueError(name)
+
+
+def percentile(sorted_values, fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+async def run_scenario(client, name: str, data: dict, args, rng: random.Random) -> dict:
+    """동시 작업자 concurrency개가 요청을 나눠 보내고 지연 시간 분포 계산"""
+    if name == "review_like" and not data["reviews"]:
+        return {"skipped": "no reviews"}
+
+    async def drive(count: int, latencies, statuses):
+        remaining = count
+
+        async def worker():
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                method, path, options = scenario_request(name, data, rng)
+                started = time.perf_counter()
+                response = await client.request(method, path, **options)
+                await response.aread()
+                latencies.append(time.perf_counter() - started)
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+        await asyncio.gather(*(worker() for _ in range(min(args.concurrency, count) or 1)))
+
+    await drive(args.warmup, [], {})
+
+    latencies = []
+    statuses = {}
+    started = time.perf_counter()
+    await drive(args.requests, latencies, statuses)
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    errors = sum(count for status, count in statuses.items() if status not in EXPECTED_STATUS[name])
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "status": {str(status): count for status, count in sorted(statuses.items())},
+        "seconds": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "latency_ms": {
+            "p50": round(percentile(latencies, 0.50) * 1000, 2),
+            "p95": round(percentile(latencies, 0.95) * 1000, 2),
+            "p99": round(percentile(latencies, 0.99) * 1000, 2),
+            "max": round(latencies[-1] * 1000, 2) if latencies else 0.0,
+            "mean": round(sum(latencies) / len(latencies) * 1000, 2) if latencies else 0.0,
+        },
+    }
+
+
+async def main(args) -> dict:
+    import httpx
+    from app.database import Database
+    from app.main import app
+    from app.utils.image_variants import image_variants
+    from app.utils.like_buffer import like_buffer
+
+    if args.mongo_url:
+        Database.db_name = args.db_name
+        await Database.connect_db(args.mongo_url)
+        await Database.client.drop_database(args.db_name)
+        await Database.ensure_indexes()
+        backend = "mongod"
+    else:
+        from mongomock_motor import AsyncMongoMockClient
+        Database.client = AsyncMongoMockClient()
+        backend = "mongomock-motor"
+
+    rng = random.Random(args.seed)
+    db = Database.get_db()
+    try:
+        data = await seed(db, args, rng)
+        results = {}
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+            for name in args.scenarios.split(","):
+                results[name] = await run_scenario(client, name, data, args, rng)
+                print(f"{name}: {json.dumps(results[name]['latency_ms'] if 'latency_ms' in results[name] else results[name])}",
+                      file=sys.stderr)
+    finally:
+        await like_buffer.stop()
+        image_variants.shutdown()
+        if args.mongo_url and not args.keep:
+            await Database.client.drop_database(args.db_name)
+        await Database.close_db()
+
+    return {
+        "config": {
+            key: value for key, value in vars(args).items() if key not in ("output", "keep")
+        },
+        "environment": {
+            "backend": backend,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "like_flush_interval": os.environ.get("LIKE_FLUSH_INTERVAL"),
+            "response_cache_ttl": os.environ.get("RESPONSE_CACHE_TTL"),
+        },
+        "seed": data["summary"],
+        "scenarios": results,
+    }
+
+
+if __name__ == "__main__":
+    arguments = parse_args()
+    temp_dirs = configure_environment(arguments)
+    try:
+        report = asyncio.run(main(arguments))
+    finally:
+        # 직접 지정하지 않은 이미지/변형 디렉터리는 끝나면 삭제
+        for path in temp_dirs:
+            shutil.rmtree(path, ignore_errors=True)
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if arguments.output:
+        with open(arguments.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
@@ -0,0 +1,92 @@
+"""
+리뷰 텍스트 검사 마이크로 벤치마크
+
+이전 방식(키워드 검사 뒤 URL/전화번호 정규식을 따로 실행)과 현재 방식(정규화 + KeywordMatcher + ContactScanner)의
+텍스트 한 건당 검사 시간을 입력 종류와 길이별로 비교한다.
+적대적 입력은 정규식이 시작 위치마다 끝까지 읽었다가 되돌아가게 만드는 텍스트다.
+
+사용법:
+    python benchmarks/bench_text_filter.py [--sizes 100,500,2000,5000] [--repeat 200] [--output result.json]
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "backend"))
+
+from app.utils.keyword_matcher import KeywordMatcher  # noqa: E402
+from app.utils.text_filter import AD_KEYWORDS, PROFANITY_WORDS, build_filter_matcher, check_text, normalize_text  # noqa: E402
+
+# 이전 text_filter의 패턴 (비교용)
+LEGACY_URL_PATTERN = r'(https?:\/\/)?([\da-z\.-]+)\.([a-z\.]{2,6})([\/\w \.-]*)*\/?'
+LEGACY_PHONE_PATTERN = r'(\d{2,4}[-\s\.]?\d{3,4}[-\s\.]?\d{4})'
+
+REVIEW = "향이 풍부하고 목넘김이 부드러워요. 피트향은 약하지만 여운이 길고 가격 대비 만족합니다! "
+
+# 이름 -> 길이를 받아 텍스트를 만드는 함수
+INPUTS = {
+    "review": lambda n: (REVIEW * (n // len(REVIEW) + 1))[:n],
+    "letters": lambda n: "a" * n,
+    "digits": lambda n: "1" * (n - 1) + "!",
+    "hyphens": lambda n: ("a-" * n)[:n],
+    "dotted": lambda n: "a" * (n - 1) + ".",
+}
+
+
+def legacy_validate(matchers, text: str) -> str:
+    text = text.lower()
+    category = matchers[0].match(text)
+    if category:
+        return category
+    if re.search(LEGACY_URL_PATTERN, text) or re.search(LEGACY_PHONE_PATTERN, text):
+        return "ad"
+    return ""
+
+
+def current_validate(matchers, text: str) -> str:
+    # 정규화 캐시가 적중하지 않는 경우를 측정
+    normalize_text.cache_clear()
+    return check_text(matchers[1], text) or ""
+
+
+def measure(func, matchers, text: str, repeat: int) -> float:
+    """한 건당 평균 시간 (마이크로초)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(matchers, text)
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="리뷰 텍스트 검사 마이크로 벤치마크")
+    parser.add_argument("--sizes", default="100,500,2000,5000", help="텍스트 길이 (쉼표 구분)")
+    parser.add_argument("--repeat", type=int, default=200, help="측정 반복 횟수")
+    parser.add_argument("--output", help="결과 JSON 파일 경로")
+    args = parser.parse_args(argv)
+
+    # (이전 방식의 키워드 매처, 현재 방식의 매처)
+    matchers = (
+        KeywordMatcher({"profanity": PROFANITY_WORDS, "ad": AD_KEYWORDS}, categories=("profanity", "ad")),
+        build_filter_matcher((), ()),
+    )
+    sizes = [int(size) for size in args.sizes.split(",")]
+    results = []
+    print(f"{'input':<10}{'size':>7}{'legacy_us':>14}{'current_us':>14}{'speedup':>10}")
+    for name, make in INPUTS.items():
+        for size in sizes:
+            text = make(size)
+            legacy = measure(legacy_validate, matchers, text, args.repeat)
+            current = measure(current_validate, matchers, text, args.repeat)
+            results.append({"input": name, "size": size, "legacy_us": round(legacy, 1), "current_us": round(current, 1)})
+            print(f"{name:<10}{size:>7}{legacy:>14.1f}{current:>14.1f}{legacy / current:>9.1f}x")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"repeat": args.repeat, "results": results}, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
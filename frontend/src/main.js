@@ -81,7 +81,7 @@ function populateWhiskyList(isInitial = false) {
         item.onclick = () => showReviews(whisky.name);
         item.innerHTML = `
             <div class="whisky-info">
-                <img src="data:image/png;base64,${whisky.image}" class="whisky-image"> <!-- Base64 이미지 설정 -->
+                <img src="http://3.36.132.159:20010${whisky.thumbnail_url}" class="whisky-image"> <!-- 썸네일 URL 설정 -->
                 <strong>${whisky.name}</strong>
                 <div class="rating">
                     ${getStarRating(whisky.rating)}
@@ -103,7 +103,7 @@ async function showReviews(name) {
     currentLiquorId = whisky.id;  // 현재 주류 ID 저장
     whiskyName = name;
     document.getElementById('modal-whisky-name').textContent = name;
-    document.getElementById('modal-liquor-image').src = `data:image/png;base64,${whisky.image}`;
+    document.getElementById('modal-liquor-image').src = `http://3.36.132.159:20010${whisky.image_url}`;
     document.getElementById('liquor-description').textContent = whisky.description;
     const reviewContainer = document.getElementById('modal-reviews');
     
@@ -0,0 +1,147 @@
+import asyncio
+import os
+import sys
+from functools import cmp_to_key
+
+import pytest
+
+# PYTHONPATH 없이도 backend의 app 패키지를 불러온다
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "backend"))
+
+from app.database import Database  # noqa: E402
+
+def matches(doc, query):
+    """find 조건 중 테스트에서 쓰는 연산자만 흉내낸다."""
+    for key, condition in query.items():
+        if key == "$and":
+            if not all(matches(doc, clause) for clause in condition):
+                return False
+        elif key == "$or":
+            if not any(matches(doc, clause) for clause in condition):
+                return False
+        elif isinstance(condition, dict) and any(op.startswith("$") for op in condition):
+            value = doc.get(key)
+            for op, operand in condition.items():
+                if op == "$in" and value not in operand:
+                    return False
+                if op == "$ne" and value == operand:
+                    return False
+                if op == "$exists" and (key in doc) != bool(operand):
+                    return False
+                if op in ("$gt", "$gte", "$lt", "$lte") and value is None:
+                    return False
+                if op == "$gt" and not value > operand:
+                    return False
+                if op == "$gte" and not value >= operand:
+                    return False
+                if op == "$lt" and not value < operand:
+                    return False
+                if op == "$lte" and not value <= operand:
+                    return False
+        elif doc.get(key) != condition:
+            return False
+    return True
+
+def apply_update(doc, update):
+    doc.update(update.get("$set", {}))
+    for key in update.get("$unset", {}):
+        doc.pop(key, None)
+    for key, amount in update.get("$inc", {}).items():
+        doc[key] = doc.get(key, 0) + amount
+
+class FakeCursor:
+    """Motor 커서처럼 sort/limit/to_list와 async for를 지원하는 커서"""
+
+    def __init__(self, docs, after_read=None):
+        self.docs = list(docs)
+        self.after_read = after_read
+
+    def sort(self, key, direction=None):
+        order = [(key, direction or 1)] if isinstance(key, str) else list(key)
+
+        def compare(a, b):
+            for field, field_direction in order:
+                if a.get(field) != b.get(field):
+                    return field_direction if a.get(field) > b.get(field) else -field_direction
+            return 0
+
+        self.docs = sorted(self.docs, key=cmp_to_key(compare))
+        return self
+
+    def limit(self, count):
+        self.docs = self.docs[:count]
+        return self
+
+    async def to_list(self, length):
+        return [dict(doc) for doc in self.docs[:length]]
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for doc in self.docs:
+            # 배치를 받아오는 동안 다른 코루틴이 끼어들 수 있다
+            await asyncio.sleep(0)
+            yield dict(doc)
+        if self.after_read is not None:
+            self.after_read()
+
+class FakeCollection:
+    """문서 리스트를 그대로 읽고 고치는 Motor 컬렉션 대역"""
+
+    def __init__(self, docs=None, error=None):
+        self.docs = docs if docs is not None else []
+        self.error = error
+        self.after_read = None
+        self.queries = []
+        self.writes = []
+
+    def find(self, query=None, projection=None, **kwargs):
+        query = query or {}
+        self.queries.append(query)
+        return FakeCursor([doc for doc in self.docs if matches(doc, query)], self.after_read)
+
+    async def find_one(self, query, projection=None):
+        for doc in self.docs:
+            if matches(doc, query):
+                return dict(doc)
+        return None
+
+    async def insert_one(self, doc):
+        doc.setdefault("_id", len(self.docs) + 1)
+        self.docs.append(dict(doc))
+
+    async def replace_one(self, query, replacement, upsert=False):
+        for i, doc in enumerate(self.docs):
+            if matches(doc, query):
+                self.docs[i] = dict(replacement)
+                return
+        if upsert:
+            self.docs.append(dict(replacement))
+
+    async def update_one(self, query, update, upsert=False):
+        for doc in self.docs:
+            if matches(doc, query):
+                apply_update(doc, update)
+                return
+
+    async def bulk_write(self, operations, ordered=True):
+        self.writes.append(operations)
+        if self.error is not None:
+            raise self.error
+        for op in operations:
+            await self.update_one(op._filter, op._doc)
+
+class FakeDatabase(dict):
+    """컬렉션 이름으로 꺼낼 때 없으면 빈 컬렉션을 만든다."""
+
+    def __missing__(self, name):
+        self[name] = FakeCollection()
+        return self[name]
+
+@pytest.fixture
+def fake_db(monkeypatch):
+    db = FakeDatabase()
+    monkeypatch.setattr(Database, "get_db", classmethod(lambda cls: db))
+    monkeypatch.setattr(Database, "get_read_db", classmethod(lambda cls: db))
+    return db
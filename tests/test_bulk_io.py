@@ -0,0 +1,44 @@
+import asyncio
+
+from app.utils.bulk_io import iter_csv_rows, iter_lines, iter_ndjson_rows
+
+async def _chunks(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+def _collect(iterator):
+    async def scenario():
+        return [item async for item in iterator]
+
+    return asyncio.run(scenario())
+
+def test_iter_lines_joins_lines_split_across_chunks():
+    lines = _collect(iter_lines(_chunks(b"\xef\xbb\xbf" + "첫".encode(), "째\n둘".encode()[:2], "째\n둘".encode()[2:], b"\n\nlast")))
+    assert lines == ["첫째\n", "둘\n", "\n", "last"]
+
+def test_iter_ndjson_rows_reports_invalid_utf8_and_json_by_row():
+    rows = _collect(iter_ndjson_rows(_chunks(
+        b'{"name": "a"}\n',
+        b'{"name": "\xff"}\n\n',
+        b'[1]\n{"name": "b"}',
+    )))
+
+    assert rows[0] == (1, {"name": "a"})
+    assert rows[1][0] == 2 and "line 2: invalid UTF-8" in str(rows[1][1])
+    assert rows[2][0] == 3 and isinstance(rows[2][1], ValueError)
+    assert rows[3] == (4, {"name": "b"})
+
+def test_iter_csv_rows_skips_undecodable_record():
+    rows = _collect(iter_csv_rows(_chunks(
+        "name,type\n".encode(),
+        "참이슬,소주\n".encode() + b"\xea\xb0,bad\n",
+        '"발렌타인\n17년",위스키\n'.encode(),
+    )))
+
+    assert rows[0] == (1, {"name": "참이슬", "type": "소주"})
+    assert rows[1][0] == 2 and "line 3: invalid UTF-8" in str(rows[1][1])
+    assert rows[2] == (3, {"name": "발렌타인\n17년", "type": "위스키"})
+
+def test_iter_csv_rows_stops_when_header_is_undecodable():
+    rows = _collect(iter_csv_rows(_chunks(b"\xffname,type\n", "참이슬,소주\n".encode())))
+    assert len(rows) == 1 and rows[0][0] == 0
@@ -0,0 +1,52 @@
+import json
+from datetime import datetime
+from bson import ObjectId
+from app.models.liquor import Liquor, LiquorSummary
+from app.models.review import Review
+from app.routers.liquor import to_response
+from app.routers.review import serialize_review
+from app.utils.fast_json import dumps, shape
+
+PROFILE = {"smoothness": 1.0, "aroma": 2.0, "complexity": 3.0, "finish": 4.0, "balance": 5.0, "intensity": 0.5}
+
+def _liquor_doc():
+    return {
+        "_id": ObjectId(),
+        "name": "발렌타인",
+        "type": "위스키",
+        "description": "부드러움",
+        "rating": 4.5,
+        "profile": dict(PROFILE),
+        "image_id": "ab" * 32,
+        "image_size": 10,
+        "review_count": 2,
+        "review_likes": 3,
+        "created_at": datetime(2024, 1, 1),
+        "updated_at": datetime(2024, 1, 2),
+        "stores": [],
+    }
+
+def test_dumps_encodes_object_ids_and_datetimes():
+    oid = ObjectId()
+    assert json.loads(dumps({"id": oid, "at": datetime(2024, 1, 2, 3, 4, 5)})) == {
+        "id": str(oid), "at": "2024-01-02T03:04:05",
+    }
+
+def test_fast_path_output_matches_response_models():
+    # fast_response는 응답 모델 검증을 건너뛰므로 핸들러가 만드는 형태를 여기서 검증한다
+    summary = shape(to_response(_liquor_doc()), LiquorSummary, exclude_unset=True)
+    assert "image_id" not in summary and "review_likes" not in summary
+    assert LiquorSummary(**summary).avg_likes == 1.5
+
+    review = {
+        "_id": ObjectId(), "liquor_id": ObjectId(), "content": "좋아요",
+        "created_at": datetime(2024, 1, 1), "updated_at": datetime(2024, 1, 1), "likes": 2,
+    }
+    Review(**shape(serialize_review(review), Review))
+
+    detail = _liquor_doc()
+    detail["reviews"] = [serialize_review(review)]
+    shaped = shape(to_response(detail), Liquor)
+    assert Liquor(**shaped).reviews[0].likes == 2
+    # 모델 기본값이 채워진다
+    assert shaped["stores"] == []
@@ -0,0 +1,68 @@
+import asyncio
+
+from pymongo.monitoring import ConnectionCheckedOutEvent, PoolCreatedEvent
+
+import app.utils.health as health
+from app.utils.health import AdmissionControl, AdmissionControlMiddleware, LoopLagMonitor
+from app.utils.pool_metrics import PoolMetrics
+
+async def _request(app, path="/api/liquors"):
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        messages.append(message)
+
+    await app({"type": "http", "path": path, "method": "GET", "headers": []}, receive, send)
+    return messages
+
+def test_admission_control_rejects_when_in_flight_limit_is_reached():
+    async def scenario():
+        release = asyncio.Event()
+
+        async def slow_app(scope, receive, send):
+            await release.wait()
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"ok"})
+
+        control = AdmissionControl(max_in_flight=1, max_loop_lag=0, retry_after=2, monitor=LoopLagMonitor())
+        app = AdmissionControlMiddleware(slow_app, control=control)
+
+        first = asyncio.ensure_future(_request(app))
+        await asyncio.sleep(0)
+        rejected = await _request(app)
+        # 상태 확인 경로는 한도와 상관없이 통과
+        health = asyncio.ensure_future(_request(app, "/api/health/ready"))
+        await asyncio.sleep(0)
+        assert control.in_flight == 1
+
+        release.set()
+        accepted = await first
+        await health
+        return rejected, accepted, control
+
+    rejected, accepted, control = asyncio.run(scenario())
+    assert rejected[0]["status"] == 503
+    assert (b"retry-after", b"2") in rejected[0]["headers"]
+    assert accepted[0]["status"] == 200
+    assert control.in_flight == 0
+
+def test_admission_control_rejects_when_loop_lag_is_high():
+    monitor = LoopLagMonitor()
+    control = AdmissionControl(max_in_flight=0, max_loop_lag=0.5, monitor=monitor)
+    assert control.overload_reason() is None
+
+    monitor.lag = 0.8
+    assert control.overload_reason() == "loop_lag"
+
+def test_pool_saturation_uses_driver_default_max_size(monkeypatch):
+    metrics = PoolMetrics()
+    monkeypatch.setattr(health, "pool_metrics", metrics)
+    address = ("db", 27017)
+    # 기본값과 같은 maxPoolSize는 이벤트 옵션에서 빠진다
+    metrics.pool_created(PoolCreatedEvent(address, {}))
+    metrics.connection_checked_out(ConnectionCheckedOutEvent(address, 1, 0.001))
+
+    assert health.pool_saturation() == {"db:27017": {"in_use": 1, "max_size": 100, "waiting": 0, "saturation": 0.01}}
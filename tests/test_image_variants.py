@@ -0,0 +1,60 @@
+import asyncio
+import os
+
+import app.utils.image_variants as image_variants_module
+from app.utils.image_variants import ImageVariantPipeline, VariantCache
+
+def _write(cache, key, size):
+    path = cache.store.path(key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(b"x" * size)
+
+def test_variant_cache_sweep_limits_directory_size(tmp_path):
+    cache = VariantCache(str(tmp_path), max_bytes=10)
+    for atime, key in enumerate(("a-64.webp", "b-64.webp", "c-64.webp")):
+        _write(cache, key, 4)
+        os.utime(cache.store.path(key), (atime, atime))
+    # 이 캐시를 거치지 않은 파일(다른 워커가 만든 변형)도 용량에 포함된다
+    cache.load()
+
+    assert "c-64.webp" in cache and "a-64.webp" not in cache
+    assert not os.path.exists(cache.store.path("a-64.webp"))
+
+    # 읽은 파일은 나중에 지운다
+    assert cache.touch("b-64.webp").st_size == 4
+    _write(cache, "d-64.webp", 4)
+    assert cache.add("d-64.webp", 4)
+    assert cache.sweep() == ["c-64.webp"]
+    assert cache.touch("c-64.webp") is None
+
+def test_failed_digests_are_retried_later_and_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(image_variants_module, "IMAGE_VARIANT_FAILED_MAX", 2)
+    pipeline = ImageVariantPipeline(VariantCache(str(tmp_path), max_bytes=10), workers=1)
+    submitted = []
+
+    def submit(digest):
+        submitted.append(digest)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        loop.call_soon(future.set_exception, OSError("cannot identify image file"))
+        return future
+
+    pipeline._submit = submit
+
+    async def scenario():
+        assert not await pipeline.ensure_variants("bad")
+        # 재시도 시간 전에는 다시 생성하지 않는다
+        assert not await pipeline.ensure_variants("bad")
+        assert submitted == ["bad"]
+
+        pipeline._failed["bad"] -= image_variants_module.IMAGE_VARIANT_RETRY_AFTER + 1
+        assert not await pipeline.ensure_variants("bad")
+        assert submitted == ["bad", "bad"]
+
+        await pipeline.ensure_variants("other")
+        await pipeline.ensure_variants("third")
+
+    asyncio.run(scenario())
+    # 최대 개수를 넘으면 오래된 것부터 잊는다
+    assert list(pipeline._failed) == ["other", "third"]
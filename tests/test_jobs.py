@@ -0,0 +1,104 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from bson import ObjectId
+
+import app.jobs as jobs
+from app.database import JOB_COLLECTION, REVIEW_COLLECTION
+from app.jobs import RESCAN_JOB_ID, rescan_reviews, scan_chunk, words_fingerprint, _init_scan_worker
+
+def _setup(monkeypatch, db, docs, profanity=("나쁜말",)):
+    async def get_filter_words():
+        return list(profanity), []
+
+    def executor(max_workers, mp_context, initializer, initargs):
+        # 테스트에서는 같은 프로세스의 스레드에서 검사
+        return ThreadPoolExecutor(max_workers, initializer=initializer, initargs=initargs)
+
+    monkeypatch.setattr(jobs, "get_filter_words", get_filter_words)
+    monkeypatch.setattr(jobs, "ProcessPoolExecutor", executor)
+    monkeypatch.setattr(jobs, "RESCAN_WORKERS", 1)
+    monkeypatch.setattr(jobs, "RESCAN_CHUNK_SIZE", 2)
+    db[REVIEW_COLLECTION].docs = docs
+    return db
+
+def _job(db):
+    return db[JOB_COLLECTION].docs[0]
+
+def _reviews(*contents):
+    return [{"_id": ObjectId(), "content": content} for content in contents]
+
+def test_scan_chunk_returns_only_changed_flags():
+    _init_scan_worker(["나쁜말"], [])
+    first, second, third, fourth = (ObjectId() for _ in range(4))
+    changes = scan_chunk([
+        (first, "맛있어요", None),
+        (second, "나쁜말이네", None),
+        (third, "나쁜말이네", "profanity"),
+        (fourth, "괜찮아요", "ad"),
+    ])
+    assert changes == [(second, "나쁜말이네", "profanity"), (fourth, "괜찮아요", None)]
+
+def test_words_fingerprint_ignores_order_but_not_category():
+    assert words_fingerprint(["a", "b"], ["c"]) == words_fingerprint(["b", "a"], ["c"])
+    assert words_fingerprint(["a", "b"], ["c"]) != words_fingerprint(["a"], ["b", "c"])
+    assert words_fingerprint(["a"], []) != words_fingerprint(["a", "b"], [])
+
+def test_rescan_flags_reviews_and_restarts_after_finishing(monkeypatch, fake_db):
+    docs = _reviews("맛있어요", "나쁜말이네", "향이 좋아요", "나쁜말 또")
+    docs[2]["flagged"] = "profanity"
+    db = _setup(monkeypatch, fake_db, docs)
+
+    assert asyncio.run(rescan_reviews(db)) == 3
+    assert [doc.get("flagged") for doc in docs] == [None, "profanity", None, "profanity"]
+    state = _job(db)
+    assert state["scanned"] == 4 and state["last_id"] == docs[-1]["_id"] and state["finished_at"]
+
+    # 끝난 작업은 처음부터 다시 검사한다
+    assert asyncio.run(rescan_reviews(db)) == 0
+    assert _job(db)["scanned"] == 4
+
+def test_rescan_resumes_unfinished_job_with_same_words(monkeypatch, fake_db):
+    docs = _reviews("나쁜말1", "나쁜말2", "나쁜말3", "나쁜말4")
+    db = _setup(monkeypatch, fake_db, docs)
+    db[JOB_COLLECTION].docs = [{
+        "_id": RESCAN_JOB_ID,
+        "fingerprint": words_fingerprint(["나쁜말"], []),
+        "finished_at": None,
+        "last_id": docs[1]["_id"],
+        "scanned": 2,
+        "changed": 2,
+    }]
+
+    assert asyncio.run(rescan_reviews(db)) == 4
+    # 기록된 last_id 이후의 리뷰만 검사
+    assert [doc.get("flagged") for doc in docs] == [None, None, "profanity", "profanity"]
+    assert _job(db)["scanned"] == 4
+
+def test_rescan_restarts_when_words_changed(monkeypatch, fake_db):
+    docs = _reviews("나쁜말1", "나쁜말2")
+    db = _setup(monkeypatch, fake_db, docs)
+    db[JOB_COLLECTION].docs = [{
+        "_id": RESCAN_JOB_ID,
+        "fingerprint": words_fingerprint(["다른말"], []),
+        "finished_at": None,
+        "last_id": docs[0]["_id"],
+        "scanned": 1,
+        "changed": 0,
+    }]
+
+    assert asyncio.run(rescan_reviews(db)) == 2
+    assert _job(db)["scanned"] == 2
+
+def test_rescan_skips_reviews_edited_during_scan(monkeypatch, fake_db):
+    docs = _reviews("맛있어요", "나쁜말이네", "나쁜말 또")
+    db = _setup(monkeypatch, fake_db, docs)
+
+    def edit():
+        # 마지막 청크를 검사하는 동안 리뷰가 수정됨 (수정 시 다시 검증되므로 표시하지 않는다)
+        docs[2]["content"] = "수정했어요"
+
+    db[REVIEW_COLLECTION].after_read = edit
+    asyncio.run(rescan_reviews(db))
+
+    assert [doc.get("flagged") for doc in docs] == [None, "profanity", None]
@@ -0,0 +1,69 @@
+import asyncio
+
+from bson import ObjectId
+from pymongo.errors import BulkWriteError
+
+from app.database import LIQUOR_COLLECTION, REVIEW_COLLECTION
+from app.utils.like_buffer import LikeBuffer
+from app.utils.response_cache import response_cache
+
+def test_like_buffer_requeues_all_counts_when_write_fails(fake_db):
+    buffer = LikeBuffer(interval=1.0, max_pending=1000)
+    liquor_id, first, second = ObjectId(), ObjectId(), ObjectId()
+    buffer._pending = {(liquor_id, first): 3, (liquor_id, second): 1}
+    fake_db[REVIEW_COLLECTION].error = ConnectionError("down")
+    liquors = fake_db[LIQUOR_COLLECTION]
+
+    asyncio.run(buffer.flush())
+
+    assert buffer._pending == {(liquor_id, first): 3, (liquor_id, second): 1}
+    assert buffer.pending(liquor_id, first) == 3
+    # 리뷰에 기록되지 않았으므로 주류 합계도 바꾸지 않는다
+    assert liquors.writes == []
+
+def test_like_buffer_requeues_only_failed_ops_on_partial_failure(fake_db):
+    buffer = LikeBuffer(interval=1.0, max_pending=1000)
+    liquor_id, other_liquor, first, second, third = (ObjectId() for _ in range(5))
+    buffer._pending = {(liquor_id, first): 3, (liquor_id, second): 2, (other_liquor, third): 4}
+    error = BulkWriteError({"writeErrors": [{"index": 1, "code": 11000, "errmsg": "fail"}]})
+    fake_db[REVIEW_COLLECTION].error = error
+    liquors = fake_db[LIQUOR_COLLECTION]
+
+    asyncio.run(buffer.flush())
+
+    assert buffer._pending == {(liquor_id, second): 2}
+    assert buffer._flushing == {}
+    totals = {op._filter["_id"]: op._doc["$inc"]["review_likes"] for op in liquors.writes[0]}
+    assert totals == {liquor_id: 3, other_liquor: 4}
+
+def test_like_buffer_discard_during_flush_skips_liquor_total(fake_db):
+    buffer = LikeBuffer(interval=1.0, max_pending=1000)
+    liquor_id, first, second = ObjectId(), ObjectId(), ObjectId()
+    buffer._pending = {(liquor_id, first): 3, (liquor_id, second): 2}
+    reviews, liquors = fake_db[REVIEW_COLLECTION], fake_db[LIQUOR_COLLECTION]
+    write_reviews = reviews.bulk_write
+
+    async def bulk_write(operations, ordered=True):
+        # 기록 중에 리뷰가 삭제된 경우
+        buffer.discard(liquor_id, first)
+        await write_reviews(operations, ordered)
+
+    reviews.bulk_write = bulk_write
+    asyncio.run(buffer.flush())
+
+    assert buffer._pending == {}
+    assert [op._doc["$inc"]["review_likes"] for op in liquors.writes[0]] == [2]
+
+def test_like_buffer_invalidates_detail_cache_once_per_flush(fake_db, monkeypatch):
+    buffer = LikeBuffer(interval=1.0, max_pending=1000)
+    liquor_id, first, second = ObjectId(), ObjectId(), ObjectId()
+    buffer._pending = {(liquor_id, first): 3, (liquor_id, second): 2}
+    invalidated = []
+
+    async def invalidate(*tags):
+        invalidated.append(tags)
+
+    monkeypatch.setattr(response_cache, "invalidate", invalidate)
+    asyncio.run(buffer.flush())
+
+    assert invalidated == [(f"liquor:{liquor_id}",)]
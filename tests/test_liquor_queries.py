@@ -0,0 +1,76 @@
+import asyncio
+import inspect
+
+import pytest
+from bson import ObjectId
+from fastapi import HTTPException
+
+from app.database import LIQUOR_COLLECTION
+from app.routers.liquor import MAX_BATCH_IDS, fetch_by_ids, filter_query, liquor_filters, to_response
+from app.utils.aggregates import avg_likes
+
+def _filters(**values):
+    # Query 기본값 대신 None으로 채워 직접 호출
+    params = {name: None for name in inspect.signature(liquor_filters).parameters}
+    params.update(values)
+    return liquor_filters(**params)
+
+def test_liquor_filters_build_range_conditions():
+    filters = _filters(type="위스키", min_rating=3.5, max_price=50000, min_aroma=2, max_aroma=4, max_finish=3)
+
+    assert filters["type"] == {"type": "위스키"}
+    assert filters["rating"] == {"rating": {"$gte": 3.5}}
+    assert filters["profile"] == {"profile.aroma": {"$gte": 2, "$lte": 4}, "profile.finish": {"$lte": 3}}
+    # 가격 조건은 한 판매처가 모두 만족해야 한다
+    assert filters["price"] == {"stores": {"$elemMatch": {"price": {"$lte": 50000}}}}
+
+def test_liquor_filters_without_values_match_everything():
+    filters = _filters()
+    assert all(condition == {} for condition in filters.values())
+    assert filter_query(filters) == {}
+
+def test_filter_query_excludes_own_facet():
+    filters = _filters(type="진", min_rating=4)
+    assert filter_query(filters) == {"$and": [{"type": "진"}, {"rating": {"$gte": 4}}]}
+    # 종류 패싯은 종류 필터를 빼고 센다
+    assert filter_query(filters, exclude=("type",)) == {"rating": {"$gte": 4}}
+
+def test_avg_likes_from_denormalized_counts():
+    assert avg_likes({"review_count": 3, "review_likes": 10}) == 3.33
+    assert avg_likes({"review_count": 0, "review_likes": 0}) == 0.0
+    # 집계 필드가 채워지기 전의 문서
+    assert avg_likes({"review_count": 3}) is None
+
+def test_to_response_adds_avg_likes_only_when_projected():
+    liquor_id = ObjectId()
+    doc = to_response({"_id": liquor_id, "review_count": 4, "review_likes": 6, "min_price": 1000, "max_price": 3000})
+    assert doc["id"] == str(liquor_id)
+    assert doc["avg_likes"] == 1.5
+    assert (doc["min_price"], doc["max_price"]) == (1000, 3000)
+    assert "avg_likes" not in to_response({"_id": liquor_id, "name": "참이슬"})
+
+def test_fetch_by_ids_keeps_request_order_and_marks_missing(fake_db):
+    first, second, missing = ObjectId(), ObjectId(), ObjectId()
+    collection = fake_db[LIQUOR_COLLECTION]
+    collection.docs = [{"_id": first, "name": "참이슬"}, {"_id": second, "name": "발렌타인"}]
+
+    result = asyncio.run(fetch_by_ids(collection, f"{second}, {missing},bad-id,{first},{second}", {"name": 1}))
+
+    assert result == [
+        {"id": str(second), "name": "발렌타인"},
+        {"id": str(missing), "not_found": True},
+        {"id": "bad-id", "not_found": True},
+        {"id": str(first), "name": "참이슬"},
+        {"id": str(second), "name": "발렌타인"},
+    ]
+    # 중복과 잘못된 ID를 빼고 한 번만 조회
+    assert len(collection.queries) == 1
+    assert sorted(collection.queries[0]["_id"]["$in"]) == sorted([first, second, missing])
+
+def test_fetch_by_ids_limits_batch_size(fake_db):
+    collection = fake_db[LIQUOR_COLLECTION]
+    ids = ",".join(str(ObjectId()) for _ in range(MAX_BATCH_IDS + 1))
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(fetch_by_ids(collection, ids, {}))
+    assert error.value.status_code == 400
+    assert collection.queries == []
@@ -0,0 +1,27 @@
+from app.utils.metrics import Counter, Histogram, MetricsMiddleware
+
+def test_histogram_renders_cumulative_buckets():
+    histogram = Histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+    histogram.observe(0.05, "/a")
+    histogram.observe(0.5, "/a")
+    histogram.observe(3.0, "/a")
+
+    lines = histogram.render()
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{route="/a",le="1.0"} 2' in lines
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 3' in lines
+    assert 'latency_seconds_count{route="/a"} 3' in lines
+
+def test_counter_escapes_label_values():
+    counter = Counter("requests_total", "Requests.", ("route",))
+    counter.inc('say "hi"')
+    assert counter.render()[-1] == 'requests_total{route="say \\"hi\\""} 1'
+
+def test_route_template_replaces_path_params():
+    scope = {
+        "path": "/api/liquors/abc/reviews/def",
+        "endpoint": object(),
+        "path_params": {"liquor_id": "abc", "review_id": "def"},
+    }
+    assert MetricsMiddleware.route_template(scope) == "/api/liquors/{liquor_id}/reviews/{review_id}"
+    assert MetricsMiddleware.route_template({"path": "/nope"}) == "unmatched"
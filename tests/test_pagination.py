@@ -0,0 +1,81 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from bson import ObjectId
+from fastapi import HTTPException
+
+from app.database import REVIEW_COLLECTION
+from app.routers.review import REVIEW_SORTS
+from app.utils.pagination import and_query, decode_cursor, encode_cursor, fetch_page, keyset_filter, reverse_sort
+
+SORT = [("updated_at", 1), ("_id", 1)]
+
+def test_cursor_round_trips_sort_values():
+    doc = {"_id": ObjectId(), "updated_at": datetime(2024, 5, 1, 12, 30, 15, 123000), "name": "ignored"}
+    token = encode_cursor(doc, SORT)
+
+    # URL에 그대로 쓸 수 있는 불투명한 토큰
+    assert "=" not in token and "/" not in token and "+" not in token
+    assert decode_cursor(token, SORT) == [doc["updated_at"], doc["_id"]]
+
+def test_cursor_round_trips_missing_and_numeric_values():
+    sort = [("likes", -1), ("updated_at", -1), ("_id", 1)]
+    doc = {"_id": ObjectId(), "likes": 7}
+    assert decode_cursor(encode_cursor(doc, sort), sort) == [7, None, doc["_id"]]
+
+@pytest.mark.parametrize("token", ["not base64!", "bm90IGpzb24", "e30", "WzFd"])
+def test_decode_cursor_rejects_invalid_tokens(token):
+    # 잘못된 base64, JSON이 아닌 값, 리스트가 아닌 값, 정렬 키 수가 다른 값
+    with pytest.raises(HTTPException) as error:
+        decode_cursor(token, SORT)
+    assert error.value.status_code == 400
+
+def test_keyset_filter_expands_tuple_comparison():
+    values = [datetime(2024, 1, 1), ObjectId()]
+    assert keyset_filter(SORT, values) == {"$or": [
+        {"updated_at": {"$gt": values[0]}},
+        {"updated_at": values[0], "_id": {"$gt": values[1]}},
+    ]}
+    assert keyset_filter(SORT, values, backward=True)["$or"][1] == {"updated_at": values[0], "_id": {"$lt": values[1]}}
+    assert reverse_sort(SORT) == [("updated_at", -1), ("_id", -1)]
+
+def test_and_query_drops_empty_conditions():
+    assert and_query({}, {}) == {}
+    assert and_query({"type": "진"}, {}) == {"type": "진"}
+    assert and_query({"type": "진"}, {"rating": 4}) == {"$and": [{"type": "진"}, {"rating": 4}]}
+
+def test_fetch_page_walks_reviews_with_ties_in_both_directions(fake_db):
+    liquor_id, other = ObjectId(), ObjectId()
+    start = datetime(2024, 1, 1)
+    # 좋아요 수와 수정 시각이 겹치는 리뷰 (_id로 순서가 정해진다)
+    docs = [
+        {"_id": ObjectId(), "liquor_id": liquor_id, "likes": i % 3, "updated_at": start + timedelta(minutes=i % 2)}
+        for i in range(11)
+    ] + [{"_id": ObjectId(), "liquor_id": other, "likes": 9, "updated_at": start}]
+    collection = fake_db[REVIEW_COLLECTION]
+    collection.docs = docs
+    sort = REVIEW_SORTS["likes"]
+
+    async def walk():
+        pages, cursor = [], None
+        while True:
+            page, next_cursor, prev_cursor = await fetch_page(collection, {"liquor_id": liquor_id}, sort, 4, cursor=cursor)
+            pages.append((page, prev_cursor))
+            if next_cursor is None:
+                return pages
+            cursor = next_cursor
+
+    pages = asyncio.run(walk())
+    ids = [doc["_id"] for page, _ in pages for doc in page]
+    expected = collection.find({"liquor_id": liquor_id}).sort(sort).docs
+    assert ids == [doc["_id"] for doc in expected]
+    assert [len(page) for page, _ in pages] == [4, 4, 3]
+    assert pages[0][1] is None
+
+    # 마지막 페이지의 이전 커서로 돌아가면 가운데 페이지가 같은 순서로 나온다
+    page, next_cursor, prev_cursor = asyncio.run(
+        fetch_page(collection, {"liquor_id": liquor_id}, sort, 4, cursor=pages[2][1], backward=True)
+    )
+    assert page == pages[1][0]
+    assert next_cursor is not None and prev_cursor is not None
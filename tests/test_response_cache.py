@@ -0,0 +1,42 @@
+import asyncio
+from app.utils.response_cache import CachedResponse, InMemoryCacheBackend, ResponseCache, CACHE_RULES
+
+def _response(body: bytes) -> CachedResponse:
+    return CachedResponse(body=body, headers=[], etag='"x"')
+
+def test_in_memory_backend_evicts_least_recently_used():
+    async def run():
+        backend = InMemoryCacheBackend(max_entries=2)
+        await backend.set("a", _response(b"a"), 60, ["liquors"])
+        await backend.set("b", _response(b"b"), 60, ["liquors"])
+        await backend.get("a")
+        await backend.set("c", _response(b"c"), 60, ["liquors"])
+
+        # 가장 오래 사용되지 않은 b가 제거된다
+        assert await backend.get("b") is None
+        assert (await backend.get("a")).body == b"a"
+        assert backend.evictions == 1
+
+    asyncio.run(run())
+
+def test_in_memory_backend_expires_and_invalidates_by_tag():
+    async def run():
+        backend = InMemoryCacheBackend(max_entries=10)
+        await backend.set("expired", _response(b"x"), -1, ["liquors"])
+        await backend.set("detail", _response(b"d"), 60, ["liquor:1"])
+        await backend.set("list", _response(b"l"), 60, ["liquors"])
+
+        assert await backend.get("expired") is None
+        assert await backend.invalidate_tags(["liquor:1"]) == 1
+        assert await backend.get("detail") is None
+        assert await backend.get("list") is not None
+
+    asyncio.run(run())
+
+def test_response_cache_normalizes_query_and_matches_rules():
+    cache = ResponseCache(InMemoryCacheBackend(10), 30, CACHE_RULES)
+
+    assert cache.key("/api/liquors", b"limit=5&fields=name") == cache.key("/api/liquors", b"fields=name&limit=5")
+    assert cache.match("/api/liquors") == "liquors"
+    assert cache.match("/api/liquors/65f1c0ffee0000000000abcd/reviews") == "liquor:65f1c0ffee0000000000abcd"
+    assert cache.match("/api/liquors/65f1c0ffee0000000000abcd/image") is None
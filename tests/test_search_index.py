@@ -0,0 +1,126 @@
+import asyncio
+from datetime import datetime
+
+from bson import ObjectId
+
+from app.database import LIQUOR_COLLECTION, REVIEW_COLLECTION
+from app.routers.search import SNIPPET_SCAN_REVIEWS, review_snippets
+from app.utils.search_index import FIELD_WEIGHTS, SearchIndex, tokenize, highlight
+
+def test_tokenize_splits_words_into_bigrams():
+    assert tokenize("발렌타인 17") == ["발렌", "렌타", "타인", "17"]
+    assert tokenize("Gin") == ["gi", "in"]
+    assert tokenize("술") == ["술"]
+
+def test_search_ranks_name_matches_and_tracks_review_updates():
+    index = SearchIndex()
+    whisky, soju = ObjectId(), ObjectId()
+    index.add_liquor(whisky, "스모키 위스키", "피트향")
+    index.add_liquor(soju, "참이슬", "위스키 대신 마시기 좋은 소주")
+
+    total, hits = index.search("위스키", limit=10)
+    assert total == 2
+    # 이름에 일치하는 주류가 설명에만 일치하는 주류보다 앞선다
+    assert [liquor_id for liquor_id, _ in hits] == [whisky, soju]
+
+    index.add_review(soju, "삼겹살과 잘 어울림")
+    assert index.search("삼겹살", limit=10)[0] == 1
+    index.add_review(soju, "회와 잘 어울림", previous="삼겹살과 잘 어울림")
+    assert index.search("삼겹살", limit=10)[0] == 0
+
+    index.remove_liquor(soju)
+    assert index.search("위스키", limit=10)[0] == 1
+    assert index.search("어울림", limit=10)[0] == 0
+
+def test_single_character_query_matches_longer_words():
+    index = SearchIndex()
+    makgeolli, soju = ObjectId(), ObjectId()
+    index.add_liquor(makgeolli, "생막걸리", None)
+    index.add_liquor(soju, "참이슬", None)
+    index.add_review(soju, "좋은 술이에요")
+
+    assert [liquor_id for liquor_id, _ in index.search("술", limit=10)[1]] == [soju]
+    assert [liquor_id for liquor_id, _ in index.search("리", limit=10)[1]] == [makgeolli]
+
+    # 토큰이 빠지면 글자 목록에서도 빠진다
+    index.remove_review(soju, "좋은 술이에요")
+    assert index.search("술", limit=10)[0] == 0
+    assert "술" not in index._by_char
+
+def test_highlight_marks_matches_and_escapes_html():
+    tokens = set(tokenize("위스키"))
+    assert highlight("<b>위스키</b>", tokens) == "&lt;b&gt;<em>위스키</em>&lt;/b&gt;"
+    assert highlight("소주", tokens) is None
+
+def test_highlight_marks_single_character_token_at_end_of_text():
+    assert highlight("전통 술", {"술"}) == "전통 <em>술</em>"
+    assert highlight("막걸리", {"리"}) == "막걸<em>리</em>"
+
+def test_sync_reindexes_changed_liquors_once(fake_db):
+    whisky, soju, gin = ObjectId(), ObjectId(), ObjectId()
+    now = datetime.utcnow()
+    liquors = [
+        {"_id": whisky, "name": "스모키 위스키", "updated_at": now, "review_count": 0},
+        {"_id": soju, "name": "참이슬", "updated_at": now, "review_count": 1},
+    ]
+    reviews = [{"_id": ObjectId(), "liquor_id": soju, "content": "삼겹살과 잘 어울림", "updated_at": now}]
+    fake_db[LIQUOR_COLLECTION].docs = liquors
+    fake_db[REVIEW_COLLECTION].docs = reviews
+    index = SearchIndex(interval=60)
+    find_reviews = fake_db[REVIEW_COLLECTION].find
+
+    def find_and_write(query, *args, **kwargs):
+        cursor = find_reviews(query, *args, **kwargs)
+        if "liquor_id" in query and index.loaded and len(reviews) == 1:
+            # 다시 색인하려고 리뷰를 읽는 사이 이 워커에서 리뷰 작성
+            liquors[0]["review_count"] = 2
+            reviews.append({"_id": ObjectId(), "liquor_id": whisky, "content": "피트향 가득", "updated_at": now})
+            index.on_review_write(whisky, "피트향 가득")
+        return cursor
+
+    fake_db[REVIEW_COLLECTION].find = find_and_write
+
+    async def scenario():
+        await index.ensure_loaded()
+        assert index.search("삼겹살", limit=10)[0] == 1
+
+        # 다른 워커에서 주류 추가/삭제, 리뷰 수정
+        liquors[:] = [
+            {"_id": whisky, "name": "스모키 위스키", "updated_at": now, "review_count": 1},
+            {"_id": gin, "name": "드라이 진", "updated_at": now, "review_count": 0},
+        ]
+        reviews[:] = [{"_id": ObjectId(), "liquor_id": whisky, "content": "삼겹살과 먹었어요", "updated_at": datetime.utcnow()}]
+        await index.ensure_loaded()
+        assert index.search("참이슬", limit=10)[0] == 1
+
+        read = len(fake_db[LIQUOR_COLLECTION].queries)
+        index._synced_at -= 61
+        await index.ensure_loaded()
+        await index._sync_task
+        return fake_db[LIQUOR_COLLECTION].queries[read + 1:]
+
+    queries = asyncio.run(scenario())
+    # 바뀐 주류만 다시 읽는다
+    assert {liquor_id for query in queries for liquor_id in query["_id"]["$in"]} == {whisky, gin}
+    assert index.search("참이슬", limit=10)[0] == 0
+    assert index.search("드라이", limit=10)[1][0][0] == gin
+    assert index.search("삼겹살", limit=10)[1][0][0] == whisky
+    # 읽는 중에 바뀐 주류는 다시 읽고, 그 사이의 쓰기는 한 번만 반영된다
+    assert sum(whisky in query["_id"]["$in"] for query in queries) == 2
+    assert index._forward[whisky]["피트"] == FIELD_WEIGHTS["review"]
+    assert index._touched == set()
+
+def test_review_snippets_scan_only_popular_reviews(fake_db):
+    soju, gin = ObjectId(), ObjectId()
+    now = datetime.utcnow()
+    fake_db[REVIEW_COLLECTION].docs = [
+        {"_id": ObjectId(), "liquor_id": soju, "content": "삼겹살과 잘 어울림", "likes": 5, "updated_at": now},
+        {"_id": ObjectId(), "liquor_id": soju, "content": "깔끔해요", "likes": 9, "updated_at": now},
+    ] + [
+        {"_id": ObjectId(), "liquor_id": gin, "content": "향이 좋아요", "likes": 1, "updated_at": now}
+        for _ in range(SNIPPET_SCAN_REVIEWS)
+    ] + [{"_id": ObjectId(), "liquor_id": gin, "content": "삼겹살", "likes": 0, "updated_at": now}]
+
+    snippets = asyncio.run(review_snippets(fake_db, [soju, gin], set(tokenize("삼겹살"))))
+    # 인기 리뷰 SNIPPET_SCAN_REVIEWS개 밖의 리뷰는 읽지 않는다
+    assert snippets == {soju: "<em>삼겹살</em>과 잘 어울림"}
@@ -0,0 +1,100 @@
+import asyncio
+import time
+
+from app.utils import text_filter
+from app.utils.keyword_matcher import KeywordMatcher
+from app.utils.text_filter import build_filter_matcher, normalize_text
+
+def test_keyword_matcher_finds_overlapping_words():
+    matcher = KeywordMatcher(
+        {"profanity": {"욕설", "he"}, "ad": {"she", "hers", "광고"}},
+        categories=("profanity", "ad"),
+    )
+
+    # 접미사가 겹치는 키워드도 실패 링크를 통해 찾아야 한다
+    assert matcher.match("ushers") == "profanity"
+    assert matcher.match("이건 광고입니다") == "ad"
+    assert matcher.match("좋은 위스키네요") is None
+    assert matcher.size == 5
+
+def test_keyword_matcher_prefers_higher_priority_category():
+    matcher = KeywordMatcher(
+        {"profanity": {"욕설"}, "ad": {"광고"}},
+        categories=("profanity", "ad"),
+    )
+
+    # 광고가 먼저 나와도 비속어가 우선한다
+    assert matcher.match("광고 그리고 욕설") == "profanity"
+
+def test_filter_matcher_merges_static_and_db_words():
+    matcher = build_filter_matcher({"새욕설"}, {"새광고"})
+
+    assert matcher.match("비속어1 포함") == "profanity"
+    assert matcher.match("새욕설 포함") == "profanity"
+    assert matcher.match("구매문의 주세요") == "ad"
+    assert matcher.match("새광고 포함") == "ad"
+
+def _validate(text):
+    # DB 없이 정적 목록 매처로 validate_review_text 실행
+    text_filter._matcher = build_filter_matcher(set(), set())
+    text_filter._matcher_loaded_at = time.monotonic()
+    return asyncio.run(text_filter.validate_review_text(text))
+
+def test_validate_review_text_detects_urls_and_phone_numbers():
+    for text in ("naver.com 에서 사세요", "주소는 a.co.kr/item?id=1", "010-1234-5678로 연락", "02 123 4567", "01012345678"):
+        assert _validate(text) == (False, "광고성 내용이 포함되어 있습니다."), text
+
+    # 소수점, 약어, 말줄임표는 URL로 보지 않는다
+    for text in ("4.5점 드립니다", "e.g. 피트향", "맛있어요... 진짜", "1,000원 저렴해요"):
+        assert _validate(text) == (True, ""), text
+
+    # 비속어는 광고 패턴보다 우선한다
+    assert _validate("비속어1 naver.com")[1] == "비속어가 포함되어 있습니다."
+
+def test_validate_review_text_runs_in_linear_time_on_adversarial_input():
+    # 이전 정규식은 시작 위치마다 끝까지 읽고 되돌아가서 길이의 제곱에 비례했다
+    adversarial = ["a" * 20000, "1" * 19999 + "!", "a-" * 10000, "a" * 19999 + ".", "1 " * 10000]
+    for text in adversarial:
+        start = time.perf_counter()
+        _validate(text)
+        assert time.perf_counter() - start < 0.5
+
+def test_filter_matcher_catches_obfuscated_variants():
+    matcher = build_filter_matcher({"씨발"}, set())
+
+    # 띄어쓰기, 기호, zero-width 문자, 반복, 자모 분리, 전각 문자
+    for text in ("광 고", "광.고!", "광​고", "광고고고", "ㄱㅘㅇ고", "ｗｗｗ.site"):
+        assert matcher.match(text) == "ad", text
+    assert matcher.match("ㅆㅣ ㅂㅏㄹ") == "profanity"
+
+    # 받침과 다음 글자의 초성이 이어져 보이는 경우는 걸리지 않는다 (사랑이나 -> 라인)
+    assert matcher.match("사랑이나 좋아요") is None
+    # URL 조각 키워드는 문장부호를 유지한 원문에서 찾는다 (.com -> com으로 바뀌지 않음)
+    assert matcher.match("comfortable 해요") is None
+    assert normalize_text("ㄱㅘㅇ고") == normalize_text("광고")
+
+def test_filter_matcher_only_matches_whole_syllables():
+    matcher = build_filter_matcher({"바보"}, set())
+
+    # 받침이 붙은 음절은 받침 없는 단어와 일치하지 않는다 (특가/특강, 광고/광공, 홍보/홍봉, 바보/바복)
+    for text in ("위스키 특강 들었어요", "광공업", "홍봉 양조장", "바복"):
+        assert matcher.match(text) is None, text
+    assert matcher.match("특가 세일") == "ad"
+    assert matcher.match("바보야") == "profanity"
+
+def test_filter_matcher_does_not_join_words_across_boundaries():
+    matcher = build_filter_matcher(set(), set())
+
+    # 여러 글자 단어의 경계에 걸친 키워드는 일치하지 않는다 (특가, 라인, 할인, 광고, 홍보)
+    for text in (
+        "맛이 독특 가격도 착해요",
+        "바닐라 인상",
+        "콜라 인줄 알았어요",
+        "시트러스 향 할 인생 술",
+        "처음 광 고민했는데",
+        "스모키 한 홍 보리차",
+    ):
+        assert matcher.match(text) is None, text
+    # 한 음절 조각끼리는 붙여서 검사한다
+    assert matcher.match("광 고 문 의") == "ad"
+    assert normalize_text("광 고민") == normalize_text("광") + " " + normalize_text("고민")
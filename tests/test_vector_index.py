@@ -0,0 +1,78 @@
+import asyncio
+
+import numpy as np
+from bson import ObjectId
+
+from app.database import LIQUOR_COLLECTION
+from app.models.liquor import PROFILE_FIELDS
+from app.utils.vector_index import ProfileIndex, profile_vector
+
+def _profile(value, **overrides):
+    profile = {field: value for field in PROFILE_FIELDS}
+    profile.update(overrides)
+    return profile
+
+def test_profile_vector_accepts_dict_and_legacy_json():
+    assert profile_vector(_profile(1)).tolist() == [1.0] * len(PROFILE_FIELDS)
+    assert profile_vector('{"smoothness": 1, "aroma": 2, "complexity": 3, "finish": 4, "balance": 5, "intensity": 6}').tolist() == [1, 2, 3, 4, 5, 6]
+    assert profile_vector("not json") is None
+    assert profile_vector({"smoothness": 1}) is None
+
+def test_nearest_returns_closest_profiles_in_order():
+    index = ProfileIndex(interval=0)
+    ids = [ObjectId() for _ in range(5)]
+    for value, liquor_id in enumerate(ids):
+        index.upsert(liquor_id, _profile(value))
+
+    result = index.nearest(np.full(len(PROFILE_FIELDS), 1.2, dtype=np.float32), 3)
+    assert [liquor_id for liquor_id, _ in result] == [ids[1], ids[2], ids[0]]
+    assert result[0][1] < result[1][1] < result[2][1]
+
+    # 기준 주류 제외, k가 남은 수보다 크면 전부
+    result = index.nearest(index.vector(ids[0]), 10, exclude=ids[0])
+    assert [liquor_id for liquor_id, _ in result] == ids[1:]
+
+def test_remove_keeps_rows_contiguous():
+    index = ProfileIndex(interval=0)
+    ids = [ObjectId() for _ in range(3)]
+    for value, liquor_id in enumerate(ids):
+        index.upsert(liquor_id, _profile(value))
+
+    index.remove(ids[0])
+    # 프로필이 잘못되면 인덱스에서 빠진다
+    index.upsert(ids[1], {"smoothness": "bad"})
+
+    assert len(index) == 1
+    assert index.vector(ids[2]).tolist() == [2.0] * len(PROFILE_FIELDS)
+    assert index.nearest(np.zeros(len(PROFILE_FIELDS), dtype=np.float32), 5)[0][0] == ids[2]
+
+def test_sync_keeps_profiles_written_during_sync(fake_db):
+    first, second, third = ObjectId(), ObjectId(), ObjectId()
+    docs = [{"_id": first, "profile": _profile(1)}, {"_id": second, "profile": _profile(2)}]
+    fake_db[LIQUOR_COLLECTION].docs = docs
+    index = ProfileIndex(interval=60)
+    find = fake_db[LIQUOR_COLLECTION].find
+
+    def find_and_write(*args, **kwargs):
+        cursor = find(*args, **kwargs)
+        if index.loaded:
+            # 읽는 사이 이 워커에서 first를 수정 (읽은 문서에는 이전 프로필이 들어 있음)
+            index.on_write(first, _profile(5))
+        return cursor
+
+    fake_db[LIQUOR_COLLECTION].find = find_and_write
+
+    async def scenario():
+        await index.ensure_loaded()
+        assert len(index) == 2
+
+        # 다른 워커에서 주류가 추가/삭제됨
+        docs[:] = [{"_id": first, "profile": _profile(1)}, {"_id": third, "profile": _profile(3)}]
+        index._synced_at -= 61
+        await index.ensure_loaded()
+        await index._sync_task
+
+    asyncio.run(scenario())
+    assert len(index) == 2
+    assert index.vector(first).tolist() == [5.0] * len(PROFILE_FIELDS)
+    assert index.vector(second) is None and index.vector(third) is not None